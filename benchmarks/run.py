@@ -0,0 +1,189 @@
+"""
+Benchmarks for the Result and run_catching hot paths.
+
+Usage:
+    python benchmarks/run.py                          # print a table
+    python benchmarks/run.py --json baseline.json     # also save the timings
+    python benchmarks/run.py --compare baseline.json  # compare against a saved run
+
+With --compare, the exit status is 1 when any benchmark is slower than the
+baseline by more than --threshold (default 1.20, i.e. 20%), so the script can
+gate CI jobs. Timings are the best of --repeat runs, in nanoseconds per operation;
+memory is measured with tracemalloc, in bytes per instance; import times are
+measured in fresh interpreters, in microseconds.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from kotresult import Pipeline, Result, run_catching  # noqa: E402
+
+SUCCESS = Result.success(42)
+FAILURE = Result.failure(ValueError("error"))
+OTHER_FAILURE = Result.failure(ValueError("error"))
+
+
+def _identity(x):
+    return x
+
+
+def _increment(x):
+    return x + 1
+
+
+def _raise(*args):
+    raise ValueError("error")
+
+
+def _zero(e):
+    return 0
+
+
+# The same steps run eagerly, lazily and through a Pipeline built once
+STEPS = {"f": _increment, "z": _zero}
+CHAIN = "r.map(f).map_catching(f).recover(z)"
+LAZY_CHAIN = "r.lazy().map(f).map_catching(f).recover(z).evaluate()"
+LONG_CHAIN = "r.map(f).map(f).map_catching(f).map(f).map(f).recover(z)"
+LONG_LAZY_CHAIN = "r.lazy().map(f).map(f).map_catching(f).map(f).map(f).recover(z).evaluate()"
+PIPELINE = Pipeline().map(_increment).map_catching(_increment).recover(_zero)
+
+
+# name -> (statement, setup globals)
+BENCHMARKS = {
+    "success()": ("Result.success(42)", {}),
+    "failure()": ("Result.failure(error)", {"error": ValueError("error")}),
+    "is_success": ("r.is_success", {"r": SUCCESS}),
+    "is_failure": ("r.is_failure", {"r": FAILURE}),
+    "map chain": (CHAIN, dict(STEPS, r=SUCCESS)),
+    "map chain (failure)": (CHAIN, dict(STEPS, r=FAILURE)),
+    "lazy chain": (LAZY_CHAIN, dict(STEPS, r=SUCCESS)),
+    "lazy chain (failure)": (LAZY_CHAIN, dict(STEPS, r=FAILURE)),
+    "pipeline": ("p.apply(r)", {"r": SUCCESS, "p": PIPELINE}),
+    "pipeline (failure)": ("p.apply(r)", {"r": FAILURE, "p": PIPELINE}),
+    "map chain (6 steps)": (LONG_CHAIN, dict(STEPS, r=SUCCESS)),
+    "lazy chain (6 steps)": (LONG_LAZY_CHAIN, dict(STEPS, r=SUCCESS)),
+    "fold": ("r.fold(f, z)", {"r": SUCCESS, "f": _identity, "z": _zero}),
+    "get_or_default": ("r.get_or_default(0)", {"r": FAILURE}),
+    "__eq__ (success)": ("a == b", {"a": SUCCESS, "b": Result.success(42)}),
+    "__eq__ (failure)": ("a == b", {"a": FAILURE, "b": OTHER_FAILURE}),
+    "hash (success)": ("hash(r)", {"r": SUCCESS}),
+    "hash (failure)": ("hash(r)", {"r": FAILURE}),
+    "run_catching (success)": ("run_catching(f, 1)", {"f": _identity}),
+    "run_catching (raise)": ("run_catching(f, 1)", {"f": _raise}),
+}
+
+MEMORY_BENCHMARKS = {
+    "success bytes/instance": lambda i: Result.success(i),
+    "failure bytes/instance": lambda i, error=ValueError("error"): Result.failure(error),
+}
+
+# Statements timed in a fresh interpreter
+IMPORT_BENCHMARKS = {
+    "import kotresult": "import kotresult",
+    "import kotresult (all subsystems)": "from kotresult import *",
+}
+
+_IMPORT_TIMER = "import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)"
+
+
+def measure_time(statement, namespace, number, repeat):
+    namespace = dict(namespace, Result=Result, run_catching=run_catching)
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def measure_memory(factory, count=100_000):
+    keys = list(range(count))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in keys]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    container = sys.getsizeof(instances)
+    del instances
+    return (after - before - container) / count
+
+
+def measure_import(statement, repeat):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_TIMER.format(statement)],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        timings.append(float(output) * 1e6)
+    return min(timings)
+
+
+def run(number, repeat, pattern):
+    results = {}
+    for name, (statement, namespace) in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure_time(statement, namespace, number, repeat)
+    for name, factory in MEMORY_BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure_memory(factory)
+    for name, statement in IMPORT_BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure_import(statement, repeat)
+    return results
+
+
+def report(results, baseline, threshold):
+    regressions = []
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        unit = "B" if name.endswith("bytes/instance") else "us" if name.startswith("import") else "ns"
+        line = f"{name:<{width}}  {value:10.1f} {unit}"
+        if baseline is not None and name in baseline:
+            ratio = value / baseline[name] if baseline[name] else 1.0
+            line += f"  {baseline[name]:10.1f} {unit}  x{ratio:.2f}"
+            if ratio > threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100_000, help="operations per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark; the best is kept")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", type=Path, help="compare against results previously written with --json")
+    parser.add_argument("--threshold", type=float, default=1.20, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    print(f"{platform.python_implementation()} {platform.python_version()} on {platform.platform()}")
+    results = run(args.number, args.repeat, args.filter)
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else None
+    regressions = report(results, baseline, args.threshold)
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "results": results,
+        }, indent=2))
+    if regressions:
+        print(f"{len(regressions)} regression(s) above x{args.threshold:.2f}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Multi-core scaling of the Result and run_catching hot paths.
+
+Usage:
+    python benchmarks/scaling.py                          # 1, 2, 4, ... threads up to the CPU count
+    python benchmarks/scaling.py --threads 1 2 4 8 16     # chosen thread counts
+    python benchmarks/scaling.py --json scaling.json      # also save the figures
+
+Every thread of a run performs --number operations of the workload, all threads
+being released at once. Throughput is the total number of operations per second
+of the best of --repeat runs; speedup is relative to the one-thread run. On a
+standard build the GIL keeps the speedup at about 1x. On a free-threaded build
+(e.g. python3.13t) it should grow with the thread count until the cores run out:
+a speedup that stops growing early points at shared state serialising the threads.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from kotresult import MetricsAggregator, Result, add_observer, remove_observer, run_catching  # noqa: E402
+
+SUCCESS = Result.success(42)
+FAILURE = Result.failure(ValueError("error"))
+OTHER_FAILURE = Result.failure(ValueError("error"))
+
+
+def _identity(x):
+    return x
+
+
+def _increment(x):
+    return x + 1
+
+
+def _raise(*args):
+    raise ValueError("error")
+
+
+def _zero(e):
+    return 0
+
+
+def _run_catching(number):
+    for _ in range(number):
+        run_catching(_identity, 1)
+
+
+def _run_catching_raise(number):
+    for _ in range(number):
+        run_catching(_raise, 1)
+
+
+def _map_chain(number):
+    for _ in range(number):
+        SUCCESS.map(_increment).map_catching(_increment).recover(_zero)
+
+
+def _shared_failure(number):
+    # Every thread compares and hashes the very same failure objects
+    for _ in range(number):
+        hash(FAILURE)
+        FAILURE == OTHER_FAILURE
+
+
+# name -> function running the given number of operations
+WORKLOADS = {
+    "run_catching (success)": _run_catching,
+    "run_catching (raise)": _run_catching_raise,
+    "map chain": _map_chain,
+    "shared failure hash/eq": _shared_failure,
+}
+
+# Workloads run with a MetricsAggregator registered, whose lock is shared by all threads
+OBSERVED_WORKLOADS = {
+    "run_catching (observed)": _run_catching,
+}
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def measure_throughput(workload, threads, number, repeat):
+    best = None
+    for _ in range(repeat):
+        # The main thread is the last party, so the clock starts once every worker is ready
+        barrier = threading.Barrier(threads + 1)
+
+        def work():
+            barrier.wait()
+            workload(number)
+
+        workers = [threading.Thread(target=work) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return threads * number / best
+
+
+def default_thread_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run(thread_counts, number, repeat, pattern):
+    results = {}
+    for observed, workloads in ((False, WORKLOADS), (True, OBSERVED_WORKLOADS)):
+        for name, workload in workloads.items():
+            if pattern and pattern not in name:
+                continue
+            metrics = MetricsAggregator()
+            if observed:
+                add_observer(metrics)
+            try:
+                results[name] = {
+                    threads: measure_throughput(workload, threads, number, repeat) for threads in thread_counts
+                }
+            finally:
+                if observed:
+                    remove_observer(metrics)
+    return results
+
+
+def report(results):
+    width = max(len(name) for name in results)
+    for name, throughputs in results.items():
+        single = throughputs[min(throughputs)]
+        for threads, throughput in throughputs.items():
+            print(f"{name:<{width}}  {threads:3d} threads  {throughput / 1e6:8.2f} Mops/s  x{throughput / single:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", help="thread counts to run, default 1, 2, 4, ... CPUs")
+    parser.add_argument("--number", type=int, default=20_000, help="operations per thread and run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per thread count; the best is kept")
+    parser.add_argument("--filter", default="", help="only run workloads whose name contains this text")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    thread_counts = sorted(set(args.threads or default_thread_counts()))
+    print(f"{platform.python_implementation()} {platform.python_version()} on {platform.platform()}, "
+          f"{os.cpu_count()} CPUs, GIL {'enabled' if gil_enabled() else 'disabled'}")
+    results = run(thread_counts, args.number, args.repeat, args.filter)
+    report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "gil_enabled": gil_enabled(),
+            "cpus": os.cpu_count(),
+            "results": results,
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
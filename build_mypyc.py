@@ -0,0 +1,30 @@
+"""
+Compile the core modules of kotresult with mypyc, next to their sources.
+
+    pip install mypy setuptools
+    python build_mypyc.py
+
+The import system then loads the extension modules instead of the .py files, and
+kotresult.COMPILED reports True. Deleting the built kotresult/*.so (*.pyd on
+Windows) files, or setting the KOTRESULT_PURE_PYTHON environment variable, goes
+back to the pure-Python build.
+"""
+from mypyc.build import mypycify
+from setuptools import Distribution
+
+# Keep in sync with kotresult._native.NATIVE_MODULES
+MODULES = ('result', 'run_catching')
+
+
+def main() -> None:
+    # Only the compiled modules have to type check; the modules they import stay interpreted
+    extensions = mypycify(['--follow-imports=silent'] + [f'kotresult/{name}.py' for name in MODULES])
+    # A bare Distribution builds the extensions without reading the packaging metadata
+    distribution = Distribution({'name': 'kotresult', 'ext_modules': extensions})
+    build_ext = distribution.get_command_obj('build_ext')
+    build_ext.inplace = True
+    distribution.run_command('build_ext')
+
+
+if __name__ == '__main__':
+    main()
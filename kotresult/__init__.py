@@ -1,11 +1,179 @@
-from .result import Result
+# The core is imported eagerly; it does not import typing, asyncio or concurrent.futures.
+from ._native import COMPILED
+from .capture import (
+    FailureInfo,
+    capture_options,
+    exception_matches,
+    get_capture_options,
+    set_capture_options,
+    trim_traceback,
+)
+from .observers import add_observer, clear_observers, remove_observer
+from .result import FAILURE_EQUALITY_POLICIES, Result, get_failure_equality, set_failure_equality
 from .run_catching import run_catching, run_catching_with
 
-__all__ = ['Result', 'run_catching', 'run_catching_with']
+# The other subsystems are imported on first access (PEP 562), so that programs
+# only pay the import time of what they use: name -> submodule
+_LAZY_ATTRIBUTES = {
+    'gather_results': 'aio',
+    'run_catching_async': 'aio',
+    'ResultBatch': 'batch',
+    'CacheInfo': 'cache',
+    'cached_catching': 'cache',
+    'CircuitBreaker': 'circuit_breaker',
+    'CircuitOpenError': 'circuit_breaker',
+    'ExceptionRegistry': 'codec',
+    'decode_results': 'codec',
+    'dump_results': 'codec',
+    'dump_results_json': 'codec',
+    'encode_results': 'codec',
+    'load_results': 'codec',
+    'load_results_json': 'codec',
+    'register_exception': 'codec',
+    'sequence': 'combinators',
+    'traverse': 'combinators',
+    'zip_results': 'combinators',
+    'run_catching_first': 'hedge',
+    'run_catching_first_async': 'hedge',
+    'LazyResult': 'lazy',
+    'Pipeline': 'lazy',
+    'Bulkhead': 'limiter',
+    'RateLimiter': 'limiter',
+    'RejectedError': 'limiter',
+    'AsyncBatchLoader': 'loader',
+    'BatchLoader': 'loader',
+    'MetricsAggregator': 'metrics',
+    'WorkerError': 'parallel',
+    'run_catching_map': 'parallel',
+    'RetryOutcome': 'retry',
+    'run_catching_retry': 'retry',
+    'run_catching_retry_async': 'retry',
+    'AsyncWorkPipeline': 'scheduler',
+    'DeadLetter': 'scheduler',
+    'StageStats': 'scheduler',
+    'WorkPipeline': 'scheduler',
+    'AsyncSingleFlight': 'singleflight',
+    'SingleFlight': 'singleflight',
+    'ResultStream': 'stream',
+    'deadline': 'timeout',
+    'remaining_time': 'timeout',
+    'run_catching_timeout': 'timeout',
+    'run_catching_timeout_async': 'timeout',
+    'shared_executor': 'timeout',
+}
 
-# Version will be dynamically set by poetry-dynamic-versioning
-try:
-    from ._version import __version__
-except ImportError:
-    # Fallback for development
-    __version__ = '0.0.0'
+# Type checkers do not follow __getattr__, so the lazy names are imported for them here
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .aio import gather_results, run_catching_async
+    from .batch import ResultBatch
+    from .cache import CacheInfo, cached_catching
+    from .circuit_breaker import CircuitBreaker, CircuitOpenError
+    from .codec import (
+        ExceptionRegistry,
+        decode_results,
+        dump_results,
+        dump_results_json,
+        encode_results,
+        load_results,
+        load_results_json,
+        register_exception,
+    )
+    from .combinators import sequence, traverse, zip_results
+    from .hedge import run_catching_first, run_catching_first_async
+    from .lazy import LazyResult, Pipeline
+    from .limiter import Bulkhead, RateLimiter, RejectedError
+    from .loader import AsyncBatchLoader, BatchLoader
+    from .metrics import MetricsAggregator
+    from .parallel import WorkerError, run_catching_map
+    from .retry import RetryOutcome, run_catching_retry, run_catching_retry_async
+    from .scheduler import AsyncWorkPipeline, DeadLetter, StageStats, WorkPipeline
+    from .singleflight import AsyncSingleFlight, SingleFlight
+    from .stream import ResultStream
+    from .timeout import deadline, remaining_time, run_catching_timeout, run_catching_timeout_async, shared_executor
+
+__all__ = [
+    'AsyncBatchLoader',
+    'AsyncSingleFlight',
+    'AsyncWorkPipeline',
+    'BatchLoader',
+    'Bulkhead',
+    'COMPILED',
+    'CacheInfo',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'DeadLetter',
+    'ExceptionRegistry',
+    'FAILURE_EQUALITY_POLICIES',
+    'FailureInfo',
+    'LazyResult',
+    'MetricsAggregator',
+    'Pipeline',
+    'RateLimiter',
+    'RejectedError',
+    'Result',
+    'ResultBatch',
+    'ResultStream',
+    'RetryOutcome',
+    'SingleFlight',
+    'StageStats',
+    'WorkPipeline',
+    'WorkerError',
+    'add_observer',
+    'cached_catching',
+    'capture_options',
+    'clear_observers',
+    'deadline',
+    'decode_results',
+    'dump_results',
+    'dump_results_json',
+    'encode_results',
+    'exception_matches',
+    'gather_results',
+    'get_capture_options',
+    'get_failure_equality',
+    'load_results',
+    'load_results_json',
+    'register_exception',
+    'remaining_time',
+    'remove_observer',
+    'run_catching',
+    'run_catching_async',
+    'run_catching_first',
+    'run_catching_first_async',
+    'run_catching_map',
+    'run_catching_retry',
+    'run_catching_retry_async',
+    'run_catching_timeout',
+    'run_catching_timeout_async',
+    'run_catching_with',
+    'sequence',
+    'set_capture_options',
+    'set_failure_equality',
+    'shared_executor',
+    'traverse',
+    'trim_traceback',
+    'zip_results',
+]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        from importlib import import_module
+        value = getattr(import_module(f'{__name__}.{module}'), name)
+    elif name == '__version__':
+        # Version will be dynamically set by poetry-dynamic-versioning
+        try:
+            from ._version import __version__ as value
+        except ImportError:
+            # Fallback for development
+            value = '0.0.0'
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {'__version__'})
@@ -0,0 +1,50 @@
+import sys
+from types import GenericAlias
+
+__all__ = ['BaseExceptionGroup', 'ExceptionGroup', 'Generic']
+
+
+class _BaseExceptionGroup(BaseException):
+    """Minimal stand-in for the builtin BaseExceptionGroup of Python 3.11+"""
+
+    def __new__(cls, message, exceptions):
+        if cls is _BaseExceptionGroup and all(isinstance(e, Exception) for e in exceptions):
+            cls = _ExceptionGroup
+        return super().__new__(cls, message, exceptions)
+
+    def __init__(self, message, exceptions):
+        exceptions = tuple(exceptions)
+        if not exceptions:
+            raise ValueError("second argument (exceptions) must be a non-empty sequence")
+        super().__init__(message, exceptions)
+        self.message = message
+        self.exceptions = exceptions
+
+    def __str__(self):
+        count = len(self.exceptions)
+        return "{} ({} sub-exception{})".format(self.message, count, "" if count == 1 else "s")
+
+
+class _ExceptionGroup(_BaseExceptionGroup, Exception):
+    pass
+
+
+if sys.version_info >= (3, 11):
+    BaseExceptionGroup = BaseExceptionGroup
+    ExceptionGroup = ExceptionGroup
+else:
+    try:
+        from exceptiongroup import BaseExceptionGroup, ExceptionGroup
+    except ImportError:
+        BaseExceptionGroup = _BaseExceptionGroup
+        ExceptionGroup = _ExceptionGroup
+
+# Generic classes are typing.Generic subclasses for type checkers, while at runtime
+# a plain __class_getitem__ spares importing typing.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Generic
+else:
+    class Generic:
+        __slots__ = ()
+        __class_getitem__ = classmethod(GenericAlias)
@@ -0,0 +1,40 @@
+import os
+import sys
+
+# The core modules compiled by build_mypyc.py, in import order
+NATIVE_MODULES = ('result', 'run_catching')
+
+
+def _import_sources() -> None:
+    # Executes the .py files directly, as the import system prefers extension modules
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    package = sys.modules[__package__]
+    directory = os.path.dirname(__file__)
+    for name in NATIVE_MODULES:
+        fullname = f'{__package__}.{name}'
+        spec = spec_from_file_location(fullname, os.path.join(directory, f'{name}.py'))
+        module = module_from_spec(spec)
+        sys.modules[fullname] = module
+        spec.loader.exec_module(module)
+        setattr(package, name, module)
+
+
+def _load() -> bool:
+    if not os.environ.get('KOTRESULT_PURE_PYTHON'):
+        try:
+            from kotresult import result, run_catching  # noqa: F401
+        except ImportError:
+            # A broken compiled build, e.g. with its shared mypyc runtime missing:
+            # the modules are all loaded from source, never mixed
+            for name in NATIVE_MODULES:
+                sys.modules.pop(f'{__package__}.{name}', None)
+        else:
+            return not result.__file__.endswith('.py')
+    _import_sources()
+    return False
+
+
+# Whether the core modules were loaded from the mypyc-compiled build. Setting the
+# KOTRESULT_PURE_PYTHON environment variable forces the pure-Python build.
+COMPILED = _load()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from time import perf_counter
+from typing import Callable, List, Optional, TypeVar, Union
+
+from kotresult.capture import capture
+from kotresult.observers import notify, registry
+from kotresult.result import Result
+
+T = TypeVar('T')
+
+
+async def run_catching_async(func: Callable[..., Union[T, Awaitable[T]]], *args, **kwargs) -> Result[T]:
+    """
+    Call func and await its return value if it is awaitable, capturing the outcome as a Result.
+
+    This is the asyncio counterpart of run_catching: it accepts coroutine functions
+    as well as plain callables. asyncio.CancelledError is re-raised rather than
+    captured so that cancelling the surrounding task keeps working.
+
+    Example:
+        result = await run_catching_async(session.get, url)
+    """
+    start = perf_counter() if registry.observers else None
+    try:
+        value = func(*args, **kwargs)
+        if isinstance(value, Awaitable):
+            value = await value
+        result = Result.success(value)
+    except asyncio.CancelledError:
+        raise
+    except BaseException as e:
+        result = Result.failure(capture(e))
+    if start is not None:
+        notify(func, result, perf_counter() - start)
+    return result
+
+
+def _task_result(task: asyncio.Future) -> Result:
+    if task.cancelled():
+        return Result.failure(capture(asyncio.CancelledError()))
+    exception = task.exception()
+    if exception is not None:
+        return Result.failure(capture(exception))
+    return Result.success(task.result())
+
+
+async def gather_results(*aws: Awaitable[T], concurrency: Optional[int] = None) -> List[Result[T]]:
+    """
+    Run awaitables concurrently and return one Result per awaitable, in argument order.
+
+    Unlike asyncio.gather, a failing awaitable never cancels its siblings: every
+    awaitable runs to completion and its outcome is captured. A cancelled awaitable
+    yields a Result.failure(asyncio.CancelledError()). If gather_results itself is
+    cancelled, all the awaitables it still runs are cancelled too.
+
+    Args:
+        *aws: Coroutines, tasks or futures to run
+        concurrency: Maximum number of awaitables running at once. Tasks and futures
+            that are already scheduled are only limited in how many are awaited.
+
+    Example:
+        results = await gather_results(*(fetch(url) for url in urls), concurrency=10)
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if not aws:
+        return []
+    semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    async def run(aw: Awaitable[T]) -> T:
+        if semaphore is None:
+            return await aw
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        await asyncio.wait(tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return [_task_result(task) for task in tasks]
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from kotresult.capture import capture
+from kotresult.result import Result
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("kotresult.arrays requires numpy; install it with 'pip install kotresult[numpy]'") from e
+
+ChunkError = Tuple[slice, BaseException]
+
+
+def _default_fill(dtype: np.dtype) -> Any:
+    if np.issubdtype(dtype, np.floating) or np.issubdtype(dtype, np.complexfloating):
+        return np.nan
+    return 0
+
+
+class ArrayResult:
+    """
+    The outcome of a chunked array computation: a values array plus a boolean failure mask.
+
+    Failures are tracked per chunk rather than per element: every chunk that raised
+    is recorded in errors as a (slice, exception) pair and all of its rows are
+    flagged in failed. The rows of failed chunks in values hold a fill value.
+
+    Attributes:
+        values: The computed array; rows of failed chunks hold the fill value
+        failed: Boolean array, True for every row of a failed chunk
+        errors: List of (slice, exception) pairs, one per failed chunk, in order
+    """
+    __slots__ = ('values', 'failed', 'errors')
+
+    def __init__(self, values: np.ndarray, failed: np.ndarray, errors: List[ChunkError]):
+        self.values = values
+        self.failed = failed
+        self.errors = errors
+
+    @property
+    def all_success(self) -> bool:
+        return not self.errors
+
+    @property
+    def success_count(self) -> int:
+        return len(self.failed) - int(np.count_nonzero(self.failed))
+
+    @property
+    def failure_count(self) -> int:
+        return int(np.count_nonzero(self.failed))
+
+    def successes(self) -> np.ndarray:
+        """Return the rows that were computed successfully"""
+        if not self.errors:
+            return self.values
+        return self.values[~self.failed]
+
+    def failures(self) -> List[BaseException]:
+        """Return the exception of each failed chunk, in order"""
+        return [exception for _, exception in self.errors]
+
+    def to_masked(self) -> np.ma.MaskedArray:
+        """Return the values as a masked array in which failed rows are masked"""
+        mask = self.failed
+        if self.values.ndim > 1:
+            mask = np.broadcast_to(mask.reshape((-1,) + (1,) * (self.values.ndim - 1)), self.values.shape)
+        return np.ma.MaskedArray(self.values, mask=mask)
+
+    def to_result(self) -> Result[np.ndarray]:
+        """Return Result.success(values) if every chunk succeeded, otherwise a failure with the first exception"""
+        if self.errors:
+            return Result.failure(self.errors[0][1])
+        return Result.success(self.values)
+
+    def get_or_throw(self) -> np.ndarray:
+        if self.errors:
+            raise self.errors[0][1]
+        return self.values
+
+    def map(self, transform: Callable[[np.ndarray], np.ndarray]) -> ArrayResult:
+        """
+        Apply a vectorized transform to the successful rows only.
+        The transform is called once with all successful rows and must return as many rows.
+        Exceptions raised by the transform propagate, like Result.map.
+        """
+        if not self.errors:
+            return ArrayResult(np.asarray(transform(self.values)), self.failed, self.errors)
+        ok = ~self.failed
+        mapped = np.asarray(transform(self.values[ok]))
+        values = np.empty((len(self.failed),) + mapped.shape[1:], dtype=mapped.dtype)
+        values[ok] = mapped
+        values[self.failed] = _default_fill(mapped.dtype)
+        return ArrayResult(values, self.failed, self.errors)
+
+    def recover(self, transform: Union[Callable[[BaseException], Any], Any]) -> ArrayResult:
+        """
+        Replace the rows of every failed chunk and clear the failures.
+
+        transform is either a fill value or a callable called once per failed chunk
+        with its exception, returning a value broadcastable to the chunk's rows.
+        """
+        if not self.errors:
+            return self
+        values = self.values.copy()
+        for rows, exception in self.errors:
+            values[rows] = transform(exception) if callable(transform) else transform
+        return ArrayResult(values, np.zeros_like(self.failed), [])
+
+    def __len__(self) -> int:
+        return len(self.failed)
+
+    def __repr__(self) -> str:
+        return f"ArrayResult(size={len(self)}, failed_chunks={len(self.errors)})"
+
+
+def run_catching_array(
+        func: Callable[[np.ndarray], np.ndarray],
+        array: Any,
+        chunksize: Optional[int] = None,
+        errstate: Optional[str] = None,
+        fill_value: Any = None,
+) -> ArrayResult:
+    """
+    Apply a vectorized function to an array chunk by chunk, capturing exceptions per chunk.
+
+    The array is split along its first axis into chunks of chunksize rows (a single
+    chunk by default) and func is called once per chunk. It must return one row per
+    input row. A chunk that raises, or returns the wrong number of rows, is recorded
+    as failed without affecting the other chunks, so a single bad value costs one
+    chunk rather than the whole array, and no Result is allocated per element.
+
+    Args:
+        func: A ufunc or any function mapping a chunk to an array of the same length
+        array: The input data, converted with numpy.asarray
+        chunksize: Rows per chunk, or None to process the array as one chunk
+        errstate: If given, run func under numpy.errstate(all=errstate), e.g. 'raise'
+            to capture overflows, invalid operations and divisions by zero as
+            FloatingPointError failures
+        fill_value: Value stored in the rows of failed chunks. Defaults to NaN for
+            floating point results and 0 otherwise
+
+    Example:
+        result = run_catching_array(np.log, data, chunksize=65536, errstate='raise')
+        clean = result.recover(0.0).values
+    """
+    array = np.asarray(array)
+    length = len(array)
+    if chunksize is None:
+        chunksize = max(length, 1)
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    failed = np.zeros(length, dtype=bool)
+    errors: List[ChunkError] = []
+    outputs: List[Tuple[slice, np.ndarray]] = []
+    for start in range(0, length, chunksize):
+        rows = slice(start, min(start + chunksize, length))
+        try:
+            if errstate is None:
+                output = np.asarray(func(array[rows]))
+            else:
+                with np.errstate(all=errstate):
+                    output = np.asarray(func(array[rows]))
+            if output.ndim == 0 or len(output) != rows.stop - rows.start:
+                raise ValueError(
+                    f"func returned {output.shape} for a chunk of {rows.stop - rows.start} rows")
+        except BaseException as e:
+            failed[rows] = True
+            errors.append((rows, capture(e)))
+        else:
+            outputs.append((rows, output))
+
+    if len(outputs) == 1 and not errors:
+        # A single chunk covering the whole array: its output is the result
+        values = outputs[0][1]
+    elif outputs:
+        first = outputs[0][1]
+        dtype = np.result_type(*(output.dtype for _, output in outputs))
+        values = np.empty((length,) + first.shape[1:], dtype=dtype)
+        for rows, output in outputs:
+            values[rows] = output
+    else:
+        values = np.empty(array.shape, dtype=np.float64)
+    if errors:
+        fill = _default_fill(values.dtype) if fill_value is None else fill_value
+        for rows, _ in errors:
+            values[rows] = fill
+    return ArrayResult(values, failed, errors)
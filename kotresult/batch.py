@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from itertools import compress
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union, overload
+
+from kotresult.capture import capture
+from kotresult.result import Result
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Maps a success flag (1) to a failure flag (0) and vice versa, so the failure
+# mask can be derived with bytes.translate() instead of a Python-level loop.
+_INVERT = bytes([1, 0]) + bytes(254)
+
+
+class ResultBatch(Generic[T]):
+    """
+    A columnar collection of results.
+
+    Values and exceptions are kept in two parallel lists together with a
+    success mask holding one flag byte per element (1 for success, 0 for
+    failure). Bulk operations work on these columns directly, so no Result
+    object is allocated per element unless one is explicitly requested.
+
+    Example:
+        batch = ResultBatch.run_catching(int, ["1", "x", "3"])
+        batch.success_count  # 2
+        batch.map(lambda x: x * 2).successes()  # [2, 6]
+    """
+    __slots__ = ('_values', '_exceptions', '_mask')
+
+    def __init__(
+            self,
+            values: List[Optional[T]],
+            exceptions: List[Optional[BaseException]],
+            mask: bytearray,
+    ):
+        if not len(values) == len(exceptions) == len(mask):
+            raise ValueError("values, exceptions and mask must have the same length")
+        self._values = values
+        self._exceptions = exceptions
+        self._mask = mask
+
+    @staticmethod
+    def of(values: Iterable[T]) -> ResultBatch[T]:
+        """Create a batch in which every element is a success"""
+        values = list(values)
+        return ResultBatch(values, [None] * len(values), bytearray(b'\x01') * len(values))
+
+    @staticmethod
+    def from_results(results: Iterable[Result[T]]) -> ResultBatch[T]:
+        """Create a batch from existing Result objects"""
+        values = []
+        exceptions = []
+        mask = bytearray()
+        for result in results:
+            if result._is_failure:
+                values.append(None)
+                exceptions.append(result._value)
+                mask.append(0)
+            else:
+                values.append(result._value)
+                exceptions.append(None)
+                mask.append(1)
+        return ResultBatch(values, exceptions, mask)
+
+    @staticmethod
+    def run_catching(func: Callable[[R], T], items: Iterable[R]) -> ResultBatch[T]:
+        """
+        Call func on every item, capturing each return value or raised exception.
+        This is the batched equivalent of calling run_catching(func, item) in a loop.
+        """
+        values = []
+        exceptions = []
+        mask = bytearray()
+        for item in items:
+            try:
+                values.append(func(item))
+            except BaseException as e:
+                values.append(None)
+                exceptions.append(capture(e))
+                mask.append(0)
+            else:
+                exceptions.append(None)
+                mask.append(1)
+        return ResultBatch(values, exceptions, mask)
+
+    @property
+    def success_count(self) -> int:
+        return self._mask.count(1)
+
+    @property
+    def failure_count(self) -> int:
+        return self._mask.count(0)
+
+    @property
+    def all_success(self) -> bool:
+        return 0 not in self._mask
+
+    def successes(self) -> List[T]:
+        """Return the values of all successful elements, in order"""
+        return list(compress(self._values, self._mask))
+
+    def failures(self) -> List[BaseException]:
+        """Return the exceptions of all failed elements, in order"""
+        return list(compress(self._exceptions, self._mask.translate(_INVERT)))
+
+    def partition(self) -> Tuple[List[T], List[BaseException]]:
+        """Split the batch into a list of success values and a list of exceptions"""
+        return self.successes(), self.failures()
+
+    def map(self, transform: Callable[[T], R]) -> ResultBatch[R]:
+        # The columns are never mutated once a batch is built, so the
+        # exception column and the mask can be shared with the new batch.
+        if self.all_success:
+            return ResultBatch(list(map(transform, self._values)), self._exceptions, self._mask)
+        values = [transform(value) if flag else None for value, flag in zip(self._values, self._mask)]
+        return ResultBatch(values, self._exceptions, self._mask)
+
+    def map_catching(self, transform: Callable[[T], R]) -> ResultBatch[R]:
+        values = list(self._values)
+        exceptions = list(self._exceptions)
+        mask = bytearray(self._mask)
+        for i, flag in enumerate(self._mask):
+            if flag:
+                try:
+                    values[i] = transform(values[i])
+                except BaseException as e:
+                    values[i] = None
+                    exceptions[i] = capture(e)
+                    mask[i] = 0
+        return ResultBatch(values, exceptions, mask)
+
+    def recover(self, transform: Callable[[BaseException], T]) -> ResultBatch[T]:
+        values = [value if flag else transform(exception)
+                  for value, exception, flag in zip(self._values, self._exceptions, self._mask)]
+        return ResultBatch(values, [None] * len(values), bytearray(b'\x01') * len(values))
+
+    def recover_catching(self, transform: Callable[[BaseException], T]) -> ResultBatch[T]:
+        values = list(self._values)
+        exceptions = list(self._exceptions)
+        mask = bytearray(self._mask)
+        for i, flag in enumerate(self._mask):
+            if not flag:
+                try:
+                    values[i] = transform(exceptions[i])
+                except BaseException as e:
+                    exceptions[i] = capture(e)
+                else:
+                    exceptions[i] = None
+                    mask[i] = 1
+        return ResultBatch(values, exceptions, mask)
+
+    def to_results(self) -> List[Result[T]]:
+        """Materialize the batch as a list of Result objects"""
+        return [Result.success(value) if flag else Result.failure(exception)
+                for value, exception, flag in zip(self._values, self._exceptions, self._mask)]
+
+    # Python special methods
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __iter__(self) -> Iterator[Result[T]]:
+        for value, exception, flag in zip(self._values, self._exceptions, self._mask):
+            yield Result.success(value) if flag else Result.failure(exception)
+
+    @overload
+    def __getitem__(self, index: int) -> Result[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ResultBatch[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Result[T], ResultBatch[T]]:
+        if isinstance(index, slice):
+            return ResultBatch(self._values[index], self._exceptions[index], self._mask[index])
+        if self._mask[index]:
+            return Result.success(self._values[index])
+        return Result.failure(self._exceptions[index])
+
+    def __repr__(self) -> str:
+        return f"ResultBatch(size={len(self)}, successes={self.success_count}, failures={self.failure_count})"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import update_wrapper
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+from kotresult.capture import exception_matches
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+_KWD_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cached_catching cache"""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    if not kwargs:
+        return args
+    return args + (_KWD_MARK,) + tuple(kwargs.items())
+
+
+def cached_catching(
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        cache_failures: bool = True,
+        failure_ttl: Optional[float] = None,
+        thread_safe: bool = True,
+):
+    """
+    Decorator that wraps a function with run_catching and caches the resulting Result by its arguments.
+
+    Entries are evicted in least-recently-used order once maxsize is reached and
+    expire ttl seconds after they were stored. Failures are cached too unless
+    cache_failures is False, and can be given a shorter lifetime with failure_ttl
+    so that negative results are only remembered briefly. Only failures with an
+    Exception are cached: a KeyboardInterrupt or SystemExit is returned without
+    being stored.
+
+    Like functools.lru_cache, arguments must be hashable, the decorator can be
+    used with or without parentheses, and the wrapper exposes cache_info() and
+    cache_clear(). Concurrent misses on the same key each call the function;
+    the cache only guards its own bookkeeping.
+
+    Args:
+        maxsize: Maximum number of entries, or None for an unbounded cache
+        ttl: Lifetime of cached successes in seconds, or None to never expire
+        cache_failures: Whether failure Results are cached
+        failure_ttl: Lifetime of cached failures in seconds. Defaults to ttl
+        thread_safe: Guard the cache with a lock so it can be shared between threads
+
+    Example:
+        @cached_catching(maxsize=1024, ttl=60, failure_ttl=5)
+        def lookup(user_id):
+            ...
+
+        result = lookup(42)  # Result
+        lookup.cache_info()  # CacheInfo(hits=0, misses=1, evictions=0, maxsize=1024, currsize=1)
+    """
+    if callable(maxsize):
+        # Used as @cached_catching without parentheses
+        return cached_catching()(maxsize)
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1 or None")
+    if failure_ttl is None:
+        failure_ttl = ttl
+
+    def decorator(func: Callable[..., T]) -> Callable[..., Result[T]]:
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock() if thread_safe else nullcontext()
+        stats = [0, 0, 0]  # hits, misses, evictions
+
+        def wrapper(*args, **kwargs) -> Result[T]:
+            key = _make_key(args, kwargs)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    result, expires_at = entry
+                    if expires_at is None or time.monotonic() < expires_at:
+                        cache.move_to_end(key)
+                        stats[0] += 1
+                        return result
+                    del cache[key]
+                stats[1] += 1
+
+            result = run_catching(func, *args, **kwargs)
+            if result._is_failure:
+                # A KeyboardInterrupt or SystemExit says nothing about the arguments
+                if not cache_failures or not exception_matches(result._value, Exception):
+                    return result
+                lifetime = failure_ttl
+            else:
+                lifetime = ttl
+
+            expires_at = None if lifetime is None else time.monotonic() + lifetime
+            with lock:
+                cache[key] = (result, expires_at)
+                cache.move_to_end(key)
+                if maxsize is not None:
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+                        stats[2] += 1
+            return result
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(stats[0], stats[1], stats[2], maxsize, len(cache))
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats[:] = [0, 0, 0]
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return update_wrapper(wrapper, func)
+
+    return decorator
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The precise signatures live in capture.pyi so that typing is not imported at runtime.
+
+
+class FailureInfo(Exception):
+    """
+    Lightweight record of an exception: its type, args and where it was raised.
+
+    A FailureInfo holds no traceback, frames or chained exceptions, so failure
+    Results carrying it keep no large object graph alive. It is an exception
+    itself, so it can be stored in Result.failure() and re-raised like any other.
+
+    Attributes:
+        type_name: Qualified name of the original exception type
+        module: Module of the original exception type
+        exception_args: args of the original exception
+        location: "file:line in function" of the innermost frame, or "" if unknown
+        type_names: "module.qualname" of the original exception type and of its base
+            classes, used by matches()
+    """
+
+    def __init__(self, type_name: str, module: str, exception_args: tuple, location: str = ""):
+        super().__init__(type_name, module, exception_args, location)
+        self.type_name = type_name
+        self.module = module
+        self.exception_args = exception_args
+        self.location = location
+        # Only the type itself is known unless built by from_exception()
+        self.type_names: tuple = (f"{module}.{type_name}",)
+
+    @staticmethod
+    def from_exception(exception: BaseException) -> FailureInfo:
+        tb = exception.__traceback__
+        location = ""
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            code = tb.tb_frame.f_code
+            location = f"{code.co_filename}:{tb.tb_lineno} in {code.co_name}"
+        exception_type = type(exception)
+        info = FailureInfo(exception_type.__qualname__, exception_type.__module__, exception.args, location)
+        info.type_names = tuple(f"{base.__module__}.{base.__qualname__}" for base in exception_type.__mro__[:-1])
+        return info
+
+    def matches(self, exception_types) -> bool:
+        """Return whether the original exception was an instance of exception_types, like isinstance()"""
+        if isinstance(exception_types, type):
+            exception_types = (exception_types,)
+        return any(f"{t.__module__}.{t.__qualname__}" in self.type_names for t in exception_types)
+
+    def __str__(self) -> str:
+        text = "{}{!r}".format(self.type_name, self.exception_args)
+        if self.location:
+            text += f" at {self.location}"
+        return text
+
+
+def trim_traceback(exception: BaseException, limit: int) -> BaseException:
+    """
+    Keep only the innermost limit frames of an exception's traceback.
+
+    A limit of 0 drops the traceback entirely. Kept frames still reference the
+    frames that called them, so the local variables of the dropped frames are
+    cleared to let them be garbage collected. The frame that caught the exception
+    is left alone, as it may still be running. The tracebacks of chained
+    exceptions (__cause__ and __context__) are trimmed too. Returns the exception itself.
+    """
+    if limit < 0:
+        raise ValueError("limit must not be negative")
+    pending = [exception]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        _trim(current, limit)
+        pending.append(current.__cause__)
+        pending.append(current.__context__)
+    return exception
+
+
+def _trim(exception: BaseException, limit: int) -> None:
+    entries = []
+    tb = exception.__traceback__
+    while tb is not None:
+        entries.append(tb)
+        tb = tb.tb_next
+    if len(entries) <= limit:
+        return
+    exception.__traceback__ = entries[-limit] if limit else None
+    # The outermost entry is the frame that caught the exception. It may still be
+    # running or be a suspended generator, so only the frames below it are cleared.
+    for dropped in entries[1:len(entries) - limit]:
+        try:
+            dropped.tb_frame.clear()
+        except RuntimeError:
+            pass
+
+
+_CaptureOptions = namedtuple('_CaptureOptions', ('traceback_limit', 'failure_info'))
+
+
+_NO_OPTIONS = _CaptureOptions(None, False)
+
+# Process-wide default, replaced as a whole by set_capture_options()
+_global_options: _CaptureOptions = _NO_OPTIONS
+# Per-context override set by the capture_options() context manager
+_scoped_options: ContextVar = ContextVar('kotresult_capture_options', default=None)
+
+
+def _check_options(traceback_limit, failure_info: bool) -> _CaptureOptions:
+    if traceback_limit is not None and traceback_limit < 0:
+        raise ValueError("traceback_limit must not be negative")
+    if traceback_limit is None and not failure_info:
+        return _NO_OPTIONS
+    return _CaptureOptions(traceback_limit, failure_info)
+
+
+def set_capture_options(traceback_limit=None, failure_info: bool = False) -> None:
+    """
+    Set how exceptions are stored when run_catching and the *_catching methods capture them.
+
+    Args:
+        traceback_limit: Keep only the innermost N frames of the traceback (0 drops it).
+            None keeps the full traceback
+        failure_info: Store a FailureInfo record instead of the exception itself. Filters
+            on exception types, such as the retry_on of run_catching_retry, match a
+            FailureInfo by the type of the exception it was built from
+    """
+    global _global_options
+    _global_options = _check_options(traceback_limit, failure_info)
+
+
+@contextmanager
+def capture_options(traceback_limit=None, failure_info: bool = False) -> Iterator[None]:
+    """
+    Override the capture options for the calls made inside the with block.
+
+    The override is stored in a ContextVar, so it applies to the current thread or
+    asyncio task only.
+
+    Example:
+        with capture_options(traceback_limit=0):
+            result = run_catching(validate, payload)
+    """
+    token = _scoped_options.set(_check_options(traceback_limit, failure_info))
+    try:
+        yield
+    finally:
+        _scoped_options.reset(token)
+
+
+def capture(exception: BaseException) -> BaseException:
+    """Apply the active capture options to an exception about to be stored in a failure Result"""
+    options = _scoped_options.get() or _global_options
+    if options is _NO_OPTIONS:
+        return exception
+    if options.failure_info:
+        return FailureInfo.from_exception(exception)
+    if options.traceback_limit is not None:
+        trim_traceback(exception, options.traceback_limit)
+    return exception
+
+
+def exception_matches(exception: BaseException, exception_types) -> bool:
+    """
+    isinstance() for captured exceptions: a FailureInfo matches the types of the exception it replaced.
+
+    Used by the filters on exception types, so they behave the same whether or not
+    the failure_info capture option is set.
+    """
+    if isinstance(exception, FailureInfo):
+        return exception.matches(exception_types)
+    return isinstance(exception, exception_types)
+
+
+def get_capture_options() -> tuple:
+    """Return the (traceback_limit, failure_info) options in effect"""
+    return tuple(_scoped_options.get() or _global_options)
@@ -0,0 +1,32 @@
+from contextvars import ContextVar
+from typing import ContextManager, NamedTuple, Optional, Tuple, Type, Union
+
+class FailureInfo(Exception):
+    type_name: str
+    module: str
+    exception_args: tuple
+    location: str
+    type_names: Tuple[str, ...]
+
+    def __init__(self, type_name: str, module: str, exception_args: tuple, location: str = ...) -> None: ...
+    @staticmethod
+    def from_exception(exception: BaseException) -> FailureInfo: ...
+    def matches(self, exception_types: Union[Type[BaseException], Tuple[Type[BaseException], ...]]) -> bool: ...
+
+def trim_traceback(exception: BaseException, limit: int) -> BaseException: ...
+
+class _CaptureOptions(NamedTuple):
+    traceback_limit: Optional[int]
+    failure_info: bool
+
+_global_options: _CaptureOptions
+_scoped_options: ContextVar[Optional[_CaptureOptions]]
+
+def set_capture_options(traceback_limit: Optional[int] = ..., failure_info: bool = ...) -> None: ...
+def capture_options(traceback_limit: Optional[int] = ..., failure_info: bool = ...) -> ContextManager[None]: ...
+def capture(exception: BaseException) -> BaseException: ...
+def exception_matches(
+        exception: BaseException,
+        exception_types: Union[Type[BaseException], Tuple[Type[BaseException], ...]],
+) -> bool: ...
+def get_capture_options() -> Tuple[Optional[int], bool]: ...
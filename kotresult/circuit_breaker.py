@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable
+from functools import wraps
+from typing import Callable, Deque, Optional, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Returned as the failure of calls rejected by an open CircuitBreaker"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
+
+    def __str__(self) -> str:
+        return f"circuit {self.name!r} is open"
+
+
+class CircuitBreaker:
+    """
+    Stops calling a dependency that keeps failing and returns fast failures instead.
+
+    The breaker starts closed: calls go through and their failures are counted over
+    a sliding window of window seconds. Once failure_threshold failures fall in the
+    window, the circuit opens and every call immediately returns a
+    Result.failure(CircuitOpenError) without calling the function. After
+    reset_timeout seconds the circuit turns half-open and lets up to half_open_max
+    concurrent trial calls through: a successful one closes the circuit, a failed
+    one opens it again. Calls made while the trials are running are rejected.
+
+    The breaker can be shared between threads and asyncio tasks: its state is only
+    touched under a lock that is never held while the function runs.
+
+    Args:
+        failure_threshold: Number of failures within the window that opens the circuit
+        window: Length of the sliding window in seconds
+        reset_timeout: Seconds the circuit stays open before allowing trial calls
+        half_open_max: Maximum number of concurrent trial calls in the half-open state
+        name: Name reported by CircuitOpenError
+
+    Example:
+        breaker = CircuitBreaker(failure_threshold=5, window=10, reset_timeout=30)
+
+        @breaker
+        def fetch_profile(user_id):
+            ...
+
+        fetch_profile(42)  # Result, a CircuitOpenError failure while the circuit is open
+        breaker.run_catching(requests.get, url)
+    """
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            window: float = 60.0,
+            reset_timeout: float = 30.0,
+            half_open_max: int = 1,
+            name: str = "circuit",
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+        if half_open_max < 1:
+            raise ValueError("half_open_max must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+        self.name = name
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures: Deque[float] = deque()
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half_open'"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def failure_count(self) -> int:
+        """Number of failures in the current window"""
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._failures)
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded failures"""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._failures.clear()
+        self._trials = 0
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._trials = 0
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        failures = self._failures
+        while failures and failures[0] <= cutoff:
+            failures.popleft()
+
+    def _acquire(self) -> Optional[bool]:
+        # Returns None if the call is rejected, otherwise whether it is a half-open trial
+        with self._lock:
+            if self._state == CLOSED:
+                return False
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return None
+                self._state = HALF_OPEN
+            if self._trials >= self.half_open_max:
+                return None
+            self._trials += 1
+            return True
+
+    def _record(self, result: Optional[Result], trial: bool) -> None:
+        # result is None when an async call was cancelled before completing
+        with self._lock:
+            if trial:
+                if self._state != HALF_OPEN:
+                    # Another trial already settled the state
+                    return
+                self._trials -= 1
+                if result is None:
+                    return
+                if result._is_failure:
+                    self._open(time.monotonic())
+                else:
+                    self._close()
+                return
+            if result is not None and result._is_failure and self._state == CLOSED:
+                now = time.monotonic()
+                self._failures.append(now)
+                self._expire(now)
+                if len(self._failures) >= self.failure_threshold:
+                    self._open(now)
+
+    def _reject(self) -> Result:
+        # A new exception per rejection: raising a shared one would pile every
+        # caller's frames onto its traceback and keep them alive
+        return Result.failure(CircuitOpenError(self.name))
+
+    def run_catching(self, func: Callable[..., T], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching unless the circuit is open"""
+        trial = self._acquire()
+        if trial is None:
+            return self._reject()
+        result = None
+        try:
+            result = run_catching(func, *args, **kwargs)
+        finally:
+            self._record(result, trial)
+        return result
+
+    async def run_catching_async(self, func: Callable[..., Union[T, Awaitable[T]]], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching_async unless the circuit is open"""
+        trial = self._acquire()
+        if trial is None:
+            return self._reject()
+        result = None
+        try:
+            result = await run_catching_async(func, *args, **kwargs)
+        finally:
+            self._record(result, trial)
+        return result
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., Result[T]]:
+        """Decorate func so that its calls go through the breaker; coroutine functions get an async wrapper"""
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.run_catching_async(func, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.run_catching(func, *args, **kwargs)
+        return wrapper
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name={self.name!r}, state={self.state!r})"
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import builtins
+import json
+import struct
+import threading
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from kotresult.capture import FailureInfo
+from kotresult.result import Result
+
+# Binary stream layout: the MAGIC header, then one record per Result made of a
+# struct-packed (kind, payload length) header followed by the payload. The payload
+# of a success is its encoded value; that of a failure is the encoded
+# (module, type name, args) tuple of its exception.
+MAGIC = b'KRS\x01'
+_SUCCESS = 0
+_FAILURE = 1
+_RECORD = struct.Struct('<BI')
+
+# Value tags of the payload encoding. As in msgpack, small ints, short strings
+# and small containers fit their value or length in the tag byte itself.
+_FIXINT = 0x00  # 0x00-0x7f: int 0..127
+_FIXSTR = 0x80  # 0x80-0x9f: str of 0..31 UTF-8 bytes
+_FIXLIST = 0xa0  # 0xa0-0xaf: list of 0..15 items
+_FIXDICT = 0xb0  # 0xb0-0xbf: dict of 0..15 items
+_FIXTUPLE = 0xc0  # 0xc0-0xcf: tuple of 0..15 items
+_NONE = 0xd0
+_FALSE = 0xd1
+_TRUE = 0xd2
+_INT64 = 0xd3
+_BIGINT = 0xd4
+_FLOAT = 0xd5
+_STR = 0xd6
+_BYTES = 0xd7
+_LIST = 0xd8
+_DICT = 0xd9
+_TUPLE = 0xda
+
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_U32 = struct.Struct('<I')
+_I64_MIN = -2 ** 63
+_I64_MAX = 2 ** 63 - 1
+
+
+class ExceptionRegistry:
+    """
+    The exception types that decoding may instantiate, keyed by module and qualified name.
+
+    Builtin exceptions are always known. Any other type must be registered, so
+    decoding data never imports modules or instantiates arbitrary classes. A
+    failure of an unknown type, or one whose type cannot be rebuilt from its args,
+    is decoded as a FailureInfo record carrying the original type name, module and args.
+    """
+
+    def __init__(self):
+        self._types: Dict[Tuple[str, str], Type[BaseException]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, exception_type: Type[BaseException]) -> Type[BaseException]:
+        """Register an exception type. Returns it, so it can be used as a class decorator."""
+        if not (isinstance(exception_type, type) and issubclass(exception_type, BaseException)):
+            raise TypeError(f"{exception_type!r} is not an exception type")
+        with self._lock:
+            self._types[(exception_type.__module__, exception_type.__qualname__)] = exception_type
+        return exception_type
+
+    def resolve(self, module: str, type_name: str) -> Optional[Type[BaseException]]:
+        """Return the registered type with this module and qualified name, or None"""
+        exception_type = self._types.get((module, type_name))
+        if exception_type is None and module == 'builtins':
+            candidate = getattr(builtins, type_name, None)
+            if isinstance(candidate, type) and issubclass(candidate, BaseException):
+                exception_type = candidate
+        return exception_type
+
+    def rebuild(self, module: str, type_name: str, args: tuple) -> BaseException:
+        """Instantiate the exception, falling back to a FailureInfo"""
+        exception_type = self.resolve(module, type_name)
+        if exception_type is not None:
+            try:
+                return exception_type(*args)
+            except Exception:
+                pass
+        return FailureInfo(type_name, module, args)
+
+
+default_registry = ExceptionRegistry()
+
+
+def register_exception(exception_type: Type[BaseException]) -> Type[BaseException]:
+    """
+    Register an exception type with the default registry so failures of that type are rebuilt when decoded.
+
+    Example:
+        @register_exception
+        class ValidationError(Exception):
+            pass
+    """
+    return default_registry.register(exception_type)
+
+
+def _describe(exception: BaseException) -> Tuple[str, str, tuple]:
+    if isinstance(exception, FailureInfo):
+        return exception.module, exception.type_name, tuple(exception.exception_args)
+    exception_type = type(exception)
+    return exception_type.__module__, exception_type.__qualname__, exception.args
+
+
+# Encoding
+
+def _encode_value(value: Any, out: List[bytes]) -> None:
+    value_type = type(value)
+    if value_type is str:
+        raw = value.encode('utf-8')
+        size = len(raw)
+        out.append((bytes((_FIXSTR + size,)) if size < 32 else bytes((_STR,)) + _U32.pack(size)) + raw)
+    elif value_type is int:
+        if 0 <= value < 0x80:
+            out.append(bytes((value,)))
+        elif _I64_MIN <= value <= _I64_MAX:
+            out.append(bytes((_INT64,)) + _I64.pack(value))
+        else:
+            raw = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+            out.append(bytes((_BIGINT,)) + _U32.pack(len(raw)) + raw)
+    elif value is None:
+        out.append(bytes((_NONE,)))
+    elif value is True:
+        out.append(bytes((_TRUE,)))
+    elif value is False:
+        out.append(bytes((_FALSE,)))
+    elif value_type is float:
+        out.append(bytes((_FLOAT,)) + _F64.pack(value))
+    elif value_type is dict:
+        size = len(value)
+        out.append(bytes((_FIXDICT + size,)) if size < 16 else bytes((_DICT,)) + _U32.pack(size))
+        for key, item in value.items():
+            _encode_value(key, out)
+            _encode_value(item, out)
+    elif value_type is list or value_type is tuple:
+        size = len(value)
+        if size < 16:
+            out.append(bytes(((_FIXLIST if value_type is list else _FIXTUPLE) + size,)))
+        else:
+            out.append(bytes((_LIST if value_type is list else _TUPLE,)) + _U32.pack(size))
+        for item in value:
+            _encode_value(item, out)
+    elif value_type is bytes:
+        out.append(bytes((_BYTES,)) + _U32.pack(len(value)) + value)
+    else:
+        raise TypeError(f"cannot encode a value of type {value_type.__qualname__}")
+
+
+def _encode_payload(value: Any) -> bytes:
+    out: List[bytes] = []
+    _encode_value(value, out)
+    return b''.join(out)
+
+
+def _encode_failure(exception: BaseException) -> bytes:
+    module, type_name, args = _describe(exception)
+    try:
+        return _encode_payload((module, type_name, args))
+    except TypeError:
+        # Args that cannot be encoded are replaced by the exception message
+        return _encode_payload((module, type_name, (str(exception),)))
+
+
+def _encode_record(result: Result) -> bytes:
+    if result._is_failure:
+        payload = _encode_failure(result._value)
+        return _RECORD.pack(_FAILURE, len(payload)) + payload
+    payload = _encode_payload(result._value)
+    return _RECORD.pack(_SUCCESS, len(payload)) + payload
+
+
+def encode_results(results: Iterable[Result]) -> bytes:
+    """
+    Encode Results into the compact binary format.
+
+    Success values may be None, bool, int, float, str, bytes, list, tuple or dict,
+    nested freely; anything else raises TypeError. Failures are stored as the type
+    name, module and args of their exception, without traceback. Exception args
+    that cannot be encoded are replaced by the exception message.
+    """
+    return MAGIC + b''.join([_encode_record(result) for result in results])
+
+
+def dump_results(results: Iterable[Result], fp: IO[bytes]) -> None:
+    """Write Results to a binary file object one record at a time"""
+    fp.write(MAGIC)
+    for result in results:
+        fp.write(_encode_record(result))
+
+
+# Decoding
+
+def _decode_items(data: bytes, offset: int, count: int, items: List[Any]) -> int:
+    # Small ints and short strings, the most common items, are decoded inline
+    # rather than through a recursive call.
+    for _ in range(count):
+        tag = data[offset]
+        if tag < _FIXSTR:
+            items.append(tag)
+            offset += 1
+        elif tag < _FIXLIST:
+            end = offset + 1 + tag - _FIXSTR
+            items.append(str(data[offset + 1:end], 'utf-8'))
+            offset = end
+        else:
+            item, offset = _decode_value(data, offset)
+            items.append(item)
+    return offset
+
+
+def _decode_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag < _FIXSTR:
+        return tag, offset
+    if tag < _FIXLIST:
+        end = offset + tag - _FIXSTR
+        return str(data[offset:end], 'utf-8'), end
+    if tag < _NONE:
+        items: List[Any] = []
+        if tag < _FIXDICT:
+            return items, _decode_items(data, offset, tag - _FIXLIST, items)
+        if tag < _FIXTUPLE:
+            offset = _decode_items(data, offset, 2 * (tag - _FIXDICT), items)
+            return dict(zip(items[::2], items[1::2])), offset
+        offset = _decode_items(data, offset, tag - _FIXTUPLE, items)
+        return tuple(items), offset
+    if tag == _NONE:
+        return None, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _INT64:
+        return _I64.unpack_from(data, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(data, offset)[0], offset + 8
+    if tag > _TUPLE:
+        raise ValueError(f"unknown value tag {tag:#x}")
+    (size,) = _U32.unpack_from(data, offset)
+    offset += 4
+    if tag == _STR:
+        return str(data[offset:offset + size], 'utf-8'), offset + size
+    if tag == _BYTES:
+        return bytes(data[offset:offset + size]), offset + size
+    if tag == _BIGINT:
+        return int.from_bytes(data[offset:offset + size], 'little', signed=True), offset + size
+    items = []
+    if tag == _DICT:
+        offset = _decode_items(data, offset, 2 * size, items)
+        return dict(zip(items[::2], items[1::2])), offset
+    offset = _decode_items(data, offset, size, items)
+    return (items if tag == _LIST else tuple(items)), offset
+
+
+def _decode_record(kind: int, data: bytes, offset: int, end: int, registry: ExceptionRegistry) -> Result:
+    value, offset = _decode_value(data, offset)
+    if offset != end:
+        raise ValueError("record payload length mismatch")
+    if kind == _SUCCESS:
+        return Result.success(value)
+    if kind == _FAILURE:
+        if not (type(value) is tuple and len(value) == 3 and type(value[0]) is str and type(value[1]) is str
+                and type(value[2]) is tuple):
+            raise ValueError("failure payload is not a (module, type, args) tuple")
+        module, type_name, args = value
+        return Result.failure(registry.rebuild(module, type_name, args))
+    raise ValueError(f"unknown record kind {kind}")
+
+
+def _check_magic(header: bytes) -> None:
+    if header != MAGIC:
+        raise ValueError("not a kotresult binary stream")
+
+
+def decode_results(data: bytes, registry: Optional[ExceptionRegistry] = None) -> List[Result]:
+    """
+    Decode Results produced by encode_results() or dump_results().
+
+    Failures are rebuilt through the registry (the default one if omitted), see
+    ExceptionRegistry. Raises ValueError on malformed data.
+    """
+    registry = registry or default_registry
+    data = bytes(data)
+    _check_magic(data[:len(MAGIC)])
+    results = []
+    offset = len(MAGIC)
+    end = len(data)
+    try:
+        while offset < end:
+            kind, size = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            if offset + size > end:
+                raise ValueError("truncated record")
+            results.append(_decode_record(kind, data, offset, offset + size, registry))
+            offset += size
+    except (struct.error, IndexError, TypeError) as e:
+        raise ValueError(f"malformed kotresult binary stream: {e}") from e
+    return results
+
+
+def load_results(fp: IO[bytes], registry: Optional[ExceptionRegistry] = None) -> Iterator[Result]:
+    """Read Results written by dump_results() from a binary file object, one record at a time"""
+    registry = registry or default_registry
+    _check_magic(fp.read(len(MAGIC)))
+    while True:
+        header = fp.read(_RECORD.size)
+        if not header:
+            return
+        if len(header) < _RECORD.size:
+            raise ValueError("truncated record header")
+        kind, size = _RECORD.unpack(header)
+        payload = fp.read(size)
+        if len(payload) < size:
+            raise ValueError("truncated record")
+        try:
+            yield _decode_record(kind, payload, 0, size, registry)
+        except (struct.error, IndexError, TypeError) as e:
+            raise ValueError(f"malformed kotresult binary stream: {e}") from e
+
+
+# JSON
+
+def result_to_dict(result: Result) -> Dict[str, Any]:
+    """Convert a Result to a JSON-compatible dict, see Result.to_dict()"""
+    if not result._is_failure:
+        return {'success': True, 'value': result._value}
+    module, type_name, args = _describe(result._value)
+    try:
+        json.dumps(args)
+    except (TypeError, ValueError):
+        args = (str(result._value),)
+    return {'success': False, 'error': {'type': type_name, 'module': module, 'args': list(args)}}
+
+
+def result_from_dict(data: Dict[str, Any], registry: Optional[ExceptionRegistry] = None) -> Result:
+    """Rebuild a Result from result_to_dict() output, see Result.from_dict()"""
+    if data['success']:
+        return Result.success(data['value'])
+    error = data['error']
+    return Result.failure((registry or default_registry).rebuild(error['module'], error['type'], tuple(error['args'])))
+
+
+def dump_results_json(results: Iterable[Result], fp: IO[str]) -> None:
+    """Write Results to a text file object as JSON Lines, one dict per line"""
+    for result in results:
+        fp.write(json.dumps(result_to_dict(result), separators=(',', ':')))
+        fp.write('\n')
+
+
+def load_results_json(fp: IO[str], registry: Optional[ExceptionRegistry] = None) -> Iterator[Result]:
+    """Read Results written by dump_results_json() from a text file object, one line at a time"""
+    for line in fp:
+        if line.strip():
+            yield result_from_dict(json.loads(line), registry)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Tuple, TypeVar
+
+from kotresult._compat import BaseExceptionGroup
+from kotresult.capture import capture
+from kotresult.result import Result
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+FAIL_FAST = 'fail_fast'
+ACCUMULATE = 'accumulate'
+COMBINE_MODES = (FAIL_FAST, ACCUMULATE)
+
+
+def _check_mode(mode: str) -> bool:
+    # Returns True for accumulate mode
+    if mode not in COMBINE_MODES:
+        raise ValueError(f"mode must be one of {COMBINE_MODES}, got {mode!r}")
+    return mode == ACCUMULATE
+
+
+def _group(exceptions: List[BaseException], total: int) -> BaseException:
+    # BaseExceptionGroup returns an ExceptionGroup when every exception is an Exception
+    return BaseExceptionGroup(f"{len(exceptions)} of {total} results failed", exceptions)
+
+
+def sequence(results: Iterable[Result[T]], mode: str = FAIL_FAST) -> Result[List[T]]:
+    """
+    Turn an iterable of Results into a Result of a list.
+
+    Returns Result.success with every value, in order, if all results are successes.
+    In 'fail_fast' mode the first failure is returned as is and the rest of the
+    iterable is not consumed, so a generator producing the results stops there.
+    In 'accumulate' mode the whole iterable is consumed and every exception is
+    collected into a single (Base)ExceptionGroup failure.
+
+    Example:
+        sequence([Result.success(1), Result.success(2)])  # Result.success([1, 2])
+    """
+    accumulate = _check_mode(mode)
+    values = []
+    exceptions = []
+    total = 0
+    for result in results:
+        total += 1
+        if not result._is_failure:
+            values.append(result._value)
+        elif accumulate:
+            exceptions.append(result._value)
+        else:
+            return result
+    if exceptions:
+        return Result.failure(_group(exceptions, total))
+    return Result.success(values)
+
+
+def traverse(func: Callable[[R], T], items: Iterable[R], mode: str = FAIL_FAST) -> Result[List[T]]:
+    """
+    Call func on every item and combine the outcomes into a Result of a list.
+
+    This is sequence(run_catching(func, item) for item in items) done in a single
+    pass without creating a Result per item. In 'fail_fast' mode func is not called
+    on the items after the first one that raises. In 'accumulate' mode func is
+    called on every item and all exceptions are collected into a single
+    (Base)ExceptionGroup failure.
+
+    Example:
+        traverse(int, ["1", "x", "y"], mode='accumulate')
+        # Result.failure(ExceptionGroup('2 of 3 results failed', [ValueError(...), ValueError(...)]))
+    """
+    accumulate = _check_mode(mode)
+    values = []
+    exceptions = []
+    total = 0
+    for item in items:
+        total += 1
+        try:
+            values.append(func(item))
+        except BaseException as e:
+            if not accumulate:
+                return Result.failure(capture(e))
+            exceptions.append(capture(e))
+    if exceptions:
+        return Result.failure(_group(exceptions, total))
+    return Result.success(values)
+
+
+def zip_results(*results: Result[Any], mode: str = FAIL_FAST) -> Result[Tuple[Any, ...]]:
+    """
+    Combine several Results into a Result of a tuple of their values.
+
+    In 'fail_fast' mode the first failure is returned. In 'accumulate' mode every
+    exception is collected into a single (Base)ExceptionGroup failure.
+
+    Example:
+        zip_results(parse_name(data), parse_age(data)).map(lambda pair: Person(*pair))
+    """
+    values = sequence(results, mode)
+    if values._is_failure:
+        return values
+    return Result.success(tuple(values._value))
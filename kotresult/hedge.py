@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Dict, Optional, Set, TypeVar, Union
+
+from kotresult._compat import BaseExceptionGroup
+from kotresult.aio import run_catching_async
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+from kotresult.timeout import shared_executor
+
+T = TypeVar('T')
+
+
+def _check_arguments(callables: tuple, hedge_after: Optional[float]) -> None:
+    if not callables:
+        raise ValueError("at least one callable is required")
+    if hedge_after is not None and hedge_after < 0:
+        raise ValueError("hedge_after must not be negative")
+
+
+def _all_failed(failures: Dict[int, BaseException]) -> Result:
+    exceptions = [failures[index] for index in sorted(failures)]
+    return Result.failure(BaseExceptionGroup(f"all {len(exceptions)} calls failed", exceptions))
+
+
+def run_catching_first(
+        *callables: Callable[[], T],
+        hedge_after: Optional[float] = None,
+        executor: Optional[Executor] = None,
+) -> Result[T]:
+    """
+    Call interchangeable functions in worker threads and return the first success.
+
+    The first callable is started straight away. Each following one is started
+    when the calls already running have not succeeded within hedge_after seconds,
+    or as soon as one of them fails. With hedge_after=None all callables are
+    started at once. The first Result.success wins: calls that have not started
+    yet are cancelled, while the calls still running are left to finish in the
+    background, as threads cannot be stopped, and their outcome is discarded. If
+    every call fails, the failure is an (Base)ExceptionGroup of their exceptions in
+    callable order.
+
+    Args:
+        *callables: Functions taking no argument, e.g. functools.partial objects,
+            in the order they should be tried
+        hedge_after: Seconds to wait before starting the next callable, or None
+            to start them all at once
+        executor: Executor running the calls. Defaults to shared_executor(), whose
+            workers every timed and hedged call of the process shares: calls that
+            hang there starve the others, so prefer an executor per call site
+
+    Example:
+        result = run_catching_first(
+            partial(fetch, primary, key),
+            partial(fetch, replica, key),
+            hedge_after=0.05,
+        )
+    """
+    _check_arguments(callables, hedge_after)
+    executor = executor or shared_executor()
+    futures: Dict[Future, int] = {}
+    failures: Dict[int, BaseException] = {}
+
+    def start(index: int) -> Future:
+        # Each call sees the caller's context, e.g. its deadline()
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, run_catching, callables[index])
+        futures[future] = index
+        return future
+
+    started = 1 if hedge_after is not None else len(callables)
+    for index in range(started):
+        start(index)
+    pending: Set[Future] = set(futures)
+    try:
+        while pending:
+            hedging = started < len(callables)
+            done, pending = wait(pending, hedge_after if hedging else None, FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result._is_failure:
+                    return result
+                failures[futures[future]] = result._value
+            if hedging:
+                # Hedge when the running calls are slow or have failed
+                pending.add(start(started))
+                started += 1
+    finally:
+        for future in pending:
+            future.cancel()
+    return _all_failed(failures)
+
+
+async def run_catching_first_async(
+        *callables: Callable[[], Union[T, Awaitable[T]]],
+        hedge_after: Optional[float] = None,
+) -> Result[T]:
+    """
+    asyncio version of run_catching_first.
+
+    The callables may be coroutine functions or plain callables, each called through
+    run_catching_async in its own task. Once a call succeeds the other running
+    tasks are cancelled and awaited before returning; if run_catching_first_async is
+    itself cancelled, so are they.
+    """
+    _check_arguments(callables, hedge_after)
+    tasks: Dict[asyncio.Future, int] = {}
+    failures: Dict[int, BaseException] = {}
+
+    def start(index: int) -> asyncio.Future:
+        task = asyncio.ensure_future(run_catching_async(callables[index]))
+        tasks[task] = index
+        return task
+
+    started = 1 if hedge_after is not None else len(callables)
+    for index in range(started):
+        start(index)
+    pending: Set[asyncio.Future] = set(tasks)
+    try:
+        while pending:
+            hedging = started < len(callables)
+            done, pending = await asyncio.wait(
+                pending, timeout=hedge_after if hedging else None, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if not result._is_failure:
+                    return result
+                failures[tasks[task]] = result._value
+            if hedging:
+                pending.add(start(started))
+                started += 1
+    finally:
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    return _all_failed(failures)
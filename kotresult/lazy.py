@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from kotresult._compat import Generic
+from kotresult.capture import capture
+from kotresult.result import Result
+
+# The generic signatures live in lazy.pyi: the builder methods of LazyResult
+# return self with new type parameters, which only a stub can express without
+# a cast() call on every recorded step.
+
+_MAP = 0
+_MAP_CATCHING = 1
+_RECOVER = 2
+_RECOVER_CATCHING = 3
+
+_STEP_NAMES = ('map', 'map_catching', 'recover', 'recover_catching')
+
+
+def _run_steps(steps, value, failed: bool) -> Result:
+    # Runs every step over plain locals and allocates only the final Result. Like
+    # the eager Result methods, a transform returning an exception instance turns
+    # the Result into a failure, and caught exceptions go through capture(), so
+    # failed always equals isinstance(value, BaseException).
+    for kind, transform in steps:
+        if failed:
+            if kind == _RECOVER:
+                value = transform(value)
+                failed = isinstance(value, BaseException)
+            elif kind == _RECOVER_CATCHING:
+                try:
+                    value = transform(value)
+                except BaseException as e:
+                    value = capture(e)
+                else:
+                    failed = isinstance(value, BaseException)
+        elif kind == _MAP:
+            value = transform(value)
+            failed = isinstance(value, BaseException)
+        elif kind == _MAP_CATCHING:
+            try:
+                value = transform(value)
+            except BaseException as e:
+                value = capture(e)
+                failed = True
+            else:
+                failed = isinstance(value, BaseException)
+    return Result(value)
+
+
+class Pipeline(Generic):
+    """
+    A reusable, immutable sequence of Result transformations.
+
+    Each call to map/map_catching/recover/recover_catching returns a new Pipeline
+    with the step appended; nothing runs until the pipeline is applied. Applying
+    the pipeline runs every step in a single pass over plain locals and allocates
+    only the final Result, where the eager chain allocates a Result per step.
+
+    Build a pipeline once and apply it to many inputs to amortize its construction.
+
+    Example:
+        parse = Pipeline().map(str.strip).map_catching(int).recover(lambda e: 0)
+        results = [parse.run(line) for line in lines]
+    """
+    __slots__ = ('_steps',)
+
+    def __init__(self, steps: tuple = ()):
+        self._steps = steps
+
+    def map(self, transform: Callable) -> Pipeline:
+        return Pipeline(self._steps + ((_MAP, transform),))
+
+    def map_catching(self, transform: Callable) -> Pipeline:
+        return Pipeline(self._steps + ((_MAP_CATCHING, transform),))
+
+    def recover(self, transform: Callable) -> Pipeline:
+        return Pipeline(self._steps + ((_RECOVER, transform),))
+
+    def recover_catching(self, transform: Callable) -> Pipeline:
+        return Pipeline(self._steps + ((_RECOVER_CATCHING, transform),))
+
+    def apply(self, result: Result) -> Result:
+        """Run the pipeline on a Result"""
+        if not self._steps:
+            return result
+        return _run_steps(self._steps, result._value, result._is_failure)
+
+    # An alias rather than a method calling apply(), which would add a call to every run
+    __call__ = apply
+
+    def run(self, value) -> Result:
+        """Run the pipeline on a plain value, as if it had been wrapped with Result(value)"""
+        return _run_steps(self._steps, value, isinstance(value, BaseException))
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        return "Pipeline({})".format(", ".join(_STEP_NAMES[kind] for kind, _ in self._steps))
+
+
+class LazyResult(Generic):
+    """
+    A Result paired with pending transformations.
+
+    Created with Result.lazy(); the recorded steps only run, in a single pass,
+    when evaluate() is called. LazyResult is a builder: each step is appended in
+    place and the same LazyResult is returned, so a chain allocates no
+    intermediate objects. To branch off a chain, take its pipeline, which is an
+    immutable copy of the steps recorded so far.
+
+    Example:
+        result.lazy().map(f).map_catching(g).recover(h).evaluate()
+    """
+    __slots__ = ('_source', '_steps')
+
+    def __init__(self, source: Result):
+        self._source = source
+        self._steps: list = []
+
+    @property
+    def pipeline(self) -> Pipeline:
+        """The steps recorded so far as a Pipeline, reusable on other inputs"""
+        return Pipeline(tuple(self._steps))
+
+    def map(self, transform: Callable) -> LazyResult:
+        self._steps.append((_MAP, transform))
+        return self
+
+    def map_catching(self, transform: Callable) -> LazyResult:
+        self._steps.append((_MAP_CATCHING, transform))
+        return self
+
+    def recover(self, transform: Callable) -> LazyResult:
+        self._steps.append((_RECOVER, transform))
+        return self
+
+    def recover_catching(self, transform: Callable) -> LazyResult:
+        self._steps.append((_RECOVER_CATCHING, transform))
+        return self
+
+    def evaluate(self) -> Result:
+        """Run the steps recorded so far on the source Result"""
+        source = self._source
+        if not self._steps:
+            return source
+        return _run_steps(self._steps, source._value, source._is_failure)
+
+    def __repr__(self) -> str:
+        return "LazyResult({!r}, [{}])".format(
+            self._source, ", ".join(_STEP_NAMES[kind] for kind, _ in self._steps))
@@ -0,0 +1,35 @@
+from typing import Any, Callable, Generic, List, Tuple, TypeVar
+
+from kotresult.result import Result
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+_U = TypeVar('_U')
+
+_Step = Tuple[int, Callable[[Any], Any]]
+
+class Pipeline(Generic[_T, _R]):
+    _steps: Tuple[_Step, ...]
+
+    def __init__(self, steps: Tuple[_Step, ...] = ...) -> None: ...
+    def map(self, transform: Callable[[_R], _U]) -> Pipeline[_T, _U]: ...
+    def map_catching(self, transform: Callable[[_R], _U]) -> Pipeline[_T, _U]: ...
+    def recover(self, transform: Callable[[BaseException], _R]) -> Pipeline[_T, _R]: ...
+    def recover_catching(self, transform: Callable[[BaseException], _R]) -> Pipeline[_T, _R]: ...
+    def apply(self, result: Result[_T]) -> Result[_R]: ...
+    def __call__(self, result: Result[_T]) -> Result[_R]: ...
+    def run(self, value: _T) -> Result[_R]: ...
+    def __len__(self) -> int: ...
+
+class LazyResult(Generic[_T, _R]):
+    _source: Result[_T]
+    _steps: List[_Step]
+
+    def __init__(self, source: Result[_T]) -> None: ...
+    @property
+    def pipeline(self) -> Pipeline[_T, _R]: ...
+    def map(self, transform: Callable[[_R], _U]) -> LazyResult[_T, _U]: ...
+    def map_catching(self, transform: Callable[[_R], _U]) -> LazyResult[_T, _U]: ...
+    def recover(self, transform: Callable[[BaseException], _R]) -> LazyResult[_T, _R]: ...
+    def recover_catching(self, transform: Callable[[BaseException], _R]) -> LazyResult[_T, _R]: ...
+    def evaluate(self) -> Result[_R]: ...
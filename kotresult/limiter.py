@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable
+from functools import wraps
+from typing import Callable, Deque, Optional, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+
+class RejectedError(Exception):
+    """Returned as the failure of calls rejected by a Bulkhead or RateLimiter"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
+
+    def __str__(self) -> str:
+        return f"{self.name!r} is at capacity"
+
+
+def _check_queue_timeout(queue_timeout: Optional[float]) -> None:
+    if queue_timeout is not None and queue_timeout < 0:
+        raise ValueError("queue_timeout must not be negative")
+
+
+class _Limiter:
+    def __init__(self, queue_timeout: Optional[float], name: str):
+        _check_queue_timeout(queue_timeout)
+        self.queue_timeout = queue_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._rejected = 0
+
+    @property
+    def rejected(self) -> int:
+        """Number of calls rejected so far"""
+        return self._rejected
+
+    def _reject(self) -> Result:
+        # A new exception per rejection: raising a shared one would pile every
+        # caller's frames onto its traceback and keep them alive
+        return Result.failure(RejectedError(self.name))
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., Result[T]]:
+        """Decorate func so that its calls go through the limiter; coroutine functions get an async wrapper"""
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.run_catching_async(func, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.run_catching(func, *args, **kwargs)
+        return wrapper
+
+
+def _set_result(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Waiter:
+    __slots__ = ('signal', 'wake', 'granted')
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop]):
+        # A threading.Event for a thread, a future of its event loop for a task
+        if loop is None:
+            self.signal = threading.Event()
+            self.wake = self.signal.set
+        else:
+            self.signal = future = loop.create_future()
+            self.wake = lambda: loop.call_soon_threadsafe(_set_result, future)
+        self.granted = False
+
+
+class Bulkhead(_Limiter):
+    """
+    Limits the number of calls running at once, to isolate a slow dependency.
+
+    A call runs straight away while fewer than max_concurrent calls are running.
+    Otherwise it waits in a first-in first-out queue for up to queue_timeout seconds
+    and is then rejected with a Result.failure(RejectedError), without calling the
+    function. With the default queue_timeout=0 a call is rejected at once, so
+    overload is shed without any thread piling up; max_waiting additionally bounds
+    the number of queued calls.
+
+    A bulkhead can be shared between threads and asyncio tasks: they compete for the
+    same slots, and its lock is never held while a function runs or a call waits.
+
+    Args:
+        max_concurrent: Maximum number of calls running at once
+        queue_timeout: Seconds a call may wait for a slot, or None to wait as long as needed
+        max_waiting: Maximum number of waiting calls, or None for no limit
+        name: Name reported by RejectedError
+
+    Example:
+        bulkhead = Bulkhead(max_concurrent=10, queue_timeout=0.1, max_waiting=20, name="payments")
+        result = bulkhead.run_catching(charge, order)  # a RejectedError failure while overloaded
+    """
+
+    def __init__(
+            self,
+            max_concurrent: int,
+            queue_timeout: Optional[float] = 0.0,
+            max_waiting: Optional[int] = None,
+            name: str = "bulkhead",
+    ):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_waiting is not None and max_waiting < 0:
+            raise ValueError("max_waiting must not be negative")
+        super().__init__(queue_timeout, name)
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+
+    @property
+    def active(self) -> int:
+        """Number of calls running"""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls waiting for a slot"""
+        return len(self._waiters)
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the slots in use, between 0.0 and 1.0"""
+        return self._active / self.max_concurrent
+
+    def _try_acquire(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Union[bool, _Waiter]:
+        # Returns whether a slot was taken, or the queued waiter
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                return True
+            if self.queue_timeout == 0 or (
+                    self.max_waiting is not None and len(self._waiters) >= self.max_waiting):
+                self._rejected += 1
+                return False
+            waiter = _Waiter(loop)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _settle(self, waiter: _Waiter, rejected: bool = True) -> bool:
+        # Called once a waiter stopped waiting: either it was handed a slot, or it leaves the queue
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            if rejected:
+                self._rejected += 1
+            return False
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        # The wait was interrupted, e.g. by a cancellation, which is not a rejection
+        if self._settle(waiter, rejected=False):
+            self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                # The slot is handed over to the oldest waiter, so _active is unchanged
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                try:
+                    waiter.wake()
+                    return
+                except RuntimeError:
+                    # The event loop of an async waiter was closed
+                    continue
+            self._active -= 1
+
+    def _acquire(self) -> bool:
+        acquired = self._try_acquire()
+        if not isinstance(acquired, _Waiter):
+            return acquired
+        try:
+            acquired.signal.wait(self.queue_timeout)
+        except BaseException:
+            self._abandon(acquired)
+            raise
+        return self._settle(acquired)
+
+    async def _acquire_async(self) -> bool:
+        acquired = self._try_acquire(asyncio.get_running_loop())
+        if not isinstance(acquired, _Waiter):
+            return acquired
+        try:
+            await asyncio.wait((acquired.signal,), timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(acquired)
+            raise
+        return self._settle(acquired)
+
+    def run_catching(self, func: Callable[..., T], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching once a slot is free, or return a RejectedError failure"""
+        if not self._acquire():
+            return self._reject()
+        try:
+            return run_catching(func, *args, **kwargs)
+        finally:
+            self._release()
+
+    async def run_catching_async(self, func: Callable[..., Union[T, Awaitable[T]]], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching_async once a slot is free, or return a RejectedError failure"""
+        if not await self._acquire_async():
+            return self._reject()
+        try:
+            return await run_catching_async(func, *args, **kwargs)
+        finally:
+            self._release()
+
+    def __repr__(self) -> str:
+        return f"Bulkhead(name={self.name!r}, active={self._active}, max_concurrent={self.max_concurrent})"
+
+
+class RateLimiter(_Limiter):
+    """
+    Limits the rate of calls with a token bucket.
+
+    The bucket holds up to burst tokens and is refilled at rate tokens per second.
+    Each call takes one token. When the bucket is empty, a call reserves the next
+    token and sleeps until it is due, provided that is within queue_timeout seconds;
+    otherwise it is rejected at once with a Result.failure(RejectedError), without
+    calling the function. With the default queue_timeout=0 calls are never delayed.
+
+    A rate limiter can be shared between threads and asyncio tasks: its lock is never
+    held while a function runs or a call sleeps.
+
+    Args:
+        rate: Tokens added per second
+        burst: Capacity of the bucket. Defaults to one second worth of tokens, at least 1
+        queue_timeout: Seconds a call may wait for a token, or None to wait as long as needed
+        name: Name reported by RejectedError
+
+    Example:
+        limiter = RateLimiter(rate=50, burst=10, queue_timeout=0.5, name="geocoder")
+
+        @limiter
+        async def geocode(address):
+            ...
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: Optional[int] = None,
+            queue_timeout: Optional[float] = 0.0,
+            name: str = "rate_limiter",
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        super().__init__(queue_timeout, name)
+        self.rate = rate
+        self.burst = burst
+        # Goes below zero while calls hold reservations for tokens not refilled yet
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls sleeping until their token is due"""
+        return self._waiting
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the bucket used up, between 0.0 and 1.0"""
+        with self._lock:
+            tokens = self._refill(time.monotonic())
+        return min(max(1.0 - tokens / self.burst, 0.0), 1.0)
+
+    def _refill(self, now: float) -> float:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return self._tokens
+
+    def _reserve(self) -> Optional[float]:
+        # Returns the seconds to sleep before calling, or None if the call is rejected
+        with self._lock:
+            tokens = self._refill(time.monotonic())
+            if tokens >= 1:
+                self._tokens = tokens - 1
+                return 0.0
+            delay = (1 - tokens) / self.rate
+            if self.queue_timeout is not None and delay > self.queue_timeout:
+                self._rejected += 1
+                return None
+            self._tokens = tokens - 1
+            self._waiting += 1
+            return delay
+
+    def _woke(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def run_catching(self, func: Callable[..., T], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching once a token is available, or return a RejectedError failure"""
+        delay = self._reserve()
+        if delay is None:
+            return self._reject()
+        if delay:
+            try:
+                time.sleep(delay)
+            finally:
+                self._woke()
+        return run_catching(func, *args, **kwargs)
+
+    async def run_catching_async(self, func: Callable[..., Union[T, Awaitable[T]]], *args, **kwargs) -> Result[T]:
+        """Call func through run_catching_async once a token is available, or return a RejectedError failure"""
+        delay = self._reserve()
+        if delay is None:
+            return self._reject()
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # Give the reserved token back
+                with self._lock:
+                    self._tokens = min(self.burst, self._tokens + 1)
+                raise
+            finally:
+                self._woke()
+        return await run_catching_async(func, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(name={self.name!r}, rate={self.rate}, burst={self.burst})"
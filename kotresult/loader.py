@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Mapping
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+BatchFunction = Callable[[List[K]], Union[Mapping, List, Awaitable]]
+
+
+def _check_arguments(max_batch: int, max_wait_ms: float) -> None:
+    if max_batch < 1:
+        raise ValueError("max_batch must be at least 1")
+    if max_wait_ms < 0:
+        raise ValueError("max_wait_ms must not be negative")
+
+
+def _split(keys: List[K], outcome: Result) -> Dict[K, Result]:
+    # Turns the Result of one batch_fn call into one Result per key
+    if outcome._is_failure:
+        return dict.fromkeys(keys, outcome)
+    values = outcome._value
+    if isinstance(values, Mapping):
+        results = {}
+        for key in keys:
+            try:
+                value = values[key]
+            except Exception as e:
+                # A missing key, or any error raised by the mapping's lookup
+                results[key] = Result.failure(e)
+            else:
+                results[key] = Result(value)
+        return results
+    try:
+        values = list(values)
+    except Exception as e:
+        return dict.fromkeys(keys, Result.failure(e))
+    if len(values) != len(keys):
+        error = ValueError(f"batch function returned {len(values)} values for {len(keys)} keys")
+        return dict.fromkeys(keys, Result.failure(error))
+    # An exception in the returned values is that key's failure
+    return {key: Result(value) for key, value in zip(keys, values)}
+
+
+def _split_or_fail(keys: List[K], outcome: Result) -> Dict[K, Result]:
+    # Every waiting caller must get a Result, even if the returned values break _split
+    try:
+        return _split(keys, outcome)
+    except Exception as e:
+        return dict.fromkeys(keys, Result.failure(e))
+
+
+class _LoaderBase:
+    def __init__(self, batch_fn: BatchFunction, max_batch: int, max_wait_ms: float, cache: bool):
+        _check_arguments(max_batch, max_wait_ms)
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._cache: Optional[Dict[Hashable, Result]] = {} if cache else None
+        self.batch_count = 0
+
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        """Forget the cached Result of key, or of every key if omitted"""
+        if self._cache is None:
+            return
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def prime(self, key: Hashable, value: V) -> None:
+        """Store a success in the cache for key, unless a Result is cached already"""
+        if self._cache is not None:
+            self._cache.setdefault(key, Result.success(value))
+
+    def _store(self, results: Dict[Hashable, Result]) -> None:
+        if self._cache is not None:
+            self._cache.update(results)
+
+
+class _Batch:
+    __slots__ = ('keys', 'results', 'full', 'done')
+
+    def __init__(self):
+        # A dict used as an ordered set, so duplicate keys are loaded once
+        self.keys: Dict[Hashable, None] = {}
+        self.results: Dict[Hashable, Result] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class BatchLoader(_LoaderBase):
+    """
+    Coalesces individual load(key) calls made by concurrent threads into batch_fn(keys) calls.
+
+    The first load() of a batch waits up to max_wait_ms for other threads to add
+    their keys, or until max_batch distinct keys were collected, then calls batch_fn
+    once through run_catching, in its own thread, and hands every caller its own
+    Result. batch_fn receives a list of distinct keys and returns either a mapping
+    from key to value, in which case a key missing from it gets a KeyError failure,
+    or a sequence of values in key order. An exception instance in place of a value
+    is that key's failure. If batch_fn raises, every key of the batch gets that failure.
+
+    Args:
+        batch_fn: Function loading a list of keys at once
+        max_batch: Maximum number of keys per batch_fn call
+        max_wait_ms: How long the first caller of a batch waits for more keys, in milliseconds
+        cache: Remember the Result of every key, failures included, until clear() is called
+
+    Example:
+        users = BatchLoader(lambda ids: {user.id: user for user in db.get_users(ids)}, max_batch=100)
+        result = users.load(user_id)  # from many threads at once
+    """
+
+    def __init__(self, batch_fn: BatchFunction, max_batch: int = 100, max_wait_ms: float = 1.0, cache: bool = False):
+        super().__init__(batch_fn, max_batch, max_wait_ms, cache)
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+
+    def load(self, key: K) -> Result[V]:
+        """Load one key, blocking until the batch it joined has been loaded"""
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            batch.keys[key] = None
+            if len(batch.keys) >= self.max_batch:
+                self._batch = None
+                batch.full.set()
+        if leader:
+            batch.full.wait(self.max_wait)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._dispatch(batch)
+        else:
+            batch.done.wait()
+        return batch.results[key]
+
+    def load_many(self, keys: Iterable[K]) -> List[Result[V]]:
+        """Load several keys from the calling thread at once, in batches of at most max_batch keys"""
+        keys = list(keys)
+        results: Dict[Hashable, Result] = {}
+        if self._cache is not None:
+            # Read the cache once, as other threads may clear() it meanwhile
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    results[key] = cached
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        for start in range(0, len(missing), self.max_batch):
+            batch = _Batch()
+            batch.keys = dict.fromkeys(missing[start:start + self.max_batch])
+            self._dispatch(batch)
+            results.update(batch.results)
+        return [results[key] for key in keys]
+
+    def _dispatch(self, batch: _Batch) -> None:
+        keys = list(batch.keys)
+        try:
+            batch.results = _split_or_fail(keys, run_catching(self.batch_fn, keys))
+            with self._lock:
+                self._store(batch.results)
+                self.batch_count += 1
+        finally:
+            batch.done.set()
+
+
+class _AsyncBatch:
+    __slots__ = ('futures', 'timer')
+
+    def __init__(self):
+        self.futures: Dict[Hashable, asyncio.Future] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class AsyncBatchLoader(_LoaderBase):
+    """
+    asyncio version of BatchLoader.
+
+    Keys requested by concurrent tasks within max_wait_ms are loaded with one call
+    to batch_fn, which may be a coroutine function. With max_wait_ms=0 the batch
+    collects the keys requested until the event loop next runs its callbacks.
+    Cancelling one load() does not cancel the batch for the other callers.
+    Instances must only be used from one event loop.
+
+    Example:
+        users = AsyncBatchLoader(fetch_users, max_batch=100)
+        results = await asyncio.gather(*(users.load(user_id) for user_id in user_ids))
+    """
+
+    def __init__(self, batch_fn: BatchFunction, max_batch: int = 100, max_wait_ms: float = 1.0, cache: bool = False):
+        super().__init__(batch_fn, max_batch, max_wait_ms, cache)
+        self._batch: Optional[_AsyncBatch] = None
+        self._tasks = set()
+
+    async def load(self, key: K) -> Result[V]:
+        """Load one key, waiting until the batch it joined has been loaded"""
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        loop = asyncio.get_running_loop()
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _AsyncBatch()
+            batch.timer = loop.call_later(self.max_wait, self._close, batch)
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self.max_batch:
+                batch.timer.cancel()
+                self._close(batch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> List[Result[V]]:
+        """Load several keys, joining the current batch like concurrent load() calls would"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _close(self, batch: _AsyncBatch) -> None:
+        if self._batch is batch:
+            self._batch = None
+        task = asyncio.ensure_future(self._dispatch(batch))
+        # Keep a reference so the task is not garbage collected while it runs
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: _AsyncBatch) -> None:
+        keys = list(batch.futures)
+        results = None
+        try:
+            results = _split_or_fail(keys, await run_catching_async(self.batch_fn, keys))
+            self._store(results)
+            self.batch_count += 1
+        finally:
+            if results is None:
+                # The dispatch was cancelled, e.g. because the event loop is closing
+                results = dict.fromkeys(keys, Result.failure(asyncio.CancelledError()))
+            for key, future in batch.futures.items():
+                if not future.done():
+                    future.set_result(results[key])
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import IO, Dict, List, Sequence, Union
+
+from kotresult.capture import FailureInfo
+from kotresult.result import Result
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class FunctionStats:
+    """
+    Outcome counts, failures by exception type and a latency histogram for one wrapped callable.
+    Exception types are keyed by module and qualified name, e.g. "builtins.ValueError".
+    """
+    __slots__ = ('successes', 'failures', 'failures_by_type', 'bucket_counts', 'duration_sum')
+
+    def __init__(self, bucket_count: int):
+        self.successes = 0
+        self.failures = 0
+        self.failures_by_type: Counter = Counter()
+        # One count per bucket upper bound plus a final one for +Inf, not cumulative
+        self.bucket_counts: List[int] = [0] * (bucket_count + 1)
+        self.duration_sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.successes + self.failures
+
+
+class MetricsAggregator:
+    """
+    In-memory observer aggregating run_catching outcomes per wrapped callable.
+
+    Register it with add_observer() and read the figures with snapshot() or
+    export them in the Prometheus text format with to_prometheus() and
+    write_prometheus().
+
+    Example:
+        metrics = MetricsAggregator()
+        add_observer(metrics)
+        ...
+        metrics.write_prometheus("/var/lib/node_exporter/kotresult.prom")
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be sorted in increasing order")
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, FunctionStats] = {}
+
+    def __call__(self, name: str, result: Result, duration: float) -> None:
+        bucket = bisect_left(self.buckets, duration)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = FunctionStats(len(self.buckets))
+            if result._is_failure:
+                stats.failures += 1
+                stats.failures_by_type[_exception_name(result._value)] += 1
+            else:
+                stats.successes += 1
+            stats.bucket_counts[bucket] += 1
+            stats.duration_sum += duration
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Return a copy of the aggregated figures, keyed by callable name"""
+        with self._lock:
+            return {
+                name: {
+                    'successes': stats.successes,
+                    'failures': stats.failures,
+                    'failures_by_type': dict(stats.failures_by_type),
+                    'bucket_counts': list(stats.bucket_counts),
+                    'duration_sum': stats.duration_sum,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self, prefix: str = "kotresult") -> str:
+        """Render the figures in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Wrapped calls by outcome.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for name, stats in snapshot.items():
+            label = _escape(name)
+            lines.append(f'{prefix}_calls_total{{function="{label}",outcome="success"}} {stats["successes"]}')
+            lines.append(f'{prefix}_calls_total{{function="{label}",outcome="failure"}} {stats["failures"]}')
+
+        lines += [
+            f"# HELP {prefix}_failures_total Failed calls by exception type.",
+            f"# TYPE {prefix}_failures_total counter",
+        ]
+        for name, stats in snapshot.items():
+            label = _escape(name)
+            for exception_type, count in sorted(stats['failures_by_type'].items()):
+                lines.append(
+                    f'{prefix}_failures_total{{function="{label}",exception="{_escape(exception_type)}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds Duration of wrapped calls.",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for name, stats in snapshot.items():
+            label = _escape(name)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), stats['bucket_counts']):
+                cumulative += count
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{function="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{function="{label}"}} {stats["duration_sum"]!r}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{function="{label}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, target: Union[str, os.PathLike, IO[str]], prefix: str = "kotresult") -> None:
+        """
+        Write the Prometheus text to a file object or a path.
+
+        Paths are written to a temporary file that is then renamed over the
+        target, so a collector reading the file never sees a partial write.
+        """
+        text = self.to_prometheus(prefix)
+        if hasattr(target, 'write'):
+            target.write(text)
+            return
+        directory = os.path.dirname(os.path.abspath(target))
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(temporary, target)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def _exception_name(exception: BaseException) -> str:
+    # Qualified by module, as exception types in different modules may share a name;
+    # a FailureInfo is counted as the type it stands for
+    if isinstance(exception, FailureInfo):
+        return f"{exception.module}.{exception.type_name}"
+    exception_type = type(exception)
+    return f"{exception_type.__module__}.{exception_type.__qualname__}"
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import warnings
+from collections.abc import Callable
+
+# The precise signatures, such as the Observer type, live in observers.pyi so that
+# typing is not imported at runtime.
+
+
+class _ObserverRegistry:
+    # The observers are kept in a tuple that is replaced as a whole under the lock,
+    # so the hot paths only read one attribute and never see a half-updated list.
+    __slots__ = ('observers', '_lock')
+
+    def __init__(self):
+        self.observers: tuple = ()
+        self._lock = threading.Lock()
+
+    def add(self, observer: Callable) -> None:
+        with self._lock:
+            self.observers = self.observers + (observer,)
+
+    def remove(self, observer: Callable) -> None:
+        with self._lock:
+            observers = list(self.observers)
+            observers.remove(observer)
+            self.observers = tuple(observers)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.observers = ()
+
+
+registry = _ObserverRegistry()
+
+
+def add_observer(observer: Callable) -> None:
+    """
+    Register a callable notified of every outcome of run_catching, run_catching_with,
+    run_catching_async and the Result map_catching/recover_catching methods.
+
+    The observer is called as observer(name, result, duration) where name is the
+    qualified name of the wrapped callable and duration is in seconds. When no
+    observer is registered, the instrumented calls skip timing altogether.
+    Exceptions raised by an observer are turned into a RuntimeWarning.
+    """
+    registry.add(observer)
+
+
+def remove_observer(observer: Callable) -> None:
+    """Unregister an observer. Raises ValueError if it was not registered."""
+    registry.remove(observer)
+
+
+def clear_observers() -> None:
+    """Unregister all observers"""
+    registry.clear()
+
+
+def callable_name(func: Callable) -> str:
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None)
+    if name is None:
+        return repr(func)
+    module = getattr(func, '__module__', None)
+    return f"{module}.{name}" if module else name
+
+
+def notify(func: Callable, result, duration: float) -> None:
+    name = callable_name(func)
+    for observer in registry.observers:
+        try:
+            observer(name, result, duration)
+        except Exception as e:
+            warnings.warn(f"kotresult observer {observer!r} raised {e!r}", RuntimeWarning, stacklevel=2)
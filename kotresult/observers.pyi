@@ -0,0 +1,22 @@
+from typing import Any, Callable, Tuple
+
+from kotresult.result import Result
+
+# An observer is called with the name of the wrapped callable, the Result it
+# produced and the call duration in seconds.
+_Observer = Callable[[str, Result[Any], float], None]
+
+class _ObserverRegistry:
+    observers: Tuple[_Observer, ...]
+
+    def add(self, observer: _Observer) -> None: ...
+    def remove(self, observer: _Observer) -> None: ...
+    def clear(self) -> None: ...
+
+registry: _ObserverRegistry
+
+def add_observer(observer: _Observer) -> None: ...
+def remove_observer(observer: _Observer) -> None: ...
+def clear_observers() -> None: ...
+def callable_name(func: Callable[..., Any]) -> str: ...
+def notify(func: Callable[..., Any], result: Result[Any], duration: float) -> None: ...
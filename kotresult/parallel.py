@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pickle
+import traceback
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from kotresult.capture import capture
+from kotresult.result import Result
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class WorkerError(Exception):
+    """
+    Picklable stand-in for an exception that could not be sent back from a worker process.
+
+    Attributes:
+        type_name: Qualified name of the original exception type
+        message: str() of the original exception
+        traceback: Formatted traceback of the original exception, captured in the worker
+    """
+
+    def __init__(self, type_name: str, message: str, traceback: str = ""):
+        super().__init__(type_name, message, traceback)
+        self.type_name = type_name
+        self.message = message
+        self.traceback = traceback
+
+    def __str__(self) -> str:
+        return f"{self.type_name}: {self.message}"
+
+
+def _ensure_picklable(exception: BaseException) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        exception_type = type(exception)
+        return WorkerError(
+            f"{exception_type.__module__}.{exception_type.__qualname__}",
+            str(exception),
+            "".join(traceback.format_exception(exception_type, exception, exception.__traceback__)),
+        )
+
+
+def _run_chunk(func: Callable[[R], T], chunk: List[R], picklable: bool) -> List[Result[T]]:
+    # Runs inside the worker, so it must stay a module-level function to be picklable.
+    results = []
+    for item in chunk:
+        try:
+            results.append(Result.success(func(item)))
+        except BaseException as e:
+            error = capture(e)
+            results.append(Result.failure(_ensure_picklable(error) if picklable else error))
+    return results
+
+
+def _chunks(iterable: Iterable[R], chunksize: int) -> Iterable[List[R]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_catching_map(
+        func: Callable[[R], T],
+        iterable: Iterable[R],
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+) -> List[Result[T]]:
+    """
+    Call func on every item of iterable in an executor, capturing each outcome as a Result.
+
+    This is the parallel equivalent of [run_catching(func, item) for item in iterable].
+    Items are submitted in chunks of chunksize; larger chunks reduce the per-task
+    overhead, which matters most for a ProcessPoolExecutor.
+
+    When the executor is a ProcessPoolExecutor, exceptions that cannot be pickled
+    are replaced in the worker by a WorkerError carrying the original type name,
+    message and formatted traceback. If a whole chunk fails to run or to come back
+    (e.g. a return value cannot be pickled or the pool breaks), every item of that
+    chunk gets the chunk's exception as its failure.
+
+    Args:
+        func: The function to call on each item
+        iterable: The items to process
+        executor: The executor to run on. If omitted, a ThreadPoolExecutor is created
+            for the duration of the call
+        chunksize: Number of items sent to a worker per task
+        ordered: Return results in input order if True, in completion order otherwise
+
+    Returns:
+        A list with one Result per input item
+
+    Example:
+        with ProcessPoolExecutor() as pool:
+            results = run_catching_map(validate, records, executor=pool, chunksize=256)
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if executor is None:
+        with ThreadPoolExecutor() as own_executor:
+            return run_catching_map(func, iterable, own_executor, chunksize, ordered)
+
+    picklable = isinstance(executor, ProcessPoolExecutor)
+    futures: Dict[Future, int] = {}
+    sizes: List[int] = []
+    for chunk in _chunks(iterable, chunksize):
+        futures[executor.submit(_run_chunk, func, chunk, picklable)] = len(sizes)
+        sizes.append(len(chunk))
+
+    def collect(future: Future) -> List[Result[T]]:
+        # Only Exception: a KeyboardInterrupt or SystemExit raised here comes from the
+        # waiting thread, not from the chunk, and must stop the wait
+        try:
+            return future.result()
+        except Exception as e:
+            return [Result.failure(capture(e))] * sizes[futures[future]]
+
+    results: List[Result[T]] = []
+    for future in (futures if ordered else as_completed(futures)):
+        results.extend(collect(future))
+    return results
@@ -1,57 +1,136 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Union, Callable
+import sys
+from collections.abc import Awaitable, Callable
+from time import perf_counter
 
-T = TypeVar('T')
-R = TypeVar('R')
+from kotresult._compat import Generic
+from kotresult.capture import capture
+from kotresult.observers import notify, registry
 
+# The generic signatures live in result.pyi, so that typing is not imported at
+# runtime while the annotations left here still resolve with typing.get_type_hints().
+# The module is also compiled by mypyc (see build_mypyc.py), which does not support
+# runtime code in an else branch of TYPE_CHECKING, hence the Generic shim imported
+# from _compat.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import TypeVar
 
-class Result(Generic[T]):
-    def __init__(self, value: Union[T, BaseException]):
+    T = TypeVar('T')
+
+FAILURE_EQUALITY_POLICIES = ('identity', 'args', 'message')
+
+# How failure Results are compared and hashed, see set_failure_equality().
+_failure_equality = 'args'
+
+
+def set_failure_equality(policy: str) -> None:
+    """
+    Choose how failure Results are compared and hashed.
+
+    - 'args' (default): same exception type and equal args
+    - 'message': same exception type and equal str() of the exceptions
+    - 'identity': the very same exception object
+
+    Set the policy once at startup: a failure caches its hash the first time it is
+    hashed, and changing the policy while Results sit in sets or dicts breaks them.
+    """
+    global _failure_equality
+    if policy not in FAILURE_EQUALITY_POLICIES:
+        raise ValueError(f"policy must be one of {FAILURE_EQUALITY_POLICIES}, got {policy!r}")
+    _failure_equality = policy
+
+
+def get_failure_equality() -> str:
+    """Return the current failure equality policy"""
+    return _failure_equality
+
+
+def _failure_hash(exception: BaseException) -> int:
+    if _failure_equality == 'args':
+        try:
+            return hash(("failure", type(exception), exception.args))
+        except TypeError:
+            # Unhashable args: equal failures still share their type
+            return hash(("failure", type(exception)))
+    if _failure_equality == 'message':
+        return hash(("failure", type(exception), str(exception)))
+    return object.__hash__(exception)
+
+
+# LazyResult, looked up on the first call to Result.lazy(): an import statement
+# on every call would cost more than the chained steps it records.
+_lazy_result: Callable | None = None
+
+
+def _is_cancelled_error(exception: BaseException) -> bool:
+    # A coroutine can only be cancelled while asyncio is running, so look the
+    # module up instead of importing it eagerly along with this one.
+    asyncio = sys.modules.get('asyncio')
+    return asyncio is not None and isinstance(exception, asyncio.CancelledError)
+
+
+class Result(Generic['T']):
+    # The success/failure tag is fixed once at construction so that state
+    # checks are plain attribute reads rather than isinstance() calls.
+    # The hash of a failure is cached in _hash the first time it is computed.
+    # _value and _is_failure are only written by __init__, and threads racing to
+    # fill _hash all store the same value, as CPython does for the hash of a str,
+    # so a Result can be shared between threads without locking, including on
+    # free-threaded builds. Immutability is a convention: the slots are private
+    # and nothing stops code from writing them.
+    __slots__ = ('_value', '_is_failure', '_hash')
+    # Declared for mypyc; _value, holding a T or a BaseException, is left untyped.
+    _is_failure: bool
+    _hash: int
+
+    def __init__(self, value) -> None:
         self._value = value
+        self._is_failure = isinstance(value, BaseException)
 
     @staticmethod
-    def success(value: T) -> Result[T]:
+    def success(value) -> Result:
         return Result(value)
 
     @staticmethod
-    def failure(exception: BaseException) -> Result[T]:
+    def failure(exception: BaseException) -> Result:
         return Result(exception)
 
     @property
-    def is_success(self):
-        return not isinstance(self._value, BaseException)
+    def is_success(self) -> bool:
+        return not self._is_failure
 
     @property
-    def is_failure(self):
-        return isinstance(self._value, BaseException)
+    def is_failure(self) -> bool:
+        return self._is_failure
 
     def to_string(self) -> str:
-        if self.is_success:
+        if not self._is_failure:
             return "Success({})".format(self._value)
         return "Failure({})".format(self._value)
 
-    def get_or_null(self) -> Union[T, None]:
-        if self.is_success:
+    def get_or_null(self):
+        if not self._is_failure:
             return self._value
         return None
 
-    def exception_or_null(self) -> Union[BaseException, None]:
-        if self.is_failure:
+    def exception_or_null(self):
+        if self._is_failure:
             return self._value
         return None
 
     # Python naming convention aliases
-    def get_or_none(self) -> Union[T, None]:
+    def get_or_none(self):
         """Alias for get_or_null() for Python naming convention"""
         return self.get_or_null()
 
-    def exception_or_none(self) -> Union[BaseException, None]:
+    def exception_or_none(self):
         """Alias for exception_or_null() for Python naming convention"""
         return self.exception_or_null()
 
     def throw_on_failure(self) -> None:
-        if self.is_failure:
+        if self._is_failure:
             raise self._value
 
     # Python naming convention alias
@@ -59,67 +138,149 @@ class Result(Generic[T]):
         """Alias for throw_on_failure() for Python naming convention"""
         return self.throw_on_failure()
 
-    def get_or_default(self, default_value: R) -> Union[T, R]:
-        if self.is_success:
+    def get_or_default(self, default_value):
+        if not self._is_failure:
             return self._value
         return default_value
 
-    def get_or_throw(self) -> T:
-        if self.is_success:
+    def get_or_throw(self):
+        if not self._is_failure:
             return self._value
         raise self._value
 
     # Python naming convention alias
-    def get_or_raise(self) -> T:
+    def get_or_raise(self):
         """Alias for get_or_throw() for Python naming convention"""
         return self.get_or_throw()
 
-    def on_success(self, callback: Callable[[T], None]) -> Result[T]:
-        if self.is_success:
+    def on_success(self, callback: Callable) -> Result:
+        if not self._is_failure:
             callback(self._value)
         return self
 
-    def on_failure(self, callback: Callable[[BaseException], None]) -> Result[T]:
-        if self.is_failure:
+    def on_failure(self, callback: Callable) -> Result:
+        if self._is_failure:
             callback(self._value)
         return self
 
-    def map(self, transform: Callable[[T], R]) -> Result[R]:
-        if self.is_success:
+    def map(self, transform: Callable) -> Result:
+        if not self._is_failure:
             return Result.success(transform(self._value))
         return Result.failure(self._value)
 
-    def map_catching(self, transform: Callable[[T], R]) -> Result[R]:
-        if self.is_success:
+    def map_catching(self, transform: Callable) -> Result:
+        if not self._is_failure:
+            start = perf_counter() if registry.observers else None
             try:
-                return Result.success(transform(self._value))
+                result = Result.success(transform(self._value))
             except BaseException as e:
-                return Result.failure(e)
+                result = Result.failure(capture(e))
+            if start is not None:
+                notify(transform, result, perf_counter() - start)
+            return result
         return Result.failure(self._value)
 
-    def recover(self, transform: Callable[[BaseException], T]) -> Result[T]:
-        if self.is_failure:
+    def recover(self, transform: Callable) -> Result:
+        if self._is_failure:
             return Result.success(transform(self._value))
         return self
 
-    def recover_catching(self, transform: Callable[[BaseException], T]) -> Result[T]:
-        if self.is_failure:
+    def recover_catching(self, transform: Callable) -> Result:
+        if self._is_failure:
+            start = perf_counter() if registry.observers else None
             try:
-                return Result.success(transform(self._value))
+                result = Result.success(transform(self._value))
             except BaseException as e:
-                return Result.failure(e)
+                result = Result.failure(capture(e))
+            if start is not None:
+                notify(transform, result, perf_counter() - start)
+            return result
         return self
 
-    def fold(self, on_success: Callable[[T], R], on_failure: Callable[[BaseException], R]) -> R:
-        if self.is_success:
+    def fold(self, on_success: Callable, on_failure: Callable):
+        if not self._is_failure:
             return on_success(self._value)
         return on_failure(self._value)
 
-    def get_or_else(self, on_failure: Callable[[BaseException], T]) -> T:
-        if self.is_success:
+    def get_or_else(self, on_failure: Callable):
+        if not self._is_failure:
             return self._value
         return on_failure(self._value)
 
+    def lazy(self):
+        """
+        Start a lazy pipeline on this Result.
+        The chained steps are recorded and only run, in a single pass, by evaluate().
+        """
+        global _lazy_result
+        if _lazy_result is None:
+            from kotresult.lazy import LazyResult
+            _lazy_result = LazyResult
+        return _lazy_result(self)
+
+    def to_dict(self) -> dict:
+        """
+        Convert to a JSON-compatible dict.
+        A success becomes {"success": true, "value": ...} and a failure
+        {"success": false, "error": {"type": ..., "module": ..., "args": [...]}}, without traceback.
+        """
+        from kotresult.codec import result_to_dict
+        return result_to_dict(self)
+
+    @staticmethod
+    def from_dict(data: dict, registry=None) -> Result:
+        """
+        Rebuild a Result from to_dict() output.
+        The exception type of a failure is looked up in the exception registry, see kotresult.codec.
+        """
+        from kotresult.codec import result_from_dict
+        return result_from_dict(data, registry)
+
+    # Async variants: the transforms may be coroutine functions or plain callables.
+    # asyncio.CancelledError is never captured so that task cancellation still works.
+    async def map_async(self, transform: Callable) -> Result:
+        if not self._is_failure:
+            value = transform(self._value)
+            if isinstance(value, Awaitable):
+                value = await value
+            return Result.success(value)
+        return Result.failure(self._value)
+
+    async def map_catching_async(self, transform: Callable) -> Result:
+        if not self._is_failure:
+            try:
+                value = transform(self._value)
+                if isinstance(value, Awaitable):
+                    value = await value
+                return Result.success(value)
+            except BaseException as e:
+                if _is_cancelled_error(e):
+                    raise
+                return Result.failure(capture(e))
+        return Result.failure(self._value)
+
+    async def recover_catching_async(self, transform: Callable) -> Result:
+        if self._is_failure:
+            try:
+                value = transform(self._value)
+                if isinstance(value, Awaitable):
+                    value = await value
+                return Result.success(value)
+            except BaseException as e:
+                if _is_cancelled_error(e):
+                    raise
+                return Result.failure(capture(e))
+        return self
+
+    async def fold_async(self, on_success: Callable, on_failure: Callable):
+        if not self._is_failure:
+            value = on_success(self._value)
+        else:
+            value = on_failure(self._value)
+        if isinstance(value, Awaitable):
+            value = await value
+        return value
+
     # Python special methods
     def __str__(self) -> str:
         """String representation of the Result"""
@@ -127,7 +288,7 @@ class Result(Generic[T]):
 
     def __repr__(self) -> str:
         """Detailed representation of the Result"""
-        if self.is_success:
+        if not self._is_failure:
             return f"Result.success({repr(self._value)})"
         return f"Result.failure({repr(self._value)})"
 
@@ -135,10 +296,18 @@ class Result(Generic[T]):
         """Check equality between Results"""
         if not isinstance(other, Result):
             return False
-        if self.is_success and other.is_success:
+        if self._is_failure != other._is_failure:
+            return False
+        if not self._is_failure:
             return self._value == other._value
-        if self.is_failure and other.is_failure:
-            return type(self._value) == type(other._value) and str(self._value) == str(other._value)
+        exception = self._value
+        other_exception = other._value
+        if exception is other_exception:
+            return True
+        if _failure_equality == 'args':
+            return type(exception) is type(other_exception) and exception.args == other_exception.args
+        if _failure_equality == 'message':
+            return type(exception) is type(other_exception) and str(exception) == str(other_exception)
         return False
 
     def __ne__(self, other) -> bool:
@@ -147,6 +316,14 @@ class Result(Generic[T]):
 
     def __hash__(self) -> int:
         """Hash the Result for use in sets and dicts"""
-        if self.is_success:
+        if not self._is_failure:
             return hash(("success", self._value))
-        return hash(("failure", type(self._value).__name__, str(self._value)))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = _failure_hash(self._value)
+            return self._hash
+
+    def __reduce__(self):
+        """Pickle through the constructor, which both the pure-Python and the compiled build support"""
+        return Result, (self._value,)
@@ -0,0 +1,64 @@
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar, Union
+
+from kotresult.codec import ExceptionRegistry
+from kotresult.lazy import LazyResult
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+FAILURE_EQUALITY_POLICIES: Tuple[str, ...]
+
+def set_failure_equality(policy: str) -> None: ...
+def get_failure_equality() -> str: ...
+
+class Result(Generic[_T]):
+    _value: Any
+    _is_failure: bool
+    _hash: int
+
+    def __init__(self, value: Union[_T, BaseException]) -> None: ...
+    @staticmethod
+    def success(value: _T) -> Result[_T]: ...
+    @staticmethod
+    def failure(exception: BaseException) -> Result[_T]: ...
+    @property
+    def is_success(self) -> bool: ...
+    @property
+    def is_failure(self) -> bool: ...
+    def to_string(self) -> str: ...
+    def get_or_null(self) -> Optional[_T]: ...
+    def exception_or_null(self) -> Optional[BaseException]: ...
+    def get_or_none(self) -> Optional[_T]: ...
+    def exception_or_none(self) -> Optional[BaseException]: ...
+    def throw_on_failure(self) -> None: ...
+    def raise_on_failure(self) -> None: ...
+    def get_or_default(self, default_value: _R) -> Union[_T, _R]: ...
+    def get_or_throw(self) -> _T: ...
+    def get_or_raise(self) -> _T: ...
+    def on_success(self, callback: Callable[[_T], None]) -> Result[_T]: ...
+    def on_failure(self, callback: Callable[[BaseException], None]) -> Result[_T]: ...
+    def map(self, transform: Callable[[_T], _R]) -> Result[_R]: ...
+    def map_catching(self, transform: Callable[[_T], _R]) -> Result[_R]: ...
+    def recover(self, transform: Callable[[BaseException], _T]) -> Result[_T]: ...
+    def recover_catching(self, transform: Callable[[BaseException], _T]) -> Result[_T]: ...
+    def fold(self, on_success: Callable[[_T], _R], on_failure: Callable[[BaseException], _R]) -> _R: ...
+    def get_or_else(self, on_failure: Callable[[BaseException], _T]) -> _T: ...
+    def lazy(self) -> LazyResult[_T, _T]: ...
+    def to_dict(self) -> Dict[str, Any]: ...
+    @staticmethod
+    def from_dict(data: Dict[str, Any], registry: Optional[ExceptionRegistry] = ...) -> Result[Any]: ...
+    async def map_async(self, transform: Callable[[_T], Union[_R, Awaitable[_R]]]) -> Result[_R]: ...
+    async def map_catching_async(self, transform: Callable[[_T], Union[_R, Awaitable[_R]]]) -> Result[_R]: ...
+    async def recover_catching_async(
+            self,
+            transform: Callable[[BaseException], Union[_T, Awaitable[_T]]],
+    ) -> Result[_T]: ...
+    async def fold_async(
+            self,
+            on_success: Callable[[_T], Union[_R, Awaitable[_R]]],
+            on_failure: Callable[[BaseException], Union[_R, Awaitable[_R]]],
+    ) -> _R: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __ne__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
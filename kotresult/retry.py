@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable
+from typing import Callable, Iterator, NamedTuple, Optional, Tuple, Type, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.capture import exception_matches
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+
+class RetryOutcome(NamedTuple):
+    """
+    The final Result of a retried call together with how it was obtained.
+
+    Attributes:
+        result: The Result of the last attempt
+        attempts: Number of times the function was called
+        elapsed: Seconds spent in total, sleeps included
+        delays: The sleeps taken between attempts, in seconds
+    """
+    result: Result
+    attempts: int
+    elapsed: float
+    delays: Tuple[float, ...]
+
+
+def _delays(backoff: float, max_backoff: float, jitter: bool) -> Iterator[float]:
+    if jitter:
+        # Decorrelated jitter: each sleep is drawn between the base delay and
+        # three times the previous sleep, capped at max_backoff.
+        delay = backoff
+        while True:
+            delay = min(max_backoff, random.uniform(backoff, delay * 3))
+            yield delay
+    else:
+        delay = backoff
+        while True:
+            yield min(max_backoff, delay)
+            delay *= 2
+
+
+def _check_arguments(attempts: int, backoff: float, max_backoff: float) -> None:
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1")
+    if backoff < 0 or max_backoff < 0:
+        raise ValueError("backoff and max_backoff must not be negative")
+
+
+def _should_retry(result: Result, retry_on: Tuple[Type[BaseException], ...]) -> bool:
+    return result._is_failure and exception_matches(result._value, retry_on)
+
+
+def run_catching_retry(
+        func: Callable[..., T],
+        *args,
+        attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        deadline: Optional[float] = None,
+        **kwargs,
+) -> RetryOutcome:
+    """
+    Call func through run_catching, retrying failures with exponential backoff.
+
+    Only failures whose exception is an instance of one of the retry_on types are
+    retried; any other outcome is returned straight away. A FailureInfo stored by
+    the failure_info capture option matches the types of the exception it replaced.
+    Between attempts the call sleeps with decorrelated-jitter exponential backoff,
+    or plain doubling delays when jitter is False.
+
+    The deadline bounds the total time: no new attempt is started if its backoff
+    sleep would end past the deadline. An attempt that is already running is not
+    interrupted; combine with a timeout for that.
+
+    Args:
+        func: The function to call
+        *args: Positional arguments for func
+        attempts: Maximum number of calls, including the first one
+        backoff: Base delay in seconds
+        max_backoff: Upper bound for a single delay in seconds
+        jitter: Use decorrelated jitter if True, plain exponential delays otherwise
+        retry_on: Exception types that trigger a retry
+        deadline: Total time budget in seconds, measured from the first call
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        A RetryOutcome holding the last Result and the attempt metadata
+
+    Example:
+        outcome = run_catching_retry(fetch, url, attempts=5, retry_on=(ConnectionError,), deadline=2.0)
+        body = outcome.result.get_or_throw()
+    """
+    _check_arguments(attempts, backoff, max_backoff)
+    start = time.monotonic()
+    delays = []
+    schedule = _delays(backoff, max_backoff, jitter)
+    result = run_catching(func, *args, **kwargs)
+    attempt = 1
+    while attempt < attempts and _should_retry(result, retry_on):
+        delay = next(schedule)
+        if deadline is not None and time.monotonic() + delay - start >= deadline:
+            break
+        time.sleep(delay)
+        delays.append(delay)
+        result = run_catching(func, *args, **kwargs)
+        attempt += 1
+    return RetryOutcome(result, attempt, time.monotonic() - start, tuple(delays))
+
+
+async def run_catching_retry_async(
+        func: Callable[..., Union[T, Awaitable[T]]],
+        *args,
+        attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        deadline: Optional[float] = None,
+        **kwargs,
+) -> RetryOutcome:
+    """
+    asyncio version of run_catching_retry.
+
+    Calls func through run_catching_async, so coroutine functions are awaited,
+    and sleeps between attempts with asyncio.sleep.
+    """
+    _check_arguments(attempts, backoff, max_backoff)
+    start = time.monotonic()
+    delays = []
+    schedule = _delays(backoff, max_backoff, jitter)
+    result = await run_catching_async(func, *args, **kwargs)
+    attempt = 1
+    while attempt < attempts and _should_retry(result, retry_on):
+        delay = next(schedule)
+        if deadline is not None and time.monotonic() + delay - start >= deadline:
+            break
+        await asyncio.sleep(delay)
+        delays.append(delay)
+        result = await run_catching_async(func, *args, **kwargs)
+        attempt += 1
+    return RetryOutcome(result, attempt, time.monotonic() - start, tuple(delays))
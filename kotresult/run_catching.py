@@ -1,19 +1,26 @@
-from typing import Callable, TypeVar
+from __future__ import annotations
 
-from kotresult.result import Result
+from collections.abc import Callable
+from time import perf_counter
 
-T = TypeVar('T')
-R = TypeVar('R')
+from kotresult.capture import capture
+from kotresult.observers import notify, registry
+from kotresult.result import Result
 
 
-def run_catching(func: Callable[..., T], *args, **kwargs) -> Result[T]:
+def run_catching(func: Callable, *args, **kwargs) -> Result:
+    # Calls are only timed while an observer is registered
+    start = perf_counter() if registry.observers else None
     try:
-        return Result.success(func(*args, **kwargs))
+        result = Result.success(func(*args, **kwargs))
     except BaseException as e:
-        return Result.failure(e)
+        result = Result.failure(capture(e))
+    if start is not None:
+        notify(func, result, perf_counter() - start)
+    return result
 
 
-def run_catching_with(receiver: T, func: Callable[..., R], *args, **kwargs) -> Result[R]:
+def run_catching_with(receiver, func: Callable, *args, **kwargs) -> Result:
     """
     Execute a function with a receiver object as the first argument.
     This is similar to Kotlin's extension function version of runCatching.
@@ -39,7 +46,11 @@ def run_catching_with(receiver: T, func: Callable[..., R], *args, **kwargs) -> R
         # Kotlin: "hello".runCatching { this.toUpperCase() }
         # Python: run_catching_with("hello", str.upper)
     """
+    start = perf_counter() if registry.observers else None
     try:
-        return Result.success(func(receiver, *args, **kwargs))
+        result = Result.success(func(receiver, *args, **kwargs))
     except BaseException as e:
-        return Result.failure(e)
+        result = Result.failure(capture(e))
+    if start is not None:
+        notify(func, result, perf_counter() - start)
+    return result
@@ -0,0 +1,9 @@
+from typing import Any, Callable, TypeVar
+
+from kotresult.result import Result
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+def run_catching(func: Callable[..., _T], *args: Any, **kwargs: Any) -> Result[_T]: ...
+def run_catching_with(receiver: _T, func: Callable[..., _R], *args: Any, **kwargs: Any) -> Result[_R]: ...
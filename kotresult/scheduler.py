@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import warnings
+from collections.abc import AsyncIterable
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.observers import callable_name
+from kotresult.run_catching import run_catching
+
+# Seconds a blocked thread waits before checking whether the run was closed
+_POLL_INTERVAL = 0.05
+# Marks the end of the input on a queue
+_DONE = object()
+
+
+class DeadLetter(NamedTuple):
+    """An item that failed: the stage that failed, the input of that stage and the exception"""
+    stage: str
+    item: Any
+    exception: BaseException
+
+
+class StageStats(NamedTuple):
+    """
+    Figures of one stage of a run.
+
+    throughput is in items per second, measured from the start of the run to now,
+    or to its end once it has finished.
+    """
+    name: str
+    workers: int
+    processed: int
+    failed: int
+    queue_depth: int
+    queue_size: int
+    throughput: float
+
+
+class _Stage:
+    __slots__ = ('func', 'name', 'workers', 'queue_size', 'processed', 'failed', 'lock', 'queue')
+
+    def __init__(self, func: Callable, name: str, workers: int, queue_size: int):
+        self.func = func
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.processed = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+        self.queue = None
+
+
+class _StagedPipeline:
+    def __init__(self, queue_size: int = 128, dead_letter: Optional[Callable[[DeadLetter], None]] = None):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.queue_size = queue_size
+        self._dead_letter = dead_letter
+        self._stages: List[_Stage] = []
+        self._running = False
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        # Failures collected when no dead letter sink is given
+        self.dead_letters: List[DeadLetter] = []
+
+    def stage(
+            self,
+            func: Callable,
+            workers: int = 1,
+            name: Optional[str] = None,
+            queue_size: Optional[int] = None,
+    ):
+        """
+        Append a stage calling func on every item that went through the previous stages.
+
+        Args:
+            func: The function of the stage, called with one item
+            workers: Number of workers running the stage concurrently
+            name: Name used in stats and dead letters. Defaults to the function's name
+            queue_size: Capacity of the queue feeding the stage. Defaults to the pipeline's queue_size
+
+        Returns:
+            The pipeline itself, so stage() calls can be chained
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size is not None and queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if self._running:
+            raise RuntimeError("cannot add a stage while the pipeline is running")
+        self._stages.append(_Stage(func, name or callable_name(func), workers, queue_size or self.queue_size))
+        return self
+
+    def stats(self) -> List[StageStats]:
+        """Return the figures of every stage for the current or last run"""
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or perf_counter()) - self._started
+        stats = []
+        for stage in self._stages:
+            with stage.lock:
+                processed, failed = stage.processed, stage.failed
+            stats.append(StageStats(
+                stage.name,
+                stage.workers,
+                processed,
+                failed,
+                stage.queue.qsize() if stage.queue is not None else 0,
+                stage.queue_size,
+                processed / elapsed if elapsed > 0 else 0.0,
+            ))
+        return stats
+
+    def _start(self) -> None:
+        if not self._stages:
+            raise ValueError("the pipeline has no stage")
+        if self._running:
+            raise RuntimeError("the pipeline is already running")
+        self._running = True
+        self.dead_letters = []
+        for stage in self._stages:
+            stage.processed = stage.failed = 0
+        self._started = perf_counter()
+        self._finished = None
+
+    def _finish(self) -> None:
+        self._finished = perf_counter()
+        self._running = False
+
+    def _fail(self, stage: _Stage, item: Any, exception: BaseException) -> None:
+        with stage.lock:
+            stage.failed += 1
+        letter = DeadLetter(stage.name, item, exception)
+        if self._dead_letter is None:
+            self.dead_letters.append(letter)
+            return
+        try:
+            self._dead_letter(letter)
+        except Exception as e:
+            warnings.warn(f"kotresult dead letter sink {self._dead_letter!r} raised {e!r}", RuntimeWarning)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{stage.name}x{stage.workers}" for stage in self._stages)
+        return f"{type(self).__name__}([{stages}])"
+
+
+def _put(target: queue.Queue, item: Any, closed: threading.Event) -> bool:
+    while True:
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            if closed.is_set():
+                return False
+
+
+def _get(source: queue.Queue, closed: threading.Event) -> Any:
+    while True:
+        try:
+            return source.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            if closed.is_set():
+                return _DONE
+
+
+class WorkPipeline(_StagedPipeline):
+    """
+    A chain of stages connected by bounded queues and run by pools of worker threads.
+
+    Every stage calls its function through run_catching. A success is passed on to
+    the next stage; a failure skips the remaining stages and is sent to the dead
+    letter sink as a DeadLetter. The values that went through every stage are
+    yielded by run() in completion order. As the queues are bounded, the source is
+    read no faster than the slowest stage and the consumer allow.
+
+    Args:
+        queue_size: Default capacity of the queue in front of each stage and of the output queue
+        dead_letter: Called with a DeadLetter for every failure, from the worker threads.
+            If omitted, failures are collected in the dead_letters list
+
+    Example:
+        pipeline = WorkPipeline(dead_letter=log_failure).stage(fetch, workers=16).stage(parse, workers=4)
+        for record in pipeline.run(urls):
+            store(record)
+        print(pipeline.stats())
+    """
+
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Feed items through the stages and yield the values coming out of the last one.
+
+        Closing the iterator early stops every worker. An exception raised by the
+        items iterable itself is re-raised once the items read before it are done.
+        """
+        self._start()
+        stages = self._stages
+        queues = [queue.Queue(stage.queue_size) for stage in stages] + [queue.Queue(self.queue_size)]
+        for stage, inbox in zip(stages, queues):
+            stage.queue = inbox
+        closed = threading.Event()
+        source_errors: List[BaseException] = []
+
+        threads = [threading.Thread(
+            target=self._feed, args=(items, queues[0], stages[0].workers, closed, source_errors), daemon=True)]
+        for index, stage in enumerate(stages):
+            next_workers = stages[index + 1].workers if index + 1 < len(stages) else 1
+            remaining = [stage.workers]
+            threads += [
+                threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1], next_workers, remaining, closed),
+                    daemon=True,
+                )
+                for _ in range(stage.workers)
+            ]
+        for thread in threads:
+            thread.start()
+
+        output = queues[-1]
+        try:
+            while True:
+                value = output.get()
+                if value is _DONE:
+                    break
+                yield value
+        finally:
+            closed.set()
+            for thread in threads:
+                thread.join()
+            self._finish()
+        if source_errors:
+            raise source_errors[0]
+
+    @staticmethod
+    def _feed(
+            items: Iterable[Any],
+            inbox: queue.Queue,
+            workers: int,
+            closed: threading.Event,
+            errors: List[BaseException],
+    ) -> None:
+        try:
+            for item in items:
+                if not _put(inbox, item, closed):
+                    return
+        except BaseException as e:
+            errors.append(e)
+        for _ in range(workers):
+            if not _put(inbox, _DONE, closed):
+                return
+
+    def _work(
+            self,
+            stage: _Stage,
+            inbox: queue.Queue,
+            outbox: queue.Queue,
+            next_workers: int,
+            remaining: List[int],
+            closed: threading.Event,
+    ) -> None:
+        while True:
+            item = _get(inbox, closed)
+            if item is _DONE or closed.is_set():
+                break
+            result = run_catching(stage.func, item)
+            with stage.lock:
+                stage.processed += 1
+            if result._is_failure:
+                self._fail(stage, item, result._value)
+            elif not _put(outbox, result._value, closed):
+                return
+        # The last worker of the stage to finish tells the next stage the input is over
+        with stage.lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(next_workers):
+                if not _put(outbox, _DONE, closed):
+                    return
+
+
+class AsyncWorkPipeline(_StagedPipeline):
+    """
+    asyncio version of WorkPipeline.
+
+    Stage functions may be coroutine functions or plain callables, called through
+    run_catching_async by worker tasks; a plain callable runs on the event loop, so
+    blocking work should be moved to an executor by the function itself. The items
+    may be an iterable or an async iterable.
+
+    Example:
+        pipeline = AsyncWorkPipeline().stage(fetch, workers=50).stage(parse)
+        async for record in pipeline.run(urls):
+            await store(record)
+    """
+
+    async def run(self, items: Union[Iterable[Any], AsyncIterable]) -> AsyncIterator[Any]:
+        """
+        Feed items through the stages and yield the values coming out of the last one.
+
+        Closing the iterator early cancels every worker. An exception raised by the
+        items iterable itself is re-raised once the items read before it are done.
+        """
+        self._start()
+        stages = self._stages
+        queues = [asyncio.Queue(stage.queue_size) for stage in stages] + [asyncio.Queue(self.queue_size)]
+        for stage, inbox in zip(stages, queues):
+            stage.queue = inbox
+        source_errors: List[BaseException] = []
+
+        tasks = [asyncio.ensure_future(self._feed(items, queues[0], stages[0].workers, source_errors))]
+        for index, stage in enumerate(stages):
+            next_workers = stages[index + 1].workers if index + 1 < len(stages) else 1
+            remaining = [stage.workers]
+            tasks += [
+                asyncio.ensure_future(self._work(stage, queues[index], queues[index + 1], next_workers, remaining))
+                for _ in range(stage.workers)
+            ]
+
+        output = queues[-1]
+        try:
+            while True:
+                value = await output.get()
+                if value is _DONE:
+                    break
+                yield value
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._finish()
+        if source_errors:
+            raise source_errors[0]
+
+    @staticmethod
+    async def _feed(
+            items: Union[Iterable[Any], AsyncIterable],
+            inbox: asyncio.Queue,
+            workers: int,
+            errors: List[BaseException],
+    ) -> None:
+        try:
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    await inbox.put(item)
+            else:
+                for item in items:
+                    await inbox.put(item)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            errors.append(e)
+        for _ in range(workers):
+            await inbox.put(_DONE)
+
+    async def _work(
+            self,
+            stage: _Stage,
+            inbox: asyncio.Queue,
+            outbox: asyncio.Queue,
+            next_workers: int,
+            remaining: List[int],
+    ) -> None:
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                break
+            result = await run_catching_async(stage.func, item)
+            with stage.lock:
+                stage.processed += 1
+            if result._is_failure:
+                self._fail(stage, item, result._value)
+            else:
+                await outbox.put(result._value)
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            for _ in range(next_workers):
+                await outbox.put(_DONE)
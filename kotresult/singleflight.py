@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable
+from typing import Callable, Dict, Hashable, Optional, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+
+class _Call:
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Result] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single run_catching call.
+
+    While a call for a key is in flight, other threads asking for the same key
+    wait for it instead of calling the function themselves, and all of them get
+    the very same Result, failures included. Once the call completes the key is
+    forgotten, so the next call runs the function again.
+
+    Example:
+        flight = SingleFlight()
+        result = flight.run_catching(user_id, load_user, user_id)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys with a call currently running"""
+        return len(self._calls)
+
+    def run_catching(self, key: Hashable, func: Callable[..., T], *args, **kwargs) -> Result[T]:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            return call.result
+        try:
+            call.result = run_catching(func, *args, **kwargs)
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    asyncio version of SingleFlight.
+
+    The shared call runs in its own task and every caller awaits it through
+    asyncio.shield, so cancelling one caller, even the one that started the call,
+    does not cancel it for the others. Instances must only be used from one event loop.
+
+    Example:
+        flight = AsyncSingleFlight()
+        result = await flight.run_catching(url, fetch, url)
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys with a call currently running"""
+        return len(self._calls)
+
+    async def run_catching(
+            self,
+            key: Hashable,
+            func: Callable[..., Union[T, Awaitable[T]]],
+            *args,
+            **kwargs,
+    ) -> Result[T]:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_catching_async(func, *args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
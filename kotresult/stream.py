@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from kotresult.batch import ResultBatch
+from kotresult.capture import capture
+from kotresult.result import Result
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def _run_catching(func: Callable[[R], T], items: Iterable[R]) -> Iterator[Result[T]]:
+    # The yield must stay outside the try block, or closing the generator would
+    # capture its GeneratorExit as a failure.
+    for item in items:
+        try:
+            result = Result.success(func(item))
+        except BaseException as e:
+            result = Result.failure(capture(e))
+        yield result
+
+
+def _map_catching(results: Iterator[Result[T]], transform: Callable[[T], R]) -> Iterator[Result[R]]:
+    for result in results:
+        yield result.map_catching(transform)
+
+
+def _recover_catching(results: Iterator[Result[T]], transform: Callable[[BaseException], T]) -> Iterator[Result[T]]:
+    for result in results:
+        yield result.recover_catching(transform)
+
+
+def _max_failures(results: Iterator[Result[T]], limit: int) -> Iterator[Result[T]]:
+    failures = 0
+    for result in results:
+        yield result
+        if result._is_failure:
+            failures += 1
+            if failures >= limit:
+                return
+
+
+class ResultStream(Generic[T]):
+    """
+    A lazy, single-pass stream of Results.
+
+    Every stage is a generator that pulls one item at a time from the stage before
+    it, so memory use stays constant however long the input is, and nothing is
+    read from the source faster than the consumer asks for it.
+
+    Example:
+        with open("events.jsonl") as f:
+            stream = ResultStream.run_catching(json.loads, f).map_catching(validate).max_failures(100)
+            for event in stream.take_successes():
+                store(event)
+    """
+    __slots__ = ('_results',)
+
+    def __init__(self, results: Iterable[Result[T]]):
+        self._results = iter(results)
+
+    @staticmethod
+    def run_catching(func: Callable[[R], T], items: Iterable[R]) -> ResultStream[T]:
+        """Create a stream that calls func on each item as it is pulled"""
+        return ResultStream(_run_catching(func, items))
+
+    def map_catching(self, transform: Callable[[T], R]) -> ResultStream[R]:
+        return ResultStream(_map_catching(self._results, transform))
+
+    def recover_catching(self, transform: Callable[[BaseException], T]) -> ResultStream[T]:
+        return ResultStream(_recover_catching(self._results, transform))
+
+    def max_failures(self, limit: int) -> ResultStream[T]:
+        """
+        Stop the stream once limit failures have gone through.
+        The failure that trips the limit is still yielded; nothing is pulled from
+        the source after it.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        return ResultStream(_max_failures(self._results, limit))
+
+    def fail_fast(self) -> ResultStream[T]:
+        """Stop the stream right after the first failure, which is still yielded"""
+        return self.max_failures(1)
+
+    def take_successes(self, count: Optional[int] = None) -> Iterator[T]:
+        """Yield the success values, skipping failures, up to count values if given"""
+        successes = (result._value for result in self._results if not result._is_failure)
+        if count is None:
+            return successes
+        return islice(successes, count)
+
+    def failures(self) -> Iterator[BaseException]:
+        """Yield the exceptions of failed items, skipping successes"""
+        return (result._value for result in self._results if result._is_failure)
+
+    def batched(self, size: int) -> Iterator[ResultBatch[T]]:
+        """Group the stream into ResultBatch chunks of up to size items"""
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        while True:
+            chunk = list(islice(self._results, size))
+            if not chunk:
+                return
+            yield ResultBatch.from_results(chunk)
+
+    # Python special methods
+    def __iter__(self) -> Iterator[Result[T]]:
+        return self._results
+
+    def __next__(self) -> Result[T]:
+        return next(self._results)
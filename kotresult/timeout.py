@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Awaitable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar, Union
+
+from kotresult.aio import run_catching_async
+from kotresult.observers import callable_name
+from kotresult.result import Result
+from kotresult.run_catching import run_catching
+
+T = TypeVar('T')
+
+# Absolute time.monotonic() value by which the calls of the current context must be done
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('kotresult_deadline', default=None)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide ThreadPoolExecutor used by timed and hedged calls without an executor.
+
+    Its size is the ThreadPoolExecutor default, min(32, CPU count + 4) workers, and
+    every run_catching_timeout and run_catching_first call of the process shares it.
+    A call that timed out keeps its worker busy until it returns, so a few calls that
+    hang can take up every worker: all the other timed calls then wait in the queue
+    and time out without ever running, whatever function they wrap. Give each
+    dependency that may hang its own executor, sized for it.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix='kotresult')
+    return _executor
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the time available to the run_catching_timeout calls made inside the with block.
+
+    The deadline is stored in a ContextVar and only ever tightened: a nested
+    deadline() cannot extend the budget of an enclosing one. Timed calls run their
+    function with the deadline in effect, so the calls it makes in turn share the
+    remaining budget, including from the worker thread of a sync call.
+
+    Example:
+        with deadline(0.5):
+            user = run_catching_timeout(load_user, user_id)
+            orders = run_catching_timeout(load_orders, user_id, timeout=0.2)
+    """
+    limit = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(limit if current is None else min(current, limit))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Return the seconds left before the current deadline, or None if there is no deadline"""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def _budget(timeout: Optional[float]) -> Optional[float]:
+    if timeout is not None and timeout < 0:
+        raise ValueError("timeout must not be negative")
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+def _timed_out(func: Callable, budget: float) -> Result:
+    return Result.failure(TimeoutError(f"{callable_name(func)} did not complete within {max(budget, 0.0):.3g}s"))
+
+
+def run_catching_timeout(
+        func: Callable[..., T],
+        *args,
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+) -> Result[T]:
+    """
+    Call func through run_catching in a worker thread, giving up after timeout seconds.
+
+    The time allowed is the smaller of timeout and what is left of the current
+    deadline() budget. Past it, Result.failure(TimeoutError) is returned. If the
+    budget is already spent, func is not called at all. Python cannot stop a
+    running thread, so a call that timed out keeps running in its worker and its
+    outcome is discarded. With neither a timeout nor a deadline, func is called
+    directly in the calling thread.
+
+    Without an executor the call runs in shared_executor(), whose workers are shared
+    by the whole process: calls that hang there starve every other timed call.
+    Prefer an executor per call site, or per dependency, for functions that may hang.
+
+    Args:
+        func: The function to call
+        *args: Positional arguments for func
+        timeout: Maximum time in seconds, or None to only follow the current deadline
+        executor: Executor running the call. Defaults to shared_executor()
+        **kwargs: Keyword arguments for func
+
+    Example:
+        profiles = ThreadPoolExecutor(8, thread_name_prefix="profiles")
+        result = run_catching_timeout(requests.get, url, timeout=2.0, executor=profiles)
+    """
+    budget = _budget(timeout)
+    if budget is None:
+        return run_catching(func, *args, **kwargs)
+    if budget <= 0:
+        return _timed_out(func, budget)
+    token = _deadline.set(time.monotonic() + budget)
+    try:
+        # The copied context carries the deadline into the worker thread
+        context = contextvars.copy_context()
+    finally:
+        _deadline.reset(token)
+    future = (executor or shared_executor()).submit(context.run, run_catching, func, *args, **kwargs)
+    try:
+        return future.result(budget)
+    except FutureTimeoutError:
+        future.cancel()
+        return _timed_out(func, budget)
+
+
+async def run_catching_timeout_async(
+        func: Callable[..., Union[T, Awaitable[T]]],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+) -> Result[T]:
+    """
+    asyncio version of run_catching_timeout.
+
+    Calls func through run_catching_async under asyncio.wait_for, so a coroutine
+    that runs out of time is cancelled and Result.failure(TimeoutError) is returned.
+    """
+    budget = _budget(timeout)
+    if budget is None:
+        return await run_catching_async(func, *args, **kwargs)
+    if budget <= 0:
+        return _timed_out(func, budget)
+    # wait_for runs the call in a task, which copies the context with the deadline set
+    token = _deadline.set(time.monotonic() + budget)
+    try:
+        return await asyncio.wait_for(run_catching_async(func, *args, **kwargs), budget)
+    except asyncio.TimeoutError:
+        return _timed_out(func, budget)
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,138 @@
+import asyncio
+import unittest
+
+from kotresult import FailureInfo, Result, capture_options, gather_results, run_catching_async
+
+
+async def double(x):
+    await asyncio.sleep(0)
+    return x * 2
+
+
+async def fail(message):
+    await asyncio.sleep(0)
+    raise ValueError(message)
+
+
+class TestRunCatchingAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_coroutine_function(self):
+        """Test run_catching_async with coroutine functions"""
+        result = await run_catching_async(double, 21)
+        self.assertEqual(result, Result.success(42))
+
+        result = await run_catching_async(fail, "error")
+        self.assertIsInstance(result.exception_or_null(), ValueError)
+
+    async def test_plain_function(self):
+        """Test run_catching_async with a plain callable"""
+        self.assertEqual(await run_catching_async(int, "7"), Result.success(7))
+        self.assertTrue((await run_catching_async(int, "x")).is_failure)
+
+    async def test_cancellation_propagates(self):
+        """Test that cancelling the task is not captured as a failure"""
+        task = asyncio.ensure_future(run_catching_async(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+
+class TestGatherResults(unittest.IsolatedAsyncioTestCase):
+    async def test_gather(self):
+        """Test that failures are captured without cancelling siblings"""
+        results = await gather_results(double(1), fail("error"), double(3))
+        self.assertEqual(results[0], Result.success(2))
+        self.assertIsInstance(results[1].exception_or_null(), ValueError)
+        self.assertEqual(results[2], Result.success(6))
+        self.assertEqual(await gather_results(), [])
+
+    async def test_concurrency(self):
+        """Test that concurrency bounds the number of running awaitables"""
+        running = 0
+        peak = 0
+
+        async def tracked(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return x
+
+        results = await gather_results(*(tracked(i) for i in range(10)), concurrency=3)
+        self.assertEqual([r.get_or_null() for r in results], list(range(10)))
+        self.assertEqual(peak, 3)
+
+        with self.assertRaises(ValueError):
+            await gather_results(concurrency=0)
+
+    async def test_cancelled_awaitable(self):
+        """Test that a cancelled awaitable becomes a CancelledError failure"""
+        task = asyncio.ensure_future(asyncio.sleep(10))
+        task.cancel()
+        results = await gather_results(task, double(1))
+        self.assertIsInstance(results[0].exception_or_null(), asyncio.CancelledError)
+        self.assertEqual(results[1], Result.success(2))
+
+    async def test_capture_options(self):
+        """Test that the capture options apply to the failures of gathered awaitables"""
+        task = asyncio.ensure_future(asyncio.sleep(10))
+        task.cancel()
+        with capture_options(failure_info=True):
+            results = await gather_results(fail("error"), task)
+        self.assertIsInstance(results[0].exception_or_null(), FailureInfo)
+        self.assertEqual(results[0].exception_or_null().type_name, "ValueError")
+        self.assertEqual(results[1].exception_or_null().type_name, "CancelledError")
+
+        with capture_options(traceback_limit=0):
+            results = await gather_results(fail("error"))
+        self.assertIsNone(results[0].exception_or_null().__traceback__)
+
+    async def test_cancel_gather(self):
+        """Test that cancelling gather_results cancels its awaitables"""
+        inner = asyncio.ensure_future(asyncio.sleep(10))
+        task = asyncio.ensure_future(gather_results(inner))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(inner.cancelled())
+
+
+class TestResultAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_map_async(self):
+        """Test the map_async method"""
+        self.assertEqual(await Result.success(2).map_async(double), Result.success(4))
+        self.assertEqual(await Result.success(2).map_async(str), Result.success("2"))
+        self.assertTrue((await Result.failure(ValueError()).map_async(double)).is_failure)
+        with self.assertRaises(ValueError):
+            await Result.success("error").map_async(fail)
+
+    async def test_map_catching_async(self):
+        """Test the map_catching_async method"""
+        self.assertEqual(await Result.success(2).map_catching_async(double), Result.success(4))
+        result = await Result.success("error").map_catching_async(fail)
+        self.assertIsInstance(result.exception_or_null(), ValueError)
+        self.assertTrue((await Result.failure(TypeError()).map_catching_async(double)).is_failure)
+
+    async def test_recover_catching_async(self):
+        """Test the recover_catching_async method"""
+        recovered = await Result.failure(ValueError()).recover_catching_async(lambda e: double(5))
+        self.assertEqual(recovered, Result.success(10))
+        recovered = await Result.failure(TypeError()).recover_catching_async(lambda e: fail("again"))
+        self.assertIsInstance(recovered.exception_or_null(), ValueError)
+        success = Result.success(1)
+        self.assertIs(await success.recover_catching_async(double), success)
+
+    async def test_fold_async(self):
+        """Test the fold_async method"""
+        self.assertEqual(await Result.success(3).fold_async(double, lambda e: 0), 6)
+        self.assertEqual(await Result.failure(ValueError()).fold_async(double, lambda e: 0), 0)
+
+    async def test_catching_does_not_capture_cancellation(self):
+        """Test that cancellation inside a transform propagates"""
+        task = asyncio.ensure_future(Result.success(10).map_catching_async(asyncio.sleep))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
@@ -0,0 +1,116 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from kotresult.arrays import ArrayResult, run_catching_array
+
+from kotresult import Result
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class TestRunCatchingArray(unittest.TestCase):
+    def test_single_chunk(self):
+        """Test applying a ufunc to the whole array"""
+        result = run_catching_array(np.sqrt, [1.0, 4.0, 9.0])
+        self.assertIsInstance(result, ArrayResult)
+        self.assertTrue(result.all_success)
+        np.testing.assert_array_equal(result.values, [1.0, 2.0, 3.0])
+        self.assertEqual(result.to_result().get_or_null().tolist(), [1.0, 2.0, 3.0])
+
+    def test_floating_point_errors_per_chunk(self):
+        """Test that floating point errors fail only their own chunk"""
+        data = np.array([1.0, 2.0, 0.0, 4.0, 8.0])
+        result = run_catching_array(lambda x: 1.0 / x, data, chunksize=2, errstate='raise')
+        self.assertEqual(result.failure_count, 2)
+        self.assertEqual(result.success_count, 3)
+        self.assertEqual(result.failed.tolist(), [False, False, True, True, False])
+        self.assertEqual(len(result.errors), 1)
+        rows, error = result.errors[0]
+        self.assertEqual((rows.start, rows.stop), (2, 4))
+        self.assertIsInstance(error, FloatingPointError)
+        self.assertTrue(np.isnan(result.values[2:4]).all())
+        np.testing.assert_array_equal(result.successes(), [1.0, 0.5, 0.125])
+        self.assertEqual(result.failures(), [error])
+        self.assertIsInstance(result.to_result().exception_or_null(), FloatingPointError)
+        with self.assertRaises(FloatingPointError):
+            result.get_or_throw()
+
+    def test_wrong_length_fails_chunk(self):
+        """Test that a chunk returning the wrong number of rows is a failure"""
+        result = run_catching_array(lambda x: x[:1], np.arange(4), chunksize=2)
+        self.assertEqual(result.failure_count, 4)
+        self.assertIsInstance(result.failures()[0], ValueError)
+
+    def test_fill_value_and_dtype(self):
+        """Test the fill value of failed chunks and dtype promotion across chunks"""
+        def func(x):
+            if x[0] == 2:
+                raise KeyError("bad chunk")
+            return x * 2 if x[0] == 0 else x * 0.5
+
+        result = run_catching_array(func, np.arange(6), chunksize=2, fill_value=-1)
+        self.assertEqual(result.values.dtype, np.float64)
+        self.assertEqual(result.values.tolist(), [0.0, 2.0, -1.0, -1.0, 2.0, 2.5])
+
+        result = run_catching_array(lambda x: 1 // 0, np.arange(3))
+        self.assertEqual(result.failure_count, 3)
+        self.assertTrue(np.isnan(result.values).all())
+
+    def test_map(self):
+        """Test that map only transforms the successful rows"""
+        calls = []
+
+        def double(x):
+            calls.append(len(x))
+            return x * 2
+
+        result = run_catching_array(np.log, [1.0, 0.0, np.e, -1.0], chunksize=1, errstate='raise')
+        mapped = result.map(double)
+        self.assertEqual(calls, [2])
+        self.assertEqual(mapped.values[[0, 2]].tolist(), [0.0, 2.0])
+        self.assertTrue(np.isnan(mapped.values[[1, 3]]).all())
+        self.assertEqual(mapped.failed.tolist(), result.failed.tolist())
+
+        self.assertEqual(run_catching_array(np.abs, [-1, 2]).map(double).values.tolist(), [2, 4])
+
+    def test_recover(self):
+        """Test recovering failed chunks with a value or a function of the exception"""
+        result = run_catching_array(np.log, [1.0, -1.0, 0.0], chunksize=1, errstate='raise')
+        recovered = result.recover(0.0)
+        self.assertTrue(recovered.all_success)
+        self.assertEqual(recovered.values.tolist(), [0.0, 0.0, 0.0])
+
+        recovered = result.recover(lambda e: -1.0 if isinstance(e, FloatingPointError) else 0.0)
+        self.assertEqual(recovered.values.tolist(), [0.0, -1.0, -1.0])
+
+        success = run_catching_array(np.abs, [1])
+        self.assertIs(success.recover(0), success)
+
+    def test_masked_and_2d(self):
+        """Test masked output and arrays with more than one dimension"""
+        data = np.array([[1.0, 2.0], [0.0, 1.0], [4.0, 5.0]])
+
+        def check(rows):
+            if (rows == 0).any():
+                raise ValueError("zero")
+            return rows * 10
+
+        result = run_catching_array(check, data, chunksize=1)
+        masked = result.to_masked()
+        self.assertEqual(masked.mask.tolist(), [[False, False], [True, True], [False, False]])
+        self.assertEqual(masked.sum(), 120.0)
+        self.assertEqual(repr(result), "ArrayResult(size=3, failed_chunks=1)")
+
+    def test_invalid_chunksize(self):
+        """Test that a chunksize below 1 is rejected"""
+        with self.assertRaises(ValueError):
+            run_catching_array(np.abs, [1], chunksize=0)
+
+    def test_result_interop(self):
+        """Test that the Result of a successful computation holds the array"""
+        self.assertTrue(run_catching_array(np.abs, []).to_result().is_success)
+        self.assertIsInstance(run_catching_array(np.abs, [1]).to_result(), Result)
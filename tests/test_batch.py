@@ -0,0 +1,98 @@
+import unittest
+
+from kotresult import Result, ResultBatch
+
+
+class TestResultBatch(unittest.TestCase):
+    def test_run_catching(self):
+        """Test building a batch by calling a function on every item"""
+        batch = ResultBatch.run_catching(int, ["1", "x", "3"])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.success_count, 2)
+        self.assertEqual(batch.failure_count, 1)
+        self.assertFalse(batch.all_success)
+        self.assertEqual(batch.successes(), [1, 3])
+        self.assertIsInstance(batch.failures()[0], ValueError)
+
+    def test_of_and_from_results(self):
+        """Test the of and from_results constructors"""
+        batch = ResultBatch.of([1, 2, 3])
+        self.assertTrue(batch.all_success)
+        self.assertEqual(batch.successes(), [1, 2, 3])
+
+        error = ValueError("error")
+        batch = ResultBatch.from_results([Result.success(1), Result.failure(error)])
+        self.assertEqual(batch.successes(), [1])
+        self.assertEqual(batch.failures(), [error])
+
+        with self.assertRaises(ValueError):
+            ResultBatch([1], [], bytearray(b'\x01'))
+
+    def test_partition(self):
+        """Test splitting a batch into values and exceptions"""
+        values, exceptions = ResultBatch.run_catching(lambda x: 10 // x, [1, 0, 5]).partition()
+        self.assertEqual(values, [10, 2])
+        self.assertEqual(len(exceptions), 1)
+        self.assertIsInstance(exceptions[0], ZeroDivisionError)
+
+    def test_map(self):
+        """Test the map method"""
+        batch = ResultBatch.run_catching(int, ["1", "x", "3"])
+        mapped = batch.map(lambda x: x * 2)
+        self.assertEqual(mapped.successes(), [2, 6])
+        self.assertEqual(mapped.failure_count, 1)
+
+        # Fast path when every element succeeded
+        self.assertEqual(ResultBatch.of([1, 2]).map(str).successes(), ["1", "2"])
+
+        # Map with exception in transform should throw
+        with self.assertRaises(ZeroDivisionError):
+            batch.map(lambda x: 1 / 0)
+
+    def test_map_catching(self):
+        """Test the map_catching method"""
+        batch = ResultBatch.of([1, 0, 2]).map_catching(lambda x: 10 // x)
+        self.assertEqual(batch.successes(), [10, 5])
+        self.assertIsInstance(batch.failures()[0], ZeroDivisionError)
+        self.assertTrue(batch[1].is_failure)
+
+        # The source batch is left untouched
+        source = ResultBatch.of([0])
+        source.map_catching(lambda x: 1 // x)
+        self.assertTrue(source.all_success)
+
+    def test_recover(self):
+        """Test the recover and recover_catching methods"""
+        batch = ResultBatch.run_catching(int, ["1", "x"])
+        recovered = batch.recover(lambda e: 0)
+        self.assertTrue(recovered.all_success)
+        self.assertEqual(recovered.successes(), [1, 0])
+
+        recovered = batch.recover_catching(lambda e: 1 / 0)
+        self.assertEqual(recovered.successes(), [1])
+        self.assertIsInstance(recovered.failures()[0], ZeroDivisionError)
+
+        recovered = batch.recover_catching(lambda e: -1)
+        self.assertEqual(recovered.successes(), [1, -1])
+
+    def test_results_interop(self):
+        """Test converting a batch back to Result objects"""
+        error = ValueError("error")
+        results = [Result.success(1), Result.failure(error)]
+        batch = ResultBatch.from_results(results)
+        self.assertEqual(batch.to_results(), results)
+        self.assertEqual(list(batch), results)
+        self.assertEqual(batch[0], Result.success(1))
+        self.assertEqual(batch[1], Result.failure(error))
+        self.assertEqual(repr(batch), "ResultBatch(size=2, successes=1, failures=1)")
+
+    def test_slice(self):
+        """Test that slicing returns a batch of the selected elements"""
+        batch = ResultBatch.run_catching(int, ["1", "x", "3", "y"])
+        sliced = batch[1:3]
+        self.assertIsInstance(sliced, ResultBatch)
+        self.assertEqual(sliced.to_results(), batch.to_results()[1:3])
+        self.assertEqual(batch[::2].successes(), [1, 3])
+        self.assertEqual(len(batch[5:]), 0)
+        with self.assertRaises(TypeError):
+            batch["1"]
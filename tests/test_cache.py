@@ -0,0 +1,123 @@
+import threading
+import time
+import unittest
+
+from kotresult import CacheInfo, Result, cached_catching, capture_options
+
+
+class TestCachedCatching(unittest.TestCase):
+    def test_caches_successes(self):
+        """Test that successful calls are cached by their arguments"""
+        calls = []
+
+        @cached_catching
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), Result.success(9))
+        self.assertEqual(square(3), Result.success(9))
+        self.assertEqual(square(x=3), Result.success(9))
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache_info(), CacheInfo(hits=1, misses=2, evictions=0, maxsize=128, currsize=2))
+        self.assertEqual(square.__name__, "square")
+
+    def test_caches_failures(self):
+        """Test that failures are cached unless cache_failures is False"""
+        calls = []
+
+        def parse(s):
+            calls.append(s)
+            return int(s)
+
+        cached = cached_catching()(parse)
+        self.assertTrue(cached("x").is_failure)
+        self.assertTrue(cached("x").is_failure)
+        self.assertEqual(len(calls), 1)
+
+        calls.clear()
+        uncached_failures = cached_catching(cache_failures=False)(parse)
+        uncached_failures("x")
+        uncached_failures("x")
+        self.assertEqual(len(calls), 2)
+
+    def test_interrupts_not_cached(self):
+        """Test that a KeyboardInterrupt or SystemExit is returned without being cached"""
+        calls = []
+
+        @cached_catching
+        def interrupted(x):
+            calls.append(x)
+            if len(calls) == 1:
+                raise KeyboardInterrupt
+            if len(calls) == 2:
+                raise SystemExit(1)
+            return x
+
+        self.assertIsInstance(interrupted(1).exception_or_null(), KeyboardInterrupt)
+        # Captured as a FailureInfo, which is an Exception itself
+        with capture_options(failure_info=True):
+            self.assertEqual(interrupted(1).exception_or_null().type_name, "SystemExit")
+        self.assertEqual(interrupted(1), Result.success(1))
+        self.assertEqual(interrupted(1), Result.success(1))
+        self.assertEqual(calls, [1, 1, 1])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        identity = cached_catching(maxsize=2)(lambda x: x)
+        identity(1)
+        identity(2)
+        identity(1)
+        identity(3)  # evicts 2
+        identity(1)
+        self.assertEqual(identity.cache_info(), CacheInfo(hits=2, misses=3, evictions=1, maxsize=2, currsize=2))
+        identity(2)
+        self.assertEqual(identity.cache_info().misses, 4)
+
+    def test_ttl(self):
+        """Test separate lifetimes for successes and failures"""
+        calls = []
+
+        @cached_catching(ttl=10, failure_ttl=0.01)
+        def parse(s):
+            calls.append(s)
+            return int(s)
+
+        parse("1")
+        parse("x")
+        time.sleep(0.02)
+        parse("1")
+        parse("x")
+        self.assertEqual(calls, ["1", "x", "x"])
+
+    def test_cache_clear(self):
+        """Test clearing the cache and its statistics"""
+        identity = cached_catching(thread_safe=False)(lambda x: x)
+        identity(1)
+        identity(1)
+        identity.cache_clear()
+        self.assertEqual(identity.cache_info(), CacheInfo(0, 0, 0, 128, 0))
+
+    def test_thread_safe(self):
+        """Test concurrent use from several threads"""
+        identity = cached_catching(maxsize=50)(lambda x: x)
+
+        def worker():
+            for i in range(500):
+                self.assertEqual(identity(i % 100), Result.success(i % 100))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = identity.cache_info()
+        self.assertEqual(info.hits + info.misses, 2000)
+        self.assertLessEqual(info.currsize, 50)
+
+    def test_invalid_arguments(self):
+        """Test argument validation"""
+        with self.assertRaises(ValueError):
+            cached_catching(maxsize=0)
+        with self.assertRaises(TypeError):
+            cached_catching()(len)([1])
@@ -0,0 +1,192 @@
+import gc
+import pickle
+import threading
+import unittest
+import weakref
+
+from kotresult import (
+    FailureInfo,
+    Pipeline,
+    Result,
+    capture_options,
+    exception_matches,
+    get_capture_options,
+    run_catching,
+    run_catching_retry,
+    set_capture_options,
+    trim_traceback,
+)
+
+
+class Payload:
+    pass
+
+
+def inner():
+    raise ValueError("bad", 42)
+
+
+def middle(payload):
+    inner()
+
+
+def outer(payload):
+    middle(payload)
+
+
+def frame_names(exception):
+    names = []
+    tb = exception.__traceback__
+    while tb is not None:
+        names.append(tb.tb_frame.f_code.co_name)
+        tb = tb.tb_next
+    return names
+
+
+class TestTrimTraceback(unittest.TestCase):
+    def test_keeps_innermost_frames(self):
+        """Test that only the innermost frames are kept"""
+        error = run_catching(outer, None).exception_or_null()
+        self.assertEqual(frame_names(error)[-3:], ["outer", "middle", "inner"])
+        self.assertIs(trim_traceback(error, 2), error)
+        self.assertEqual(frame_names(error), ["middle", "inner"])
+        self.assertIsNone(trim_traceback(error, 0).__traceback__)
+
+        with self.assertRaises(ValueError):
+            trim_traceback(error, -1)
+
+    def test_trims_chained_exceptions(self):
+        """Test that __cause__ and __context__ tracebacks are trimmed too"""
+        def chained():
+            try:
+                outer(None)
+            except ValueError as e:
+                raise RuntimeError("wrapped") from e
+
+        error = run_catching(chained).exception_or_null()
+        trim_traceback(error, 0)
+        self.assertIsNone(error.__traceback__)
+        self.assertIsNone(error.__cause__.__traceback__)
+
+    def test_releases_dropped_frames(self):
+        """Test that locals of dropped frames are released"""
+        references = []
+
+        def call():
+            payload = Payload()
+            references.append(weakref.ref(payload))
+            outer(payload)
+
+        with capture_options(traceback_limit=1):
+            result = run_catching(call)
+        gc.collect()
+        self.assertIsNone(references[0]())
+        self.assertEqual(frame_names(result.exception_or_null()), ["inner"])
+
+
+class TestCaptureOptions(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(set_capture_options)
+
+    def test_default_keeps_traceback(self):
+        """Test that tracebacks are kept by default"""
+        self.assertEqual(get_capture_options(), (None, False))
+        error = run_catching(outer, None).exception_or_null()
+        self.assertIn("inner", frame_names(error))
+
+    def test_global_options(self):
+        """Test process-wide capture options"""
+        set_capture_options(traceback_limit=0)
+        self.assertIsNone(run_catching(outer, None).exception_or_null().__traceback__)
+        self.assertIsNone(Result.success(0).map_catching(outer).exception_or_null().__traceback__)
+
+        set_capture_options(failure_info=True)
+        self.assertIsInstance(run_catching(outer, None).exception_or_null(), FailureInfo)
+
+        with self.assertRaises(ValueError):
+            set_capture_options(traceback_limit=-1)
+
+    def test_scoped_options(self):
+        """Test that capture_options overrides the global options for its block only"""
+        set_capture_options(traceback_limit=0)
+        with capture_options():
+            self.assertIn("inner", frame_names(run_catching(outer, None).exception_or_null()))
+        with capture_options(failure_info=True):
+            self.assertEqual(get_capture_options(), (None, True))
+            self.assertIsInstance(Result.failure(ValueError()).recover_catching(outer).exception_or_null(),
+                                  FailureInfo)
+        self.assertEqual(get_capture_options(), (0, False))
+
+    def test_lazy_steps(self):
+        """Test that lazy chains and pipelines apply the capture options like the eager methods"""
+        set_capture_options(traceback_limit=0)
+        self.assertIsNone(Result.success(0).lazy().map_catching(outer).evaluate().exception_or_null().__traceback__)
+        self.assertIsNone(Pipeline().recover_catching(outer).run(ValueError()).exception_or_null().__traceback__)
+        set_capture_options(failure_info=True)
+        self.assertIsInstance(Result.success(0).lazy().map_catching(outer).evaluate().exception_or_null(),
+                              FailureInfo)
+
+    def test_type_filters_match_failure_info(self):
+        """Test that retry_on matches a FailureInfo by the type of the exception it replaced"""
+        calls = []
+
+        def refuse():
+            calls.append(1)
+            raise ConnectionRefusedError("down")
+
+        with capture_options(failure_info=True):
+            outcome = run_catching_retry(refuse, attempts=3, backoff=0, retry_on=(ConnectionError,))
+            self.assertEqual(outcome.attempts, 3)
+            self.assertIsInstance(outcome.result.exception_or_null(), FailureInfo)
+            outcome = run_catching_retry(refuse, attempts=3, backoff=0, retry_on=(KeyError,))
+            self.assertEqual(outcome.attempts, 1)
+        self.assertEqual(len(calls), 4)
+
+    def test_scoped_options_are_per_thread(self):
+        """Test that a scoped override does not leak into other threads"""
+        seen = []
+        with capture_options(traceback_limit=0):
+            thread = threading.Thread(target=lambda: seen.append(get_capture_options()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [(None, False)])
+
+
+class TestFailureInfo(unittest.TestCase):
+    def test_from_exception(self):
+        """Test building a FailureInfo from a raised exception"""
+        info = FailureInfo.from_exception(run_catching(outer, None).exception_or_null())
+        self.assertEqual(info.type_name, "ValueError")
+        self.assertEqual(info.module, "builtins")
+        self.assertEqual(info.exception_args, ("bad", 42))
+        self.assertIn("in inner", info.location)
+        self.assertIsNone(info.__traceback__)
+        self.assertTrue(str(info).startswith("ValueError('bad', 42) at "))
+
+        info = FailureInfo.from_exception(KeyError("k"))
+        self.assertEqual(info.location, "")
+        self.assertEqual(str(info), "KeyError('k',)")
+
+    def test_as_failure_payload(self):
+        """Test that FailureInfo works as a failure value and pickles"""
+        info = FailureInfo("ValueError", "builtins", ("bad",), "file.py:1 in f")
+        result = Result.failure(info)
+        self.assertTrue(result.is_failure)
+        with self.assertRaises(FailureInfo):
+            result.get_or_throw()
+        self.assertEqual(Result.failure(pickle.loads(pickle.dumps(info))), result)
+
+    def test_matches(self):
+        """Test that a FailureInfo matches the type of the original exception and its bases"""
+        info = FailureInfo.from_exception(ConnectionRefusedError("down"))
+        self.assertTrue(info.matches(ConnectionRefusedError))
+        self.assertTrue(info.matches((KeyError, OSError)))
+        self.assertFalse(info.matches(ValueError))
+        self.assertTrue(pickle.loads(pickle.dumps(info)).matches(ConnectionError))
+        # Built by hand, only its own type is known
+        self.assertTrue(FailureInfo("ValueError", "builtins", ()).matches(ValueError))
+        self.assertFalse(FailureInfo("ValueError", "builtins", ()).matches(Exception))
+
+        self.assertTrue(exception_matches(info, OSError))
+        self.assertTrue(exception_matches(KeyError(), LookupError))
+        self.assertFalse(exception_matches(info, FailureInfo))
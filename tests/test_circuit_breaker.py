@@ -0,0 +1,170 @@
+import asyncio
+import gc
+import threading
+import time
+import traceback
+import unittest
+import weakref
+
+from kotresult import CircuitBreaker, CircuitOpenError, Result
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+class Payload:
+    pass
+
+
+def raise_rejection(result, references):
+    # The local payload would be kept alive by a traceback pinning this frame
+    payload = Payload()
+    references.append(weakref.ref(payload))
+    result.get_or_throw()
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        """Test that the circuit opens once the threshold is reached and rejects calls"""
+        breaker = CircuitBreaker(failure_threshold=2, window=60, reset_timeout=60, name="profiles")
+        calls = []
+
+        def call():
+            calls.append(1)
+            fail()
+
+        self.assertIsInstance(breaker.run_catching(call).exception_or_null(), ConnectionError)
+        self.assertEqual(breaker.state, 'closed')
+        breaker.run_catching(call)
+        self.assertEqual(breaker.state, 'open')
+
+        rejected = breaker.run_catching(call)
+        self.assertIsInstance(rejected.exception_or_null(), CircuitOpenError)
+        self.assertEqual(str(rejected.exception_or_null()), "circuit 'profiles' is open")
+        again = breaker.run_catching(call)
+        self.assertEqual(again, rejected)
+        self.assertIsNot(again.exception_or_null(), rejected.exception_or_null())
+        self.assertEqual(len(calls), 2)
+
+    def test_repeated_raises_do_not_pin_frames(self):
+        """Test that raising rejections keeps neither earlier callers' frames nor clears a held traceback"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.run_catching(fail)
+        references = []
+        held = []
+        for _ in range(5):
+            try:
+                raise_rejection(breaker.run_catching(fail), references)
+            except CircuitOpenError as e:
+                # Only the frames of this raise: this test, raise_rejection and get_or_throw
+                self.assertEqual(len(traceback.extract_tb(e.__traceback__)), 3)
+                if not held:
+                    held.append(e)
+        # The first caller still holds its traceback after the later rejections
+        self.assertEqual(len(traceback.extract_tb(held[0].__traceback__)), 3)
+        held.clear()
+        gc.collect()
+        self.assertEqual([reference() for reference in references], [None] * 5)
+
+    def test_sliding_window(self):
+        """Test that failures older than the window are forgotten"""
+        breaker = CircuitBreaker(failure_threshold=2, window=0.05)
+        breaker.run_catching(fail)
+        time.sleep(0.1)
+        self.assertEqual(breaker.failure_count, 0)
+        breaker.run_catching(fail)
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_half_open(self):
+        """Test that a successful trial call closes the circuit and a failed one reopens it"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.run_catching(fail)
+        self.assertEqual(breaker.state, 'open')
+        time.sleep(0.1)
+        self.assertEqual(breaker.state, 'half_open')
+        breaker.run_catching(fail)
+        self.assertEqual(breaker.state, 'open')
+        time.sleep(0.1)
+        self.assertEqual(breaker.run_catching(lambda: 1), Result.success(1))
+        self.assertEqual(breaker.state, 'closed')
+        self.assertEqual(breaker.failure_count, 0)
+
+    def test_half_open_max(self):
+        """Test that only half_open_max trial calls run at once"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.run_catching(fail)
+        release = threading.Event()
+        trial = threading.Thread(target=breaker.run_catching, args=(release.wait,))
+        trial.start()
+        time.sleep(0.05)
+        self.assertIsInstance(breaker.run_catching(lambda: 1).exception_or_null(), CircuitOpenError)
+        release.set()
+        trial.join()
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_decorator_and_reset(self):
+        """Test the decorator form and reset()"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+        @breaker
+        def divide(a, b):
+            return a / b
+
+        self.assertEqual(divide(4, 2), Result.success(2.0))
+        self.assertIsInstance(divide(1, 0).exception_or_null(), ZeroDivisionError)
+        self.assertIsInstance(divide(4, 2).exception_or_null(), CircuitOpenError)
+        self.assertEqual(divide.__name__, 'divide')
+        breaker.reset()
+        self.assertEqual(divide(4, 2), Result.success(2.0))
+
+    def test_invalid_arguments(self):
+        """Test the argument checks"""
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(window=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(half_open_max=0)
+
+
+class TestCircuitBreakerAsync(unittest.TestCase):
+    def test_async(self):
+        """Test the async path and the decorator on coroutine functions"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+        @breaker
+        async def fetch(fail_call):
+            await asyncio.sleep(0)
+            if fail_call:
+                raise ConnectionError("down")
+            return "ok"
+
+        async def main():
+            first = await fetch(False)
+            second = await fetch(True)
+            third = await breaker.run_catching_async(fetch, False)
+            return first, second, third
+
+        first, second, third = asyncio.run(main())
+        self.assertEqual(first, Result.success("ok"))
+        self.assertIsInstance(second.exception_or_null(), ConnectionError)
+        self.assertIsInstance(third.exception_or_null(), CircuitOpenError)
+
+    def test_cancelled_trial_releases_slot(self):
+        """Test that a cancelled trial call does not keep its half-open slot"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.run_catching(fail)
+
+        async def main():
+            task = asyncio.ensure_future(breaker.run_catching_async(asyncio.sleep, 10))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return await breaker.run_catching_async(lambda: "ok")
+
+        self.assertEqual(asyncio.run(main()), Result.success("ok"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import io
+import json
+import unittest
+
+from kotresult import (
+    ExceptionRegistry,
+    FailureInfo,
+    Result,
+    decode_results,
+    dump_results,
+    dump_results_json,
+    encode_results,
+    load_results,
+    load_results_json,
+    run_catching,
+)
+
+
+class ValidationError(Exception):
+    pass
+
+
+class TestResultDict(unittest.TestCase):
+    def test_to_dict(self):
+        """Test the JSON-compatible dict form"""
+        self.assertEqual(Result.success([1, "a"]).to_dict(), {'success': True, 'value': [1, "a"]})
+        self.assertEqual(
+            Result.failure(ValueError("bad", 42)).to_dict(),
+            {'success': False, 'error': {'type': 'ValueError', 'module': 'builtins', 'args': ["bad", 42]}},
+        )
+
+    def test_round_trip(self):
+        """Test that from_dict rebuilds builtin exceptions"""
+        result = Result.from_dict(json.loads(json.dumps(Result.failure(KeyError("key")).to_dict())))
+        self.assertEqual(result, Result.failure(KeyError("key")))
+        self.assertEqual(Result.from_dict(Result.success(1).to_dict()), Result.success(1))
+
+    def test_unserializable_args(self):
+        """Test that args that are not JSON-compatible are replaced by the message"""
+        data = Result.failure(ValueError(object)).to_dict()
+        self.assertEqual(data['error']['args'], [str(ValueError(object))])
+
+
+class TestExceptionRegistry(unittest.TestCase):
+    def test_unknown_type_becomes_failure_info(self):
+        """Test that unregistered types are decoded as FailureInfo"""
+        data = Result.failure(ValidationError("bad")).to_dict()
+        error = Result.from_dict(data).exception_or_null()
+        self.assertIsInstance(error, FailureInfo)
+        self.assertEqual(error.type_name, 'ValidationError')
+        self.assertEqual(error.exception_args, ("bad",))
+        # FailureInfo is encoded as the original exception
+        self.assertEqual(Result.failure(error).to_dict(), data)
+
+    def test_registered_type(self):
+        """Test that registered types are rebuilt"""
+        registry = ExceptionRegistry()
+        self.assertIs(registry.register(ValidationError), ValidationError)
+        data = Result.failure(ValidationError("bad")).to_dict()
+        self.assertEqual(Result.from_dict(data, registry), Result.failure(ValidationError("bad")))
+
+        with self.assertRaises(TypeError):
+            registry.register(int)
+
+    def test_non_exception_builtins_are_not_resolved(self):
+        """Test that only exception types are looked up in builtins"""
+        registry = ExceptionRegistry()
+        self.assertIsNone(registry.resolve('builtins', 'print'))
+        self.assertIs(registry.resolve('builtins', 'OSError'), OSError)
+
+
+class TestBinaryCodec(unittest.TestCase):
+    values = [
+        None, True, False, 0, 127, 128, -1, 2 ** 63, -2 ** 70, 1.5, "", "é" * 40, b"\x00\xff",
+        [], list(range(20)), (1, "a"), tuple(range(20)), {"a": {"b": [1, (2,)]}}, {i: str(i) for i in range(20)},
+    ]
+
+    def test_round_trip(self):
+        """Test encoding and decoding every supported value type and failures"""
+        results = [Result.success(value) for value in self.values]
+        results.append(run_catching(int, "x"))
+        results.append(Result.failure(ValueError(object)))
+        decoded = decode_results(encode_results(results))
+        self.assertEqual(decoded[:-1], results[:-1])
+        self.assertEqual(decoded[-1].exception_or_null().args, (str(ValueError(object)),))
+
+    def test_no_traceback(self):
+        """Test that decoded failures carry no traceback"""
+        error = decode_results(encode_results([run_catching(int, "x")]))[0].exception_or_null()
+        self.assertIsInstance(error, ValueError)
+        self.assertIsNone(error.__traceback__)
+
+    def test_unsupported_value(self):
+        """Test that unsupported success values raise TypeError"""
+        with self.assertRaises(TypeError):
+            encode_results([Result.success(object())])
+
+    def test_malformed(self):
+        """Test that malformed data raises ValueError"""
+        data = encode_results([Result.success("value")])
+        with self.assertRaises(ValueError):
+            decode_results(b"nope" + data[4:])
+        with self.assertRaises(ValueError):
+            decode_results(data[:-1])
+        with self.assertRaises(ValueError):
+            decode_results(data + b"\x00")
+
+    def test_malformed_failure(self):
+        """Test that a failure record without a (module, type, args) payload raises ValueError"""
+        for payload in (42, ("builtins", "ValueError"), ("builtins", 1, ()), ("builtins", "ValueError", [])):
+            # Re-tag an encoded success as a failure record
+            data = bytearray(encode_results([Result.success(payload)]))
+            data[4] = 1
+            with self.assertRaises(ValueError):
+                decode_results(bytes(data))
+            with self.assertRaises(ValueError):
+                list(load_results(io.BytesIO(bytes(data))))
+
+    def test_unhashable_key(self):
+        """Test that a dict key corrupted into a list raises ValueError"""
+        data = bytearray(encode_results([Result.success({(1,): 2})]))
+        # Re-tag the one-item tuple key as a one-item list
+        data[data.index(0xc1)] = 0xa1
+        with self.assertRaises(ValueError):
+            decode_results(bytes(data))
+        with self.assertRaises(ValueError):
+            list(load_results(io.BytesIO(bytes(data))))
+
+    def test_stream(self):
+        """Test dumping to and loading from a file object"""
+        results = [Result.success(i) if i % 3 else Result.failure(KeyError(i)) for i in range(10)]
+        buffer = io.BytesIO()
+        dump_results(results, buffer)
+        self.assertEqual(buffer.getvalue(), encode_results(results))
+        buffer.seek(0)
+        self.assertEqual(list(load_results(buffer)), results)
+
+        with self.assertRaises(ValueError):
+            list(load_results(io.BytesIO(buffer.getvalue()[:-1])))
+
+
+class TestJsonLines(unittest.TestCase):
+    def test_stream(self):
+        """Test dumping to and loading from a text file object"""
+        results = [Result.success({"id": 1}), Result.failure(ValueError("bad"))]
+        buffer = io.StringIO()
+        dump_results_json(results, buffer)
+        self.assertEqual(len(buffer.getvalue().splitlines()), 2)
+        buffer.seek(0)
+        self.assertEqual(list(load_results_json(buffer)), results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from kotresult import Result, sequence, traverse, zip_results
+from kotresult._compat import BaseExceptionGroup, ExceptionGroup, _BaseExceptionGroup, _ExceptionGroup
+
+
+class TestSequence(unittest.TestCase):
+    def test_all_success(self):
+        """Test combining successful results into a list"""
+        result = sequence([Result.success(1), Result.success(2), Result.success(3)])
+        self.assertEqual(result, Result.success([1, 2, 3]))
+        self.assertEqual(sequence([]), Result.success([]))
+
+    def test_fail_fast_stops_consuming(self):
+        """Test that fail_fast returns the first failure without consuming the rest"""
+        error = ValueError("first")
+        produced = []
+
+        def results():
+            for result in [Result.success(1), Result.failure(error), Result.failure(KeyError("second"))]:
+                produced.append(result)
+                yield result
+
+        result = sequence(results())
+        self.assertTrue(result.is_failure)
+        self.assertIs(result.exception_or_null(), error)
+        self.assertEqual(len(produced), 2)
+
+    def test_accumulate(self):
+        """Test that accumulate collects every exception into an ExceptionGroup"""
+        first, second = ValueError("first"), KeyError("second")
+        result = sequence([Result.failure(first), Result.success(1), Result.failure(second)], mode='accumulate')
+        group = result.exception_or_null()
+        self.assertIsInstance(group, ExceptionGroup)
+        self.assertEqual(group.exceptions, (first, second))
+        self.assertEqual(group.message, "2 of 3 results failed")
+
+    def test_accumulate_base_exceptions(self):
+        """Test that non-Exception failures produce a BaseExceptionGroup"""
+        result = sequence([Result.failure(KeyboardInterrupt())], mode='accumulate')
+        group = result.exception_or_null()
+        self.assertIsInstance(group, BaseExceptionGroup)
+        self.assertNotIsInstance(group, Exception)
+
+    def test_invalid_mode(self):
+        """Test that an unknown mode is rejected"""
+        with self.assertRaises(ValueError):
+            sequence([], mode='lenient')
+
+
+class TestTraverse(unittest.TestCase):
+    def test_all_success(self):
+        """Test mapping every item successfully"""
+        self.assertEqual(traverse(int, ["1", "2", "3"]), Result.success([1, 2, 3]))
+
+    def test_fail_fast_stops_calling(self):
+        """Test that fail_fast does not call the function after the first failure"""
+        calls = []
+
+        def parse(value):
+            calls.append(value)
+            return int(value)
+
+        result = traverse(parse, ["1", "x", "3", "y"])
+        self.assertIsInstance(result.exception_or_null(), ValueError)
+        self.assertEqual(calls, ["1", "x"])
+
+    def test_accumulate(self):
+        """Test that accumulate calls the function on every item"""
+        result = traverse(int, ["1", "x", "3", "y"], mode='accumulate')
+        group = result.exception_or_null()
+        self.assertIsInstance(group, ExceptionGroup)
+        self.assertEqual(len(group.exceptions), 2)
+        self.assertTrue(all(isinstance(e, ValueError) for e in group.exceptions))
+        self.assertEqual(group.message, "2 of 4 results failed")
+
+
+class TestZipResults(unittest.TestCase):
+    def test_all_success(self):
+        """Test combining results into a tuple"""
+        self.assertEqual(zip_results(Result.success(1), Result.success("a")), Result.success((1, "a")))
+
+    def test_failure(self):
+        """Test zip in both modes"""
+        first, second = ValueError("first"), KeyError("second")
+        result = zip_results(Result.failure(first), Result.failure(second))
+        self.assertIs(result.exception_or_null(), first)
+
+        result = zip_results(Result.failure(first), Result.failure(second), mode='accumulate')
+        self.assertEqual(result.exception_or_null().exceptions, (first, second))
+
+
+class TestExceptionGroupFallback(unittest.TestCase):
+    def test_fallback_classes(self):
+        """Test the ExceptionGroup stand-in used when neither the builtin nor the backport exists"""
+        group = _BaseExceptionGroup("failed", [ValueError("a")])
+        self.assertIsInstance(group, _ExceptionGroup)
+        self.assertIsInstance(group, Exception)
+        self.assertEqual(group.message, "failed")
+        self.assertEqual(str(group), "failed (1 sub-exception)")
+
+        group = _BaseExceptionGroup("failed", [KeyboardInterrupt()])
+        self.assertNotIsInstance(group, Exception)
+
+        with self.assertRaises(ValueError):
+            _BaseExceptionGroup("failed", [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import unittest
+from functools import partial
+
+from kotresult import Result, run_catching_first, run_catching_first_async
+from kotresult._compat import ExceptionGroup
+
+
+def slow(value, delay):
+    time.sleep(delay)
+    return value
+
+
+def fail(message):
+    raise ConnectionError(message)
+
+
+class TestRunCatchingFirst(unittest.TestCase):
+    def test_fast_primary(self):
+        """Test that a fast primary call returns without starting backups"""
+        calls = []
+        result = run_catching_first(
+            lambda: "primary",
+            lambda: calls.append("backup"),
+            hedge_after=1.0,
+        )
+        self.assertEqual(result, Result.success("primary"))
+        self.assertEqual(calls, [])
+
+    def test_hedges_slow_primary(self):
+        """Test that a backup is started after hedge_after and can win"""
+        start = time.monotonic()
+        result = run_catching_first(partial(slow, "primary", 1.0), partial(slow, "backup", 0), hedge_after=0.05)
+        self.assertEqual(result, Result.success("backup"))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_failure_starts_next_call(self):
+        """Test that a failed call starts the next one without waiting for hedge_after"""
+        start = time.monotonic()
+        result = run_catching_first(partial(fail, "down"), lambda: "backup", hedge_after=10)
+        self.assertEqual(result, Result.success("backup"))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_race(self):
+        """Test that without hedge_after all calls start at once"""
+        started = []
+        barrier = threading.Barrier(3, timeout=1)
+
+        def call(value):
+            started.append(value)
+            barrier.wait()
+            return value
+
+        result = run_catching_first(partial(call, 1), partial(call, 2), partial(call, 3))
+        self.assertIn(result.get_or_throw(), (1, 2, 3))
+        self.assertEqual(sorted(started), [1, 2, 3])
+
+    def test_all_failed(self):
+        """Test that an ExceptionGroup of every exception is returned when all calls fail"""
+        result = run_catching_first(partial(fail, "a"), partial(fail, "b"), hedge_after=0.01)
+        group = result.exception_or_null()
+        self.assertIsInstance(group, ExceptionGroup)
+        self.assertEqual([str(e) for e in group.exceptions], ["a", "b"])
+
+    def test_invalid_arguments(self):
+        """Test the argument checks"""
+        with self.assertRaises(ValueError):
+            run_catching_first()
+        with self.assertRaises(ValueError):
+            run_catching_first(lambda: 1, hedge_after=-1)
+
+
+class TestRunCatchingFirstAsync(unittest.TestCase):
+    def test_hedge_and_cancel(self):
+        """Test that the backup wins and the slow primary is cancelled"""
+        cancelled = []
+
+        async def primary():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def backup():
+            return "backup"
+
+        async def main():
+            return await run_catching_first_async(primary, backup, hedge_after=0.01)
+
+        self.assertEqual(asyncio.run(main()), Result.success("backup"))
+        self.assertEqual(cancelled, [True])
+
+    def test_all_failed(self):
+        """Test the aggregated failure of the asyncio version"""
+        async def main():
+            return await run_catching_first_async(partial(fail, "a"), partial(fail, "b"))
+
+        group = asyncio.run(main()).exception_or_null()
+        self.assertEqual([str(e) for e in group.exceptions], ["a", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
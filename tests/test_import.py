@@ -0,0 +1,96 @@
+import ast
+import importlib
+import inspect
+import os
+import pkgutil
+import subprocess
+import sys
+import typing
+import unittest
+
+import kotresult
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_core_import_skips_optional_subsystems(self):
+        """Test that importing kotresult loads neither the optional subsystems nor typing and asyncio"""
+        # Compared with the modules loaded before, as site hooks may import some of them at startup
+        code = (
+            "import sys\n"
+            "before = set(sys.modules)\n"
+            "import kotresult\n"
+            "loaded = [name for name in ('typing', 'asyncio', 'concurrent.futures', 'kotresult.aio', 'kotresult.codec')"
+            " if name in sys.modules and name not in before]\n"
+            "print(','.join(loaded))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "")
+
+    def test_lazy_attributes(self):
+        """Test that every public name resolves and that unknown names raise AttributeError"""
+        for name in kotresult.__all__:
+            self.assertIsNotNone(getattr(kotresult, name), name)
+        self.assertIn('ResultStream', dir(kotresult))
+        self.assertIsInstance(kotresult.__version__, str)
+        with self.assertRaises(AttributeError):
+            kotresult.missing
+
+    def test_lazy_attributes_visible_to_type_checkers(self):
+        """Test that every lazy name is also imported in the TYPE_CHECKING block of the package"""
+        with open(kotresult.__file__) as file:
+            tree = ast.parse(file.read())
+        block = next(
+            node for node in tree.body if isinstance(node, ast.If) and getattr(node.test, 'id', None) == 'TYPE_CHECKING'
+        )
+        imported = {
+            (node.module, alias.name) for node in block.body if isinstance(node, ast.ImportFrom) for alias in node.names
+        }
+        self.assertEqual(imported, {(module, name) for name, module in kotresult._LAZY_ATTRIBUTES.items()})
+
+    def test_type_hints_resolve(self):
+        """Test that the annotations of every module resolve at runtime with typing.get_type_hints"""
+        for info in pkgutil.iter_modules(kotresult.__path__):
+            try:
+                module = importlib.import_module(f'kotresult.{info.name}')
+            except ImportError:
+                # An optional dependency is missing, e.g. numpy
+                continue
+            for name, value in vars(module).items():
+                if getattr(value, '__module__', None) != module.__name__:
+                    continue
+                members = [value]
+                if inspect.isclass(value):
+                    for member in vars(value).values():
+                        # Unwrap staticmethod, classmethod and property objects
+                        members.append(getattr(member, '__func__', getattr(member, 'fget', member)))
+                for member in members:
+                    if inspect.isfunction(member) or inspect.isclass(member):
+                        with self.subTest(module=module.__name__, member=member.__qualname__):
+                            typing.get_type_hints(member)
+
+    def test_result_subscript(self):
+        """Test that Result can be subscripted without typing.Generic"""
+        alias = kotresult.Result[int]
+        self.assertIs(alias.__origin__, kotresult.Result)
+        self.assertEqual(alias.__args__, (int,))
+
+
+class TestCompiledBuild(unittest.TestCase):
+    def test_compiled_flag(self):
+        """Test that COMPILED reports whether the core modules are extension modules"""
+        for name in ('kotresult.result', 'kotresult.run_catching'):
+            self.assertEqual(not sys.modules[name].__file__.endswith('.py'), kotresult.COMPILED, name)
+
+    def test_pure_python_override(self):
+        """Test that KOTRESULT_PURE_PYTHON loads the core modules from source"""
+        code = (
+            "import kotresult\n"
+            "print(kotresult.COMPILED, kotresult.result.__file__.endswith('.py'), kotresult.run_catching(int, '1'))\n"
+        )
+        env = dict(os.environ, KOTRESULT_PURE_PYTHON='1')
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+        self.assertEqual(output.strip(), "False True Success(1)")
+
+
+if __name__ == '__main__':
+    unittest.main()
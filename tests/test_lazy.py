@@ -0,0 +1,96 @@
+import unittest
+
+from kotresult import LazyResult, Pipeline, Result
+
+
+class TestLazyResult(unittest.TestCase):
+    def test_evaluate(self):
+        """Test that recorded steps run on evaluate"""
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x + 1
+
+        lazy = Result.success(1).lazy().map(record).map(record)
+        self.assertIsInstance(lazy, LazyResult)
+        self.assertEqual(calls, [])
+        self.assertEqual(lazy.evaluate(), Result.success(3))
+        self.assertEqual(calls, [1, 2])
+
+    def test_matches_eager_chain(self):
+        """Test that lazy evaluation gives the same Result as the eager chain"""
+        steps = [
+            lambda r: r.map(str.strip),
+            lambda r: r.map_catching(int),
+            lambda r: r.recover(lambda e: -1),
+            lambda r: r.map_catching(lambda x: 10 // x),
+            lambda r: r.recover_catching(lambda e: 1 / 0),
+        ]
+        for source in (Result.success(" 5 "), Result.success(" 0 "), Result.success("x"),
+                       Result.failure(ValueError("error"))):
+            eager = source
+            lazy = source.lazy()
+            for step in steps:
+                eager = step(eager)
+                lazy = step(lazy)
+            self.assertEqual(lazy.evaluate(), eager)
+            self.assertEqual(lazy.pipeline.apply(source), eager)
+
+    def test_builder(self):
+        """Test that steps are appended in place and that the pipeline is a snapshot of them"""
+        lazy = Result.success(1).lazy()
+        self.assertIs(lazy.map(str).recover(str), lazy)
+        pipeline = lazy.pipeline
+        lazy.map(len)
+        self.assertEqual(len(pipeline), 2)
+        self.assertEqual(pipeline.run(1), Result.success("1"))
+        self.assertEqual(lazy.evaluate(), Result.success(1))
+
+    def test_empty(self):
+        """Test that an empty pipeline returns the source unchanged"""
+        source = Result.success(1)
+        self.assertIs(source.lazy().evaluate(), source)
+        self.assertIs(Pipeline().apply(source), source)
+
+    def test_map_raises(self):
+        """Test that an exception in a map step propagates like the eager map"""
+        with self.assertRaises(ZeroDivisionError):
+            Result.success(1).lazy().map(lambda x: x / 0).evaluate()
+        with self.assertRaises(ZeroDivisionError):
+            Pipeline().map(lambda x: x / 0).run(1)
+
+    def test_repr(self):
+        """Test the representation of lazy results and pipelines"""
+        lazy = Result.success(1).lazy().map(str).recover(str)
+        self.assertEqual(repr(lazy), "LazyResult(Result.success(1), [map, recover])")
+        self.assertEqual(repr(lazy.pipeline), "Pipeline(map, recover)")
+
+
+class TestPipeline(unittest.TestCase):
+    def test_reuse(self):
+        """Test applying one pipeline to many inputs"""
+        parse = Pipeline().map(str.strip).map_catching(int).recover(lambda e: 0)
+        self.assertEqual(len(parse), 3)
+        self.assertEqual([parse.run(s) for s in [" 1", "x", "3 "]],
+                         [Result.success(1), Result.success(0), Result.success(3)])
+        self.assertEqual(parse(Result.failure(ValueError())), Result.success(0))
+
+    def test_immutable(self):
+        """Test that extending a pipeline leaves the original untouched"""
+        base = Pipeline().map(lambda x: x + 1)
+        extended = base.map(lambda x: x * 10)
+        self.assertEqual(base.run(1), Result.success(2))
+        self.assertEqual(extended.run(1), Result.success(20))
+
+    def test_recover_catching(self):
+        """Test recover_catching steps"""
+        pipeline = Pipeline().recover_catching(lambda e: 1 / 0).recover_catching(lambda e: type(e).__name__)
+        self.assertEqual(pipeline.run(ValueError()), Result.success("ZeroDivisionError"))
+        self.assertEqual(pipeline.run(5), Result.success(5))
+
+    def test_exception_value_becomes_failure(self):
+        """Test that a step returning an exception yields a failure, as with Result.map"""
+        error = ValueError("error")
+        self.assertEqual(Pipeline().map(lambda x: error).run(1), Result.success(1).map(lambda x: error))
+        self.assertTrue(Pipeline().map(lambda x: error).map(lambda x: 1).run(1).is_failure)
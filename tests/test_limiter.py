@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from kotresult import Bulkhead, RateLimiter, RejectedError, Result
+
+
+class TestBulkhead(unittest.TestCase):
+    def test_rejects_at_capacity(self):
+        """Test that calls beyond max_concurrent are rejected at once without being called"""
+        bulkhead = Bulkhead(max_concurrent=1, name="payments")
+        release = threading.Event()
+        running = threading.Thread(target=bulkhead.run_catching, args=(release.wait,))
+        running.start()
+        time.sleep(0.05)
+        self.assertEqual(bulkhead.active, 1)
+        self.assertEqual(bulkhead.utilization, 1.0)
+
+        calls = []
+        rejected = bulkhead.run_catching(calls.append, 1)
+        self.assertIsInstance(rejected.exception_or_null(), RejectedError)
+        self.assertEqual(str(rejected.exception_or_null()), "'payments' is at capacity")
+        # Each rejection gets its own exception, so raising one never affects another
+        second = bulkhead.run_catching(calls.append, 2)
+        self.assertEqual(second, rejected)
+        self.assertIsNot(second.exception_or_null(), rejected.exception_or_null())
+        self.assertEqual(calls, [])
+        self.assertEqual(bulkhead.rejected, 2)
+
+        release.set()
+        running.join()
+        self.assertEqual(bulkhead.active, 0)
+        self.assertEqual(bulkhead.run_catching(lambda: 1), Result.success(1))
+
+    def test_queue_timeout(self):
+        """Test that a queued call runs once a slot is freed, and is rejected after queue_timeout"""
+        bulkhead = Bulkhead(max_concurrent=1, queue_timeout=1.0)
+        results = []
+        first = threading.Thread(target=lambda: results.append(bulkhead.run_catching(time.sleep, 0.1)))
+        first.start()
+        time.sleep(0.02)
+        self.assertEqual(bulkhead.run_catching(lambda: 2), Result.success(2))
+        first.join()
+        self.assertEqual(results, [Result.success(None)])
+
+        bulkhead = Bulkhead(max_concurrent=1, queue_timeout=0.05)
+        release = threading.Event()
+        running = threading.Thread(target=bulkhead.run_catching, args=(release.wait,))
+        running.start()
+        time.sleep(0.02)
+        self.assertIsInstance(bulkhead.run_catching(lambda: 2).exception_or_null(), RejectedError)
+        self.assertEqual(bulkhead.waiting, 0)
+        release.set()
+        running.join()
+
+    def test_max_waiting(self):
+        """Test that max_waiting bounds the number of queued calls"""
+        bulkhead = Bulkhead(max_concurrent=1, queue_timeout=None, max_waiting=1)
+        release = threading.Event()
+        threads = [threading.Thread(target=bulkhead.run_catching, args=(release.wait,)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        self.assertEqual((bulkhead.active, bulkhead.waiting), (1, 1))
+        self.assertIsInstance(bulkhead.run_catching(lambda: 3).exception_or_null(), RejectedError)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((bulkhead.active, bulkhead.waiting), (0, 0))
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent calls ever run at once"""
+        bulkhead = Bulkhead(max_concurrent=3, queue_timeout=None)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+
+        threads = [threading.Thread(target=bulkhead.run_catching, args=(work,)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(peak[0], 3)
+        self.assertEqual(bulkhead.active, 0)
+
+    def test_async(self):
+        """Test run_catching_async, the queue timeout and a cancelled waiter"""
+        async def main():
+            bulkhead = Bulkhead(max_concurrent=1, queue_timeout=0.05)
+            release = asyncio.Event()
+            running = asyncio.ensure_future(bulkhead.run_catching_async(release.wait))
+            await asyncio.sleep(0)
+            rejected = await bulkhead.run_catching_async(asyncio.sleep, 0)
+            self.assertIsInstance(rejected.exception_or_null(), RejectedError)
+
+            waiter = asyncio.ensure_future(bulkhead.run_catching_async(asyncio.sleep, 0))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(bulkhead.waiting, 0)
+            self.assertEqual(bulkhead.rejected, 1)
+
+            queued = asyncio.ensure_future(bulkhead.run_catching_async(lambda: 4))
+            await asyncio.sleep(0.01)
+            release.set()
+            self.assertTrue((await running).is_success)
+            self.assertEqual(await queued, Result.success(4))
+            self.assertEqual(bulkhead.active, 0)
+
+        asyncio.run(main())
+
+    def test_decorator(self):
+        """Test the decorator form for plain and coroutine functions"""
+        bulkhead = Bulkhead(max_concurrent=2)
+
+        @bulkhead
+        def divide(a, b):
+            return a / b
+
+        @bulkhead
+        async def double(x):
+            return x * 2
+
+        self.assertEqual(divide(4, 2), Result.success(2.0))
+        self.assertIsInstance(divide(1, 0).exception_or_null(), ZeroDivisionError)
+        self.assertEqual(asyncio.run(double(3)), Result.success(6))
+        self.assertEqual(divide.__name__, 'divide')
+
+    def test_arguments(self):
+        """Test that invalid arguments raise ValueError"""
+        with self.assertRaises(ValueError):
+            Bulkhead(max_concurrent=0)
+        with self.assertRaises(ValueError):
+            Bulkhead(max_concurrent=1, queue_timeout=-1)
+        with self.assertRaises(ValueError):
+            Bulkhead(max_concurrent=1, max_waiting=-1)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_reject(self):
+        """Test that calls beyond the burst are rejected until tokens are refilled"""
+        limiter = RateLimiter(rate=20, burst=2, name="geocoder")
+        self.assertEqual(limiter.run_catching(lambda: 1), Result.success(1))
+        self.assertEqual(limiter.run_catching(lambda: 2), Result.success(2))
+        self.assertGreater(limiter.utilization, 0.9)
+        rejected = limiter.run_catching(lambda: 3)
+        self.assertIsInstance(rejected.exception_or_null(), RejectedError)
+        self.assertEqual(limiter.rejected, 1)
+        time.sleep(0.06)
+        self.assertEqual(limiter.run_catching(lambda: 4), Result.success(4))
+
+    def test_queue_timeout(self):
+        """Test that a call waits for its token when it is due within queue_timeout"""
+        limiter = RateLimiter(rate=20, burst=1, queue_timeout=0.2)
+        limiter.run_catching(lambda: None)
+        start = time.monotonic()
+        self.assertEqual(limiter.run_catching(lambda: 1), Result.success(1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertEqual(limiter.waiting, 0)
+
+        limiter = RateLimiter(rate=1, burst=1, queue_timeout=0.2)
+        limiter.run_catching(lambda: None)
+        self.assertIsInstance(limiter.run_catching(lambda: 1).exception_or_null(), RejectedError)
+
+    def test_rate(self):
+        """Test that concurrent callers do not exceed the rate"""
+        limiter = RateLimiter(rate=100, burst=1, queue_timeout=None)
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.run_catching, args=(lambda: None,)) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_async(self):
+        """Test run_catching_async and that a cancelled call gives its token back"""
+        async def main():
+            limiter = RateLimiter(rate=10, burst=1, queue_timeout=1.0)
+            self.assertEqual(await limiter.run_catching_async(asyncio.sleep, 0, 5), Result.success(5))
+            waiter = asyncio.ensure_future(limiter.run_catching_async(lambda: 6))
+            await asyncio.sleep(0.01)
+            self.assertEqual(limiter.waiting, 1)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(limiter.waiting, 0)
+            start = time.monotonic()
+            self.assertEqual(await limiter.run_catching_async(lambda: 7), Result.success(7))
+            self.assertLess(time.monotonic() - start, 0.15)
+
+        asyncio.run(main())
+
+    def test_arguments(self):
+        """Test the default burst and that invalid arguments raise ValueError"""
+        self.assertEqual(RateLimiter(rate=50).burst, 50)
+        self.assertEqual(RateLimiter(rate=0.5).burst, 1)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=1, burst=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=1, queue_timeout=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
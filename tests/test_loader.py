@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import unittest
+
+from kotresult import AsyncBatchLoader, BatchLoader, Result
+
+
+class RecordingBatch:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def __call__(self, keys):
+        self.calls.append(list(keys))
+        if self.fail:
+            raise ConnectionError("database down")
+        return {key: key * 10 for key in keys if key != 0}
+
+
+class BrokenLookup(dict):
+    """A mapping whose lookup of key 2 raises something other than KeyError"""
+
+    def __getitem__(self, key):
+        if key == 2:
+            raise RuntimeError("lookup failed")
+        return super().__getitem__(key)
+
+
+class TestBatchLoader(unittest.TestCase):
+    def load_concurrently(self, loader, keys):
+        results = {}
+        barrier = threading.Barrier(len(keys))
+
+        def load(key):
+            barrier.wait()
+            results[key] = loader.load(key)
+
+        threads = [threading.Thread(target=load, args=(key,)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_batches_concurrent_loads(self):
+        """Test that concurrent loads are served by one batch call"""
+        batch_fn = RecordingBatch()
+        loader = BatchLoader(batch_fn, max_wait_ms=100)
+        results = self.load_concurrently(loader, [1, 2, 3])
+        self.assertEqual(len(batch_fn.calls), 1)
+        self.assertEqual(sorted(batch_fn.calls[0]), [1, 2, 3])
+        self.assertEqual(results[2], Result.success(20))
+
+    def test_max_batch(self):
+        """Test that a batch is dispatched once max_batch keys were collected"""
+        batch_fn = RecordingBatch()
+        loader = BatchLoader(batch_fn, max_batch=2, max_wait_ms=10_000)
+        results = self.load_concurrently(loader, [1, 2])
+        self.assertEqual(results[1], Result.success(10))
+        self.assertEqual(loader.batch_count, 1)
+
+    def test_missing_key_and_batch_failure(self):
+        """Test the KeyError failure of a missing key and the shared failure of a failed batch"""
+        loader = BatchLoader(RecordingBatch(), max_wait_ms=0)
+        self.assertIsInstance(loader.load(0).exception_or_null(), KeyError)
+
+        loader = BatchLoader(RecordingBatch(fail=True), max_wait_ms=0)
+        results = loader.load_many([1, 2])
+        self.assertIsInstance(results[0].exception_or_null(), ConnectionError)
+        self.assertIs(results[0], results[1])
+
+    def test_failing_lookup(self):
+        """Test that an error raised by a mapping lookup is that key's failure for every waiting thread"""
+        loader = BatchLoader(lambda keys: BrokenLookup((key, key * 10) for key in keys), max_batch=3, max_wait_ms=100)
+        results = self.load_concurrently(loader, [1, 2, 3])
+        self.assertEqual(loader.batch_count, 1)
+        self.assertEqual(results[1], Result.success(10))
+        self.assertIsInstance(results[2].exception_or_null(), RuntimeError)
+        self.assertEqual(results[3], Result.success(30))
+
+    def test_sequence_results(self):
+        """Test a batch function returning values in key order, exceptions included"""
+        loader = BatchLoader(lambda keys: [ValueError(key) if key < 0 else key for key in keys], max_wait_ms=0)
+        results = loader.load_many([1, -1])
+        self.assertEqual(results[0], Result.success(1))
+        self.assertIsInstance(results[1].exception_or_null(), ValueError)
+
+        loader = BatchLoader(lambda keys: [], max_wait_ms=0)
+        self.assertIsInstance(loader.load(1).exception_or_null(), ValueError)
+
+    def test_load_many_splits_and_deduplicates(self):
+        """Test that load_many deduplicates keys and respects max_batch"""
+        batch_fn = RecordingBatch()
+        loader = BatchLoader(batch_fn, max_batch=2)
+        results = loader.load_many([1, 2, 1, 3])
+        self.assertEqual(batch_fn.calls, [[1, 2], [3]])
+        self.assertEqual([r.get_or_throw() for r in results], [10, 20, 10, 30])
+
+    def test_cache(self):
+        """Test the per-loader cache, prime and clear"""
+        batch_fn = RecordingBatch()
+        loader = BatchLoader(batch_fn, max_wait_ms=0, cache=True)
+        loader.load(1)
+        loader.load(1)
+        loader.load_many([1, 2])
+        self.assertEqual(batch_fn.calls, [[1], [2]])
+        loader.prime(5, "primed")
+        self.assertEqual(loader.load(5), Result.success("primed"))
+        loader.clear(1)
+        loader.load(1)
+        self.assertEqual(batch_fn.calls[-1], [1])
+        loader.clear()
+        loader.load(2)
+        self.assertEqual(batch_fn.calls[-1], [2])
+
+    def test_invalid_arguments(self):
+        """Test the argument checks"""
+        with self.assertRaises(ValueError):
+            BatchLoader(RecordingBatch(), max_batch=0)
+        with self.assertRaises(ValueError):
+            AsyncBatchLoader(RecordingBatch(), max_wait_ms=-1)
+
+
+class TestAsyncBatchLoader(unittest.TestCase):
+    def test_batches_concurrent_loads(self):
+        """Test that keys requested in the same tick are loaded together"""
+        calls = []
+
+        async def batch_fn(keys):
+            calls.append(list(keys))
+            await asyncio.sleep(0)
+            return {key: str(key) for key in keys if key != 0}
+
+        async def main():
+            loader = AsyncBatchLoader(batch_fn, max_batch=3, max_wait_ms=0)
+            return await asyncio.gather(*(loader.load(key) for key in [1, 2, 1, 0, 4]))
+
+        results = asyncio.run(main())
+        self.assertEqual(calls, [[1, 2, 0], [4]])
+        self.assertEqual(results[0], Result.success("1"))
+        self.assertIs(results[0], results[2])
+        self.assertIsInstance(results[3].exception_or_null(), KeyError)
+
+    def test_failure_and_cache(self):
+        """Test a failing batch function and the cache"""
+        calls = []
+
+        def batch_fn(keys):
+            calls.append(list(keys))
+            raise ConnectionError("down")
+
+        async def main():
+            loader = AsyncBatchLoader(batch_fn, cache=True)
+            first = await loader.load_many([1, 2])
+            second = await loader.load(1)
+            return first, second
+
+        first, second = asyncio.run(main())
+        self.assertIsInstance(first[0].exception_or_null(), ConnectionError)
+        self.assertIs(second, first[0])
+        self.assertEqual(calls, [[1, 2]])
+
+    def test_failing_lookup(self):
+        """Test that an error raised by a mapping lookup is that key's failure, not a cancellation"""
+        async def main():
+            loader = AsyncBatchLoader(lambda keys: BrokenLookup((key, key * 10) for key in keys))
+            return await asyncio.gather(*(loader.load(key) for key in [1, 2]))
+
+        results = asyncio.run(main())
+        self.assertEqual(results[0], Result.success(10))
+        self.assertIsInstance(results[1].exception_or_null(), RuntimeError)
+
+    def test_cancelled_caller(self):
+        """Test that cancelling one caller does not cancel the batch for the others"""
+        async def batch_fn(keys):
+            await asyncio.sleep(0.01)
+            return {key: key for key in keys}
+
+        async def main():
+            loader = AsyncBatchLoader(batch_fn, max_wait_ms=0)
+            cancelled = asyncio.ensure_future(loader.load(1))
+            other = asyncio.ensure_future(loader.load(1))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await other
+
+        self.assertEqual(asyncio.run(main()), Result.success(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import builtins
+import io
+import os
+import tempfile
+import unittest
+
+from kotresult import (
+    FailureInfo,
+    MetricsAggregator,
+    Result,
+    add_observer,
+    clear_observers,
+    remove_observer,
+    run_catching,
+    run_catching_async,
+    run_catching_with,
+)
+
+
+def parse(s):
+    return int(s)
+
+
+class TestObservers(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.observer = lambda name, result, duration: self.events.append((name, result, duration))
+        add_observer(self.observer)
+        self.addCleanup(clear_observers)
+
+    def test_run_catching_notifies(self):
+        """Test that run_catching and run_catching_with notify observers"""
+        success = run_catching(parse, "1")
+        failure = run_catching_with("x", parse)
+        self.assertEqual([(name, result) for name, result, _ in self.events], [
+            (f"{__name__}.parse", success),
+            (f"{__name__}.parse", failure),
+        ])
+        self.assertIsInstance(failure.exception_or_null(), ValueError)
+        self.assertTrue(all(duration >= 0 for _, _, duration in self.events))
+
+    def test_catching_methods_notify(self):
+        """Test that map_catching and recover_catching notify observers when they run a transform"""
+        Result.success("1").map_catching(parse)
+        Result.failure(ValueError()).recover_catching(parse)
+        Result.failure(ValueError()).map_catching(parse)  # transform not called
+        Result.success(1).recover_catching(parse)  # transform not called
+        self.assertEqual(len(self.events), 2)
+
+    def test_remove_observer(self):
+        """Test that removed observers are no longer notified"""
+        remove_observer(self.observer)
+        run_catching(parse, "1")
+        self.assertEqual(self.events, [])
+        with self.assertRaises(ValueError):
+            remove_observer(self.observer)
+
+    def test_failing_observer(self):
+        """Test that an observer raising does not break the call"""
+        add_observer(lambda name, result, duration: 1 / 0)
+        with self.assertWarns(RuntimeWarning):
+            result = run_catching(parse, "1")
+        self.assertEqual(result, Result.success(1))
+        self.assertEqual(len(self.events), 1)
+
+
+class TestObserversAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_run_catching_async_notifies(self):
+        """Test that run_catching_async notifies observers"""
+        events = []
+        add_observer(lambda name, result, duration: events.append(name))
+        self.addCleanup(clear_observers)
+        await run_catching_async(parse, "1")
+        self.assertEqual(events, [f"{__name__}.parse"])
+
+
+class TestMetricsAggregator(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsAggregator(buckets=(0.01, 0.1))
+        add_observer(self.metrics)
+        self.addCleanup(clear_observers)
+
+    def test_aggregation(self):
+        """Test outcome counts, failures by type and histogram buckets"""
+        run_catching(parse, "1")
+        run_catching(parse, "x")
+        run_catching(parse, None)
+        self.metrics("slow", Result.success(1), 0.05)
+        self.metrics("slow", Result.success(1), 5.0)
+
+        snapshot = self.metrics.snapshot()
+        stats = snapshot[f"{__name__}.parse"]
+        self.assertEqual(stats["successes"], 1)
+        self.assertEqual(stats["failures"], 2)
+        self.assertEqual(stats["failures_by_type"], {"builtins.ValueError": 1, "builtins.TypeError": 1})
+        self.assertEqual(stats["bucket_counts"], [3, 0, 0])
+        self.assertEqual(snapshot["slow"]["bucket_counts"], [0, 1, 1])
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {})
+
+    def test_failure_types(self):
+        """Test that failures are keyed by module and name, and FailureInfo by the type it stands for"""
+        class ValueError(Exception):
+            pass
+
+        self.metrics("f", Result.failure(ValueError()), 0.001)
+        self.metrics("f", Result.failure(builtins.ValueError()), 0.001)
+        self.metrics("f", Result.failure(FailureInfo.from_exception(KeyError())), 0.001)
+        self.assertEqual(self.metrics.snapshot()["f"]["failures_by_type"], {
+            f"{__name__}.TestMetricsAggregator.test_failure_types.<locals>.ValueError": 1,
+            "builtins.ValueError": 1,
+            "builtins.KeyError": 1,
+        })
+
+    def test_prometheus(self):
+        """Test the Prometheus text output"""
+        self.metrics('say "hi"', Result.success(1), 0.05)
+        self.metrics('say "hi"', Result.failure(KeyError()), 0.005)
+        text = self.metrics.to_prometheus()
+        self.assertIn('kotresult_calls_total{function="say \\"hi\\"",outcome="success"} 1', text)
+        self.assertIn('kotresult_failures_total{function="say \\"hi\\"",exception="builtins.KeyError"} 1', text)
+        self.assertIn('kotresult_call_duration_seconds_bucket{function="say \\"hi\\"",le="0.01"} 1', text)
+        self.assertIn('kotresult_call_duration_seconds_bucket{function="say \\"hi\\"",le="0.1"} 2', text)
+        self.assertIn('kotresult_call_duration_seconds_bucket{function="say \\"hi\\"",le="+Inf"} 2', text)
+        self.assertIn('kotresult_call_duration_seconds_count{function="say \\"hi\\""} 2', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_write_prometheus(self):
+        """Test writing the Prometheus text to a file object and a path"""
+        self.metrics("f", Result.success(1), 0.001)
+        buffer = io.StringIO()
+        self.metrics.write_prometheus(buffer, prefix="app")
+        self.assertIn('app_calls_total{function="f",outcome="success"} 1', buffer.getvalue())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.prom")
+            self.metrics.write_prometheus(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), self.metrics.to_prometheus())
+            self.assertEqual(os.listdir(directory), ["metrics.prom"])
+
+    def test_invalid_buckets(self):
+        """Test that unsorted buckets are rejected"""
+        with self.assertRaises(ValueError):
+            MetricsAggregator(buckets=(1.0, 0.1))
@@ -0,0 +1,98 @@
+import _thread
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from kotresult import FailureInfo, WorkerError, capture_options, run_catching_map
+
+
+class UnpicklableError(Exception):
+    def __init__(self, code, detail):
+        super().__init__(f"{code}: {detail}")
+
+
+def inverse(x):
+    return 1 / x
+
+
+def slow_identity(x):
+    time.sleep(0.3)
+    return x
+
+
+def raise_unpicklable(x):
+    raise UnpicklableError(x, "bad")
+
+
+class TestRunCatchingMap(unittest.TestCase):
+    def test_default_executor(self):
+        """Test run_catching_map without an explicit executor"""
+        results = run_catching_map(inverse, [1, 0, 2])
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].get_or_null(), 1.0)
+        self.assertIsInstance(results[1].exception_or_null(), ZeroDivisionError)
+        self.assertEqual(results[2].get_or_null(), 0.5)
+
+    def test_thread_pool_chunks(self):
+        """Test that chunking keeps results in input order"""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = run_catching_map(inverse, range(-5, 6), executor=pool, chunksize=3)
+        self.assertEqual(len(results), 11)
+        self.assertTrue(results[5].is_failure)
+        self.assertEqual([r.get_or_null() for r in results[:5]], [1 / x for x in range(-5, 0)])
+
+    def test_completion_order(self):
+        """Test returning results in completion order"""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = run_catching_map(inverse, [1, 2, 4], executor=pool, ordered=False)
+        self.assertEqual(sorted(r.get_or_null() for r in results), [0.25, 0.5, 1.0])
+
+    def test_process_pool(self):
+        """Test run_catching_map with a process pool and unpicklable exceptions"""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = run_catching_map(inverse, [1, 0], executor=pool)
+            self.assertEqual(results[0].get_or_null(), 1.0)
+            self.assertIsInstance(results[1].exception_or_null(), ZeroDivisionError)
+
+            results = run_catching_map(raise_unpicklable, [7], executor=pool)
+            error = results[0].exception_or_null()
+            self.assertIsInstance(error, WorkerError)
+            self.assertTrue(error.type_name.endswith("UnpicklableError"))
+            self.assertEqual(error.message, "7: bad")
+            self.assertIn("raise_unpicklable", error.traceback)
+
+    def test_chunk_level_failure(self):
+        """Test that a chunk that cannot be sent to a worker fails every item in it"""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results = run_catching_map(lambda x: x, [1, 2, 3], executor=pool, chunksize=2)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r.is_failure for r in results))
+
+    def test_chunk_level_failure_captured(self):
+        """Test that the capture options apply to chunk-level failures"""
+        with ProcessPoolExecutor(max_workers=1) as pool, capture_options(failure_info=True):
+            results = run_catching_map(lambda x: x, [1, 2], executor=pool, chunksize=2)
+        self.assertIsInstance(results[0].exception_or_null(), FailureInfo)
+        self.assertIs(results[0].exception_or_null(), results[1].exception_or_null())
+
+    def test_interrupt_while_waiting(self):
+        """Test that a KeyboardInterrupt in the waiting thread propagates instead of failing a chunk"""
+        interrupt = threading.Timer(0.1, _thread.interrupt_main)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            interrupt.start()
+            with self.assertRaises(KeyboardInterrupt):
+                run_catching_map(slow_identity, [1, 2], executor=pool)
+        interrupt.join()
+
+    def test_worker_error_pickles(self):
+        """Test that WorkerError survives a pickle round trip"""
+        error = pickle.loads(pickle.dumps(WorkerError("mod.Type", "message", "tb")))
+        self.assertEqual((error.type_name, error.message, error.traceback), ("mod.Type", "message", "tb"))
+        self.assertEqual(str(error), "mod.Type: message")
+
+    def test_invalid_chunksize(self):
+        """Test that a chunksize below 1 is rejected"""
+        with self.assertRaises(ValueError):
+            run_catching_map(inverse, [1], chunksize=0)
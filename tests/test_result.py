@@ -1,6 +1,7 @@
+import pickle
 import unittest
 
-from kotresult import Result
+from kotresult import COMPILED, Result, get_failure_equality, set_failure_equality
 
 
 class TestResult(unittest.TestCase):
@@ -365,3 +366,82 @@ class TestResult(unittest.TestCase):
         result_dict = {Result.success(1): "one", Result.failure(ValueError("e")): "error"}
         self.assertEqual(result_dict[Result.success(1)], "one")
         self.assertEqual(result_dict[Result.failure(ValueError("e"))], "error")
+
+    def test_slots(self):
+        """Test that Result instances are slotted and tag their state on construction"""
+        result = Result.success(42)
+        self.assertFalse(hasattr(result, "__dict__"))
+        if not COMPILED:
+            # mypyc gives generic native classes an instance dict, created on first use
+            with self.assertRaises(AttributeError):
+                result.extra = 1
+
+        # The constructor still infers the state from the value
+        self.assertTrue(Result(ValueError("error")).is_failure)
+        self.assertTrue(Result("value").is_success)
+
+    def test_pickle(self):
+        """Test that successes and failures survive a pickle round trip"""
+        for result in (Result.success([1, 2]), Result.failure(ValueError("error"))):
+            restored = pickle.loads(pickle.dumps(result))
+            self.assertEqual(restored, result)
+            self.assertEqual(restored.is_failure, result.is_failure)
+
+    def test_failure_equality_policies(self):
+        """Test the identity, args and message failure equality policies"""
+        self.addCleanup(set_failure_equality, get_failure_equality())
+        self.assertEqual(get_failure_equality(), "args")
+
+        error = ValueError("a", "b")
+        same_args = ValueError("a", "b")
+        same_message = ValueError("('a', 'b')")
+
+        # args: same type and args
+        self.assertEqual(Result.failure(error), Result.failure(same_args))
+        self.assertNotEqual(Result.failure(error), Result.failure(same_message))
+        self.assertEqual(hash(Result.failure(error)), hash(Result.failure(same_args)))
+
+        set_failure_equality("message")
+        self.assertEqual(Result.failure(error), Result.failure(same_message))
+        self.assertEqual(hash(Result.failure(error)), hash(Result.failure(same_message)))
+
+        set_failure_equality("identity")
+        failure = Result.failure(error)
+        self.assertEqual(failure, Result.failure(error))
+        self.assertNotEqual(failure, Result.failure(same_args))
+        self.assertEqual(len({failure, Result.failure(error), Result.failure(same_args)}), 2)
+
+        with self.assertRaises(ValueError):
+            set_failure_equality("type")
+
+    def test_failure_equality_same_type_name(self):
+        """Test that distinct exception types sharing a name are not equal"""
+        first = type("CustomError", (Exception,), {})
+        second = type("CustomError", (Exception,), {})
+        self.assertNotEqual(Result.failure(first("error")), Result.failure(second("error")))
+        self.assertNotEqual(hash(Result.failure(first("error"))), hash(Result.failure(second("error"))))
+
+    def test_failure_hash_cached(self):
+        """Test that a failure hash is computed once and unhashable args are supported"""
+        class CountingError(Exception):
+            calls = 0
+
+            def __str__(self):
+                CountingError.calls += 1
+                return "counting"
+
+        failure = Result.failure(CountingError("x"))
+        self.assertEqual(hash(failure), hash(failure))
+        self.assertEqual(CountingError.calls, 0)
+
+        self.addCleanup(set_failure_equality, get_failure_equality())
+        set_failure_equality('message')
+        failure = Result.failure(CountingError("x"))
+        self.assertEqual(hash(failure), hash(failure))
+        self.assertEqual(CountingError.calls, 1)
+        set_failure_equality('args')
+
+        unhashable = Result.failure(ValueError(["a", "b"]))
+        self.assertEqual(hash(unhashable), hash(Result.failure(ValueError(["a", "b"]))))
+        self.assertEqual(unhashable, Result.failure(ValueError(["a", "b"])))
+        self.assertNotEqual(unhashable, Result.failure(ValueError(["a"])))
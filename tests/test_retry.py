@@ -0,0 +1,94 @@
+import unittest
+
+from kotresult import Result, RetryOutcome, run_catching_retry, run_catching_retry_async
+
+
+class Flaky:
+    """Callable that raises the given exceptions in turn, then returns "ok" """
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestRunCatchingRetry(unittest.TestCase):
+    def test_success_after_retries(self):
+        """Test that failures are retried until the call succeeds"""
+        func = Flaky(ConnectionError(), ConnectionError())
+        outcome = run_catching_retry(func, attempts=5, backoff=0.001)
+        self.assertIsInstance(outcome, RetryOutcome)
+        self.assertEqual(outcome.result, Result.success("ok"))
+        self.assertEqual(outcome.attempts, 3)
+        self.assertEqual(len(outcome.delays), 2)
+        self.assertGreaterEqual(outcome.elapsed, sum(outcome.delays))
+
+    def test_attempts_exhausted(self):
+        """Test that the last failure is returned once attempts run out"""
+        func = Flaky(*[ConnectionError(str(i)) for i in range(5)])
+        outcome = run_catching_retry(func, attempts=3, backoff=0.001)
+        self.assertEqual(outcome.attempts, 3)
+        self.assertEqual(str(outcome.result.exception_or_null()), "2")
+
+    def test_retry_on(self):
+        """Test that only the listed exception types are retried"""
+        func = Flaky(ValueError("bad input"))
+        outcome = run_catching_retry(func, attempts=3, backoff=0.001, retry_on=(ConnectionError,))
+        self.assertEqual(outcome.attempts, 1)
+        self.assertIsInstance(outcome.result.exception_or_null(), ValueError)
+
+    def test_backoff_without_jitter(self):
+        """Test plain exponential delays capped at max_backoff"""
+        func = Flaky(*[OSError() for _ in range(4)])
+        outcome = run_catching_retry(func, attempts=5, backoff=0.001, max_backoff=0.004, jitter=False)
+        self.assertEqual(outcome.delays, (0.001, 0.002, 0.004, 0.004))
+
+    def test_jitter_bounds(self):
+        """Test that jittered delays stay between the base delay and the cap"""
+        func = Flaky(*[OSError() for _ in range(6)])
+        outcome = run_catching_retry(func, attempts=7, backoff=0.001, max_backoff=0.005)
+        self.assertTrue(all(0.001 <= d <= 0.005 for d in outcome.delays))
+
+    def test_deadline(self):
+        """Test that no attempt is started past the deadline"""
+        func = Flaky(*[OSError() for _ in range(10)])
+        outcome = run_catching_retry(func, attempts=10, backoff=0.05, jitter=False, deadline=0.08)
+        self.assertEqual(outcome.attempts, 2)
+        self.assertTrue(outcome.result.is_failure)
+        self.assertLess(outcome.elapsed, 0.08)
+
+    def test_arguments(self):
+        """Test argument passing and validation"""
+        outcome = run_catching_retry(lambda a, b=0: a + b, 1, b=2)
+        self.assertEqual(outcome, RetryOutcome(Result.success(3), 1, outcome.elapsed, ()))
+        with self.assertRaises(ValueError):
+            run_catching_retry(int, attempts=0)
+        with self.assertRaises(ValueError):
+            run_catching_retry(int, backoff=-1)
+
+
+class TestRunCatchingRetryAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_coroutine_retries(self):
+        """Test retrying a coroutine function"""
+        func = Flaky(ConnectionError())
+
+        async def call():
+            return func()
+
+        outcome = await run_catching_retry_async(call, attempts=3, backoff=0.001)
+        self.assertEqual(outcome.result, Result.success("ok"))
+        self.assertEqual(outcome.attempts, 2)
+
+    async def test_retry_on_and_deadline(self):
+        """Test exception filtering and the deadline in the async version"""
+        outcome = await run_catching_retry_async(Flaky(ValueError()), retry_on=(OSError,))
+        self.assertEqual(outcome.attempts, 1)
+
+        func = Flaky(*[OSError() for _ in range(10)])
+        outcome = await run_catching_retry_async(func, attempts=10, backoff=0.05, jitter=False, deadline=0.08)
+        self.assertEqual(outcome.attempts, 2)
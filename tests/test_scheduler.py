@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from kotresult import AsyncWorkPipeline, DeadLetter, WorkPipeline
+
+
+def parse(value):
+    return int(value)
+
+
+def invert(value):
+    return 1 / value
+
+
+class TestWorkPipeline(unittest.TestCase):
+    def test_run(self):
+        """Test that values go through every stage and failures reach the dead letter sink"""
+        letters = []
+        pipeline = WorkPipeline(dead_letter=letters.append).stage(parse, workers=3).stage(invert, workers=2)
+        values = sorted(pipeline.run(["1", "x", "0", "4"]))
+        self.assertEqual(values, [0.25, 1.0])
+        self.assertEqual({(letter.stage, letter.item) for letter in letters}, {
+            (f"{__name__}.parse", "x"),
+            (f"{__name__}.invert", 0),
+        })
+        self.assertIsInstance(letters[0], DeadLetter)
+
+        parse_stats, invert_stats = pipeline.stats()
+        self.assertEqual((parse_stats.processed, parse_stats.failed, parse_stats.workers), (4, 1, 3))
+        self.assertEqual((invert_stats.processed, invert_stats.failed), (3, 1))
+        self.assertEqual(invert_stats.queue_depth, 0)
+        self.assertGreater(parse_stats.throughput, 0)
+
+    def test_failures_skip_remaining_stages(self):
+        """Test that a failed item is not passed to later stages"""
+        seen = []
+        pipeline = WorkPipeline().stage(parse).stage(seen.append)
+        list(pipeline.run(["1", "x"]))
+        self.assertEqual(seen, [1])
+        self.assertEqual(len(pipeline.dead_letters), 1)
+        self.assertIsInstance(pipeline.dead_letters[0].exception, ValueError)
+
+    def test_bounded_queues(self):
+        """Test that the source is not read ahead of a blocked stage by more than the queue sizes"""
+        release = threading.Event()
+        read = []
+
+        def source():
+            for i in range(100):
+                read.append(i)
+                yield i
+
+        def slow(value):
+            release.wait()
+            return value
+
+        pipeline = WorkPipeline(queue_size=2).stage(slow)
+        iterator = pipeline.run(source())
+        consumer = threading.Thread(target=lambda: list(iterator))
+        consumer.start()
+        time.sleep(0.2)
+        # One item held by the worker, two in the queue, one blocked in put()
+        self.assertLessEqual(len(read), 4)
+        self.assertEqual(pipeline.stats()[0].queue_depth, 2)
+        release.set()
+        consumer.join()
+        self.assertEqual(len(read), 100)
+
+    def test_close_early(self):
+        """Test that closing the iterator stops the workers"""
+        before = threading.active_count()
+        iterator = WorkPipeline(queue_size=1).stage(parse, workers=4).run(str(i) for i in range(1000))
+        self.assertIsInstance(next(iterator), int)
+        iterator.close()
+        self.assertEqual(threading.active_count(), before)
+
+    def test_source_error(self):
+        """Test that an exception from the items iterable is re-raised"""
+        def source():
+            yield "1"
+            raise OSError("read failed")
+
+        pipeline = WorkPipeline().stage(parse)
+        values = []
+        with self.assertRaises(OSError):
+            for value in pipeline.run(source()):
+                values.append(value)
+        self.assertEqual(values, [1])
+
+    def test_invalid_configuration(self):
+        """Test the argument checks"""
+        with self.assertRaises(ValueError):
+            WorkPipeline(queue_size=0)
+        with self.assertRaises(ValueError):
+            WorkPipeline().stage(parse, workers=0)
+        with self.assertRaises(ValueError):
+            list(WorkPipeline().run([1]))
+
+
+class TestAsyncWorkPipeline(unittest.TestCase):
+    def test_run(self):
+        """Test the asyncio pipeline with coroutine and plain stage functions"""
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        async def main():
+            pipeline = AsyncWorkPipeline().stage(fetch, workers=4).stage(parse, workers=2).stage(invert)
+            values = [value async for value in pipeline.run(["1", "x", "0", "2"])]
+            return pipeline, values
+
+        pipeline, values = asyncio.run(main())
+        self.assertEqual(sorted(values), [0.5, 1.0])
+        self.assertEqual(sorted(repr(letter.item) for letter in pipeline.dead_letters), ["'x'", "0"])
+        self.assertEqual([stats.processed for stats in pipeline.stats()], [4, 4, 3])
+
+    def test_async_source_and_close(self):
+        """Test an async iterable source and closing the iterator early"""
+        async def source():
+            for i in range(1000):
+                yield str(i)
+
+        async def main():
+            iterator = AsyncWorkPipeline(queue_size=1).stage(parse, workers=3).run(source())
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            return first
+
+        self.assertIsInstance(asyncio.run(main()), int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from kotresult import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_coalesces_concurrent_calls(self):
+        """Test that concurrent callers with the same key share one call"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def load(key):
+            calls.append(key)
+            started.set()
+            release.wait()
+            return key.upper()
+
+        results = []
+
+        def caller():
+            results.append(flight.run_catching("a", load, "a"))
+
+        first = threading.Thread(target=caller)
+        first.start()
+        started.wait()
+        others = [threading.Thread(target=caller) for _ in range(4)]
+        for thread in others:
+            thread.start()
+        time.sleep(0.05)  # let the other callers reach the in-flight call
+        self.assertEqual(flight.in_flight, 1)
+        release.set()
+        for thread in [first] + others:
+            thread.join()
+
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(results[0].get_or_null(), "A")
+        self.assertEqual(flight.in_flight, 0)
+
+    def test_shared_failure(self):
+        """Test that a failure is shared and the key is released afterwards"""
+        flight = SingleFlight()
+        result = flight.run_catching("k", int, "x")
+        self.assertIsInstance(result.exception_or_null(), ValueError)
+        self.assertEqual(flight.run_catching("k", int, "1").get_or_null(), 1)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_coalesces_concurrent_calls(self):
+        """Test that concurrent tasks with the same key share one call"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            if key == "bad":
+                raise KeyError(key)
+            return key.upper()
+
+        results = await asyncio.gather(*(flight.run_catching("a", load, "a") for _ in range(5)),
+                                       *(flight.run_catching("bad", load, "bad") for _ in range(3)))
+        self.assertEqual(calls, ["a", "bad"])
+        self.assertTrue(all(r is results[0] for r in results[:5]))
+        self.assertEqual(results[0].get_or_null(), "A")
+        self.assertTrue(all(r is results[5] for r in results[5:]))
+        self.assertIsInstance(results[5].exception_or_null(), KeyError)
+        self.assertEqual(flight.in_flight, 0)
+
+    async def test_cancelled_caller(self):
+        """Test that cancelling the first caller does not cancel the shared call"""
+        flight = AsyncSingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(flight.run_catching("k", load))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.run_catching("k", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual((await second).get_or_null(), "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
@@ -0,0 +1,79 @@
+import itertools
+import unittest
+
+from kotresult import Result, ResultBatch, ResultStream
+
+
+class TestResultStream(unittest.TestCase):
+    def test_run_catching(self):
+        """Test that the stream captures each call as a Result"""
+        results = list(ResultStream.run_catching(int, ["1", "x", "3"]))
+        self.assertEqual(results[0], Result.success(1))
+        self.assertIsInstance(results[1].exception_or_null(), ValueError)
+        self.assertEqual(results[2], Result.success(3))
+
+    def test_lazy_pull(self):
+        """Test that items are only pulled from the source on demand"""
+        pulled = []
+
+        def source():
+            for i in itertools.count():
+                pulled.append(i)
+                yield i
+
+        stream = ResultStream.run_catching(lambda x: x * 2, source())
+        self.assertEqual(pulled, [])
+        self.assertEqual(next(stream), Result.success(0))
+        self.assertEqual(pulled, [0])
+        self.assertEqual(list(stream.take_successes(2)), [2, 4])
+        self.assertEqual(pulled, [0, 1, 2])
+
+    def test_stages(self):
+        """Test chained map_catching and recover_catching stages"""
+        stream = (
+            ResultStream.run_catching(int, ["4", "0", "x"])
+            .map_catching(lambda x: 8 // x)
+            .recover_catching(lambda e: type(e).__name__)
+        )
+        self.assertEqual([r.get_or_null() for r in stream], [2, "ZeroDivisionError", "ValueError"])
+
+    def test_take_successes_and_failures(self):
+        """Test filtering successes and failures"""
+        items = ["1", "x", "2", "y", "3"]
+        self.assertEqual(list(ResultStream.run_catching(int, items).take_successes()), [1, 2, 3])
+        self.assertEqual(list(ResultStream.run_catching(int, items).take_successes(2)), [1, 2])
+        failures = list(ResultStream.run_catching(int, items).failures())
+        self.assertEqual(len(failures), 2)
+        self.assertTrue(all(isinstance(e, ValueError) for e in failures))
+
+    def test_fail_fast(self):
+        """Test that fail_fast stops after the first failure"""
+        pulled = []
+
+        def parse(s):
+            pulled.append(s)
+            return int(s)
+
+        results = list(ResultStream.run_catching(parse, ["1", "x", "2"]).fail_fast())
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[1].is_failure)
+        self.assertEqual(pulled, ["1", "x"])
+
+    def test_max_failures(self):
+        """Test the max_failures circuit breaker"""
+        results = list(ResultStream.run_catching(int, ["x", "1", "y", "z", "2"]).max_failures(2))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(r.is_failure for r in results), 2)
+
+        with self.assertRaises(ValueError):
+            ResultStream([]).max_failures(0)
+
+    def test_batched(self):
+        """Test grouping a stream into ResultBatch chunks"""
+        batches = list(ResultStream.run_catching(int, ["1", "x", "3", "4", "5"]).batched(2))
+        self.assertEqual([len(b) for b in batches], [2, 2, 1])
+        self.assertIsInstance(batches[0], ResultBatch)
+        self.assertEqual(batches[0].failure_count, 1)
+
+        with self.assertRaises(ValueError):
+            list(ResultStream([]).batched(0))
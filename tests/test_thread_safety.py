@@ -0,0 +1,206 @@
+import importlib
+import inspect
+import pkgutil
+import sys
+import threading
+import unittest
+from collections import deque
+
+import kotresult
+from kotresult import (
+    BatchLoader,
+    Bulkhead,
+    CircuitBreaker,
+    MetricsAggregator,
+    Result,
+    SingleFlight,
+    add_observer,
+    cached_catching,
+    capture_options,
+    get_capture_options,
+    remove_observer,
+    run_catching,
+)
+
+THREADS = 8
+
+
+def hammer(target, threads=THREADS):
+    """Run target(index) in several threads released at once, re-raising the first error"""
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if errors:
+        raise errors[0]
+
+
+def fail(value):
+    raise ValueError(value)
+
+
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        # Switch threads as often as possible, so that races show up on GIL builds too
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_no_mutable_class_state(self):
+        """Test that no kotresult class holds mutable state shared by its instances"""
+        mutable = (list, dict, set, bytearray, deque)
+        for info in pkgutil.iter_modules(kotresult.__path__):
+            try:
+                module = importlib.import_module(f'kotresult.{info.name}')
+            except ImportError:
+                # An optional dependency is missing, e.g. numpy
+                continue
+            for cls in vars(module).values():
+                if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                    continue
+                for name, value in vars(cls).items():
+                    if name in ('__dict__', '__annotations__') or (name == '_field_defaults' and issubclass(cls, tuple)):
+                        continue
+                    self.assertNotIsInstance(value, mutable, f"{cls.__qualname__}.{name}")
+
+    def test_shared_results(self):
+        """Test that Results shared between threads are hashed, compared and mapped consistently"""
+        shared = [Result.success(i) for i in range(50)] + [Result.failure(ValueError(i)) for i in range(50)]
+        expected = [(hash(result), result.map(str)) for result in shared]
+        fresh = [Result.failure(ValueError(i)) for i in range(50)]
+
+        def work(index):
+            for _ in range(20):
+                for result, (hashed, mapped) in zip(shared, expected):
+                    self.assertEqual(hash(result), hashed)
+                    self.assertEqual(result.map(str), mapped)
+                # Hashing failures nobody hashed before, from every thread at once
+                self.assertEqual(len({*fresh, *fresh}), 50)
+
+        hammer(work)
+
+    def test_results_are_not_modified(self):
+        """Test that no Result method changes a Result shared between threads"""
+        shared = [Result.success(i) for i in range(20)] + [Result.failure(ValueError(i)) for i in range(20)]
+        states = [(result._value, result._is_failure) for result in shared]
+
+        def work(index):
+            for _ in range(20):
+                for result in shared:
+                    hash(result)
+                    self.assertEqual(result, result)
+                    result.map(str)
+                    result.map_catching(fail)
+                    result.recover(str)
+                    result.recover_catching(fail)
+                    result.fold(str, str)
+                    result.get_or_default(None)
+                    result.lazy().map_catching(fail).recover(str).evaluate()
+                    result.to_dict()
+
+        hammer(work)
+        for result, (value, is_failure) in zip(shared, states):
+            self.assertIs(result._value, value)
+            self.assertIs(result._is_failure, is_failure)
+        # The cached failure hash is the only later write, with the same value in every thread
+        self.assertEqual([hash(result) for result in shared], [hash(Result(value)) for value, _ in states])
+
+    def test_run_catching_with_observers(self):
+        """Test that an observer sees every call exactly once while observers come and go"""
+        metrics = MetricsAggregator()
+        add_observer(metrics)
+        stop = threading.Event()
+
+        def churn():
+            while not stop.is_set():
+                observer = lambda name, result, duration: None  # noqa: E731
+                add_observer(observer)
+                remove_observer(observer)
+
+        churner = threading.Thread(target=churn)
+        churner.start()
+        try:
+            def work(index):
+                for i in range(500):
+                    run_catching(fail if i % 5 == 0 else int, i)
+
+            hammer(work)
+        finally:
+            stop.set()
+            churner.join()
+            remove_observer(metrics)
+        stats = metrics.snapshot()
+        self.assertEqual(sum(entry['successes'] + entry['failures'] for entry in stats.values()), THREADS * 500)
+        self.assertEqual(sum(entry['failures'] for entry in stats.values()), THREADS * 100)
+
+    def test_capture_options_per_thread(self):
+        """Test that capture_options() only applies to the thread that set it"""
+        def work(index):
+            limit = index % 3
+            for _ in range(200):
+                with capture_options(traceback_limit=limit):
+                    self.assertEqual(get_capture_options(), (limit, False))
+                self.assertEqual(get_capture_options(), (None, False))
+
+        hammer(work)
+
+    def test_stateful_helpers(self):
+        """Test that the counters of the shared helpers stay exact under contention"""
+        bulkhead = Bulkhead(max_concurrent=3, queue_timeout=None)
+        breaker = CircuitBreaker(failure_threshold=10 ** 6)
+        flight = SingleFlight()
+        calls = []
+
+        @cached_catching(maxsize=16)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        def check_slots():
+            self.assertLessEqual(bulkhead.active, 3)
+
+        def work(index):
+            for i in range(200):
+                self.assertEqual(square(i % 32), Result.success((i % 32) ** 2))
+                bulkhead.run_catching(check_slots).get_or_throw()
+                breaker.run_catching(fail, i)
+                self.assertEqual(flight.run_catching(i % 4, abs, -(i % 4)), Result.success(i % 4))
+
+        hammer(work)
+        info = square.cache_info()
+        self.assertEqual(info.hits + info.misses, THREADS * 200)
+        self.assertEqual(info.misses, len(calls))
+        self.assertEqual((bulkhead.active, bulkhead.waiting), (0, 0))
+        self.assertEqual(breaker.failure_count, THREADS * 200)
+        self.assertEqual(flight.in_flight, 0)
+
+    def test_batch_loader(self):
+        """Test that BatchLoader hands every thread its own keys while the cache is cleared"""
+        loader = BatchLoader(lambda keys: {key: key * 2 for key in keys}, max_batch=16, max_wait_ms=0.5, cache=True)
+
+        def work(index):
+            for i in range(100):
+                key = (index * 100 + i) % 64
+                self.assertEqual(loader.load(key), Result.success(key * 2))
+                self.assertEqual(loader.load_many([key, key + 1]), [Result.success(key * 2), Result.success(key * 2 + 2)])
+                if i % 10 == 0:
+                    loader.clear()
+
+        hammer(work)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from kotresult import (
+    Result,
+    deadline,
+    remaining_time,
+    run_catching_timeout,
+    run_catching_timeout_async,
+    shared_executor,
+)
+
+
+class TestRunCatchingTimeout(unittest.TestCase):
+    def test_completes_in_time(self):
+        """Test that a call finishing in time returns its Result"""
+        self.assertEqual(run_catching_timeout(int, "1", timeout=1.0), Result.success(1))
+        self.assertIsInstance(run_catching_timeout(int, "x", timeout=1.0).exception_or_null(), ValueError)
+
+    def test_times_out(self):
+        """Test that a slow call gives a TimeoutError failure"""
+        start = time.monotonic()
+        result = run_catching_timeout(time.sleep, 1.0, timeout=0.05)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertIsInstance(result.exception_or_null(), TimeoutError)
+        self.assertIn("sleep", str(result.exception_or_null()))
+
+    def test_without_timeout(self):
+        """Test that without timeout or deadline the function runs in the calling thread"""
+        self.assertIs(run_catching_timeout(threading.current_thread).get_or_throw(), threading.current_thread())
+
+    def test_custom_executor(self):
+        """Test running the call in a given executor"""
+        with ThreadPoolExecutor(1, thread_name_prefix="custom") as executor:
+            result = run_catching_timeout(lambda: threading.current_thread().name, timeout=1.0, executor=executor)
+        self.assertTrue(result.get_or_throw().startswith("custom"))
+
+    def test_shared_executor(self):
+        """Test that calls without an executor run in the process-wide shared executor"""
+        self.assertIs(shared_executor(), shared_executor())
+        result = run_catching_timeout(lambda: threading.current_thread().name, timeout=1.0)
+        self.assertTrue(result.get_or_throw().startswith("kotresult"))
+
+    def test_hung_calls_starve_their_executor(self):
+        """Test that a hung call starves the calls queued behind it, but not those of another executor"""
+        release = threading.Event()
+        calls = []
+        with ThreadPoolExecutor(1) as hung, ThreadPoolExecutor(1) as other:
+            self.assertIsInstance(run_catching_timeout(release.wait, timeout=0.02, executor=hung).exception_or_null(),
+                                  TimeoutError)
+            starved = run_catching_timeout(calls.append, 1, timeout=0.02, executor=hung)
+            self.assertIsInstance(starved.exception_or_null(), TimeoutError)
+            self.assertEqual(calls, [])
+            self.assertEqual(run_catching_timeout(calls.append, 2, timeout=1.0, executor=other), Result.success(None))
+            self.assertEqual(calls, [2])
+            release.set()
+
+    def test_negative_timeout(self):
+        """Test that a negative timeout is rejected"""
+        with self.assertRaises(ValueError):
+            run_catching_timeout(int, "1", timeout=-1)
+
+
+class TestDeadline(unittest.TestCase):
+    def test_remaining_time(self):
+        """Test the remaining budget inside and outside a deadline"""
+        self.assertIsNone(remaining_time())
+        with deadline(10):
+            self.assertLessEqual(remaining_time(), 10)
+            with deadline(60):
+                # A nested deadline never extends the budget
+                self.assertLessEqual(remaining_time(), 10)
+            with deadline(1):
+                self.assertLessEqual(remaining_time(), 1)
+        self.assertIsNone(remaining_time())
+
+    def test_budget_shared_by_nested_calls(self):
+        """Test that a timed call passes the remaining budget to the calls it makes"""
+        seen = []
+
+        def outer():
+            seen.append(remaining_time())
+            return run_catching_timeout(time.sleep, 1.0)
+
+        start = time.monotonic()
+        with deadline(0.1):
+            result = run_catching_timeout(outer, timeout=5.0)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertLessEqual(seen[0], 0.1)
+        # Either call may be the first to notice the shared deadline
+        self.assertIsInstance(result.fold(lambda inner: inner.exception_or_null(), lambda e: e), TimeoutError)
+
+    def test_spent_budget_skips_the_call(self):
+        """Test that the function is not called once the deadline has passed"""
+        calls = []
+        with deadline(0):
+            result = run_catching_timeout(calls.append, 1)
+        self.assertIsInstance(result.exception_or_null(), TimeoutError)
+        self.assertEqual(calls, [])
+
+
+class TestRunCatchingTimeoutAsync(unittest.TestCase):
+    def test_async(self):
+        """Test the asyncio version with and without a timeout hit"""
+        async def main():
+            fast = await run_catching_timeout_async(asyncio.sleep, 0, "done", timeout=1.0)
+            slow = await run_catching_timeout_async(asyncio.sleep, 1.0, timeout=0.05)
+            return fast, slow
+
+        fast, slow = asyncio.run(main())
+        self.assertEqual(fast, Result.success("done"))
+        self.assertIsInstance(slow.exception_or_null(), TimeoutError)
+
+    def test_async_deadline(self):
+        """Test that nested async calls share the deadline"""
+        seen = []
+
+        async def outer():
+            seen.append(remaining_time())
+            return await run_catching_timeout_async(asyncio.sleep, 1.0)
+
+        async def main():
+            with deadline(0.05):
+                return await run_catching_timeout_async(outer, timeout=5.0)
+
+        start = time.monotonic()
+        result = asyncio.run(main())
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertLessEqual(seen[0], 0.05)
+        # Either call may be the first to notice the shared deadline
+        self.assertIsInstance(result.fold(lambda inner: inner.exception_or_null(), lambda e: e), TimeoutError)
+
+
+if __name__ == '__main__':
+    unittest.main()